@@ -0,0 +1,196 @@
+"""Leveled, structured logging that never blocks the request path.
+
+Every ``jarvis.*`` logger hands its records to a bounded in-memory queue; a
+background ``QueueListener`` thread formats them and writes to stdout. A
+slow terminal or log collector therefore costs requests nothing, and when the
+queue is full records are dropped (and counted) instead of stalling.
+
+Environment:
+    JARVIS_LOG_LEVEL: Minimum level (default INFO; per-request traces are DEBUG)
+    JARVIS_LOG_FORMAT: "text" (default) or "json", one object per line
+    JARVIS_LOG_PAYLOADS: 1 to log request payloads (features, keys) at DEBUG
+    JARVIS_LOG_PAYLOAD_SAMPLE: Fraction of payloads logged when enabled (default 0.01)
+    JARVIS_LOG_QUEUE: Records buffered before dropping (default 10000)
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+LOG_LEVEL = os.getenv("JARVIS_LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("JARVIS_LOG_FORMAT", "text").lower()
+LOG_PAYLOADS = os.getenv("JARVIS_LOG_PAYLOADS", "0") == "1"
+LOG_PAYLOAD_SAMPLE = float(os.getenv("JARVIS_LOG_PAYLOAD_SAMPLE", "0.01"))
+LOG_QUEUE_SIZE = int(os.getenv("JARVIS_LOG_QUEUE", "10000"))
+
+ROOT_LOGGER = "jarvis"
+
+# Attributes every LogRecord has; anything else came in through ``extra=``
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _check_extra(extra: Optional[Dict[str, Any]]) -> None:
+    """
+    Reject ``extra=`` keys that would overwrite a LogRecord attribute.
+
+    ``logging`` raises the same KeyError, but only when the record is built,
+    i.e. when the level is enabled; checking on every call makes a DEBUG-only
+    mistake fail in tests instead of when someone turns on debug logging.
+    """
+    reserved = _RECORD_ATTRIBUTES.intersection(extra or ())
+    if reserved:
+        raise KeyError(f"extra keys overwrite LogRecord attributes: {sorted(reserved)}")
+
+
+def _fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+
+
+class TextFormatter(logging.Formatter):
+    """``time LEVEL logger: message key=value ...``"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        fields = _fields(record)
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record with the ``extra=`` fields at top level."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **_fields(record),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that defers formatting to the listener and drops on overflow.
+
+    The stock ``QueueHandler.prepare`` formats the record in the calling
+    thread; here only the message is interpolated and the rest (extras,
+    tracebacks) is formatted by the listener thread.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """Logger wrapper that checks ``extra=`` keys at every level (see ``_check_extra``)."""
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, None)
+
+    def process(self, msg: Any, kwargs: Dict[str, Any]) -> Any:
+        # The stock adapter replaces the caller's extra with its own
+        return msg, kwargs
+
+    def log(self, level: int, msg: Any, *args: Any, **kwargs: Any) -> None:
+        _check_extra(kwargs.get("extra"))
+        super().log(level, msg, *args, **kwargs)
+
+
+_setup_lock = threading.Lock()
+_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT) -> logging.Logger:
+    """Attach the queue handler to the ``jarvis`` logger and start its listener (once)."""
+    global _handler, _listener
+    logger = logging.getLogger(ROOT_LOGGER)
+    with _setup_lock:
+        if _listener is None:
+            output = logging.StreamHandler(sys.stdout)
+            output.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+            _handler = NonBlockingQueueHandler(log_queue)
+            _listener = QueueListener(log_queue, output, respect_handler_level=True)
+            _listener.start()
+            logger.addHandler(_handler)
+            logger.propagate = False
+            atexit.register(shutdown_logging)
+        logger.setLevel(level)
+    return logger
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _handler, _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            logging.getLogger(ROOT_LOGGER).removeHandler(_handler)
+            _listener = None
+            _handler = None
+
+
+def dropped_records() -> int:
+    """Records discarded because the queue was full."""
+    return _handler.dropped if _handler is not None else 0
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """
+    Logger for a module, e.g. ``get_logger(__name__)`` -> ``jarvis.predictions``.
+
+    Sets up the queue handler on first use, so services imported outside the
+    API (scripts, benchmarks) log the same way. ``extra=`` keys that clash
+    with LogRecord attributes (``filename``, ``name``, ``message``...) raise
+    KeyError even when the level is disabled.
+    """
+    if _listener is None:
+        setup_logging()
+    return StructuredLogger(logging.getLogger(f"{ROOT_LOGGER}.{name.rsplit('.', 1)[-1]}"))
+
+
+def log_payload(logger: StructuredLogger, message: str, **fields: Any) -> None:
+    """
+    Log a request payload at DEBUG, if payload logging is on and the sample hits.
+
+    Payloads can be large and contain user data, so they are off unless
+    JARVIS_LOG_PAYLOADS=1, and then only JARVIS_LOG_PAYLOAD_SAMPLE of them are kept.
+    Field names are checked first either way (see ``_check_extra``).
+    """
+    _check_extra(fields)
+    if not LOG_PAYLOADS or not logger.isEnabledFor(logging.DEBUG):
+        return
+    if LOG_PAYLOAD_SAMPLE < 1.0 and random.random() >= LOG_PAYLOAD_SAMPLE:
+        return
+    logger.debug(message, extra=fields)
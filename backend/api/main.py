@@ -1,10 +1,21 @@
 """FastAPI main application for Jarvis IA."""
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.exception_handlers import http_exception_handler, request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from .routers import health, predictions, voice, face
+from .logging_config import setup_logging, shutdown_logging
+from .routers import admin, health, metrics as metrics_router, predictions, voice, face
+from .services.inference_executor import ExecutorSaturated
+from .services.metrics import MetricsMiddleware, metrics, route_label
+from .services.model_service import model_service
+from .services.model_watcher import model_watcher
+
+# Queue-based logging for every jarvis.* logger (JARVIS_LOG_LEVEL, JARVIS_LOG_FORMAT)
+setup_logging()
 
 # Create FastAPI application
 app = FastAPI(
@@ -72,11 +83,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request counts and latency per route template (GET /metrics)
+app.add_middleware(MetricsMiddleware, registry=metrics, known_models=model_service.get_available_models)
+
 # Include routers
 app.include_router(health.router)
 app.include_router(predictions.router)
 app.include_router(voice.router)
 app.include_router(face.router)
+app.include_router(admin.router)
+app.include_router(metrics_router.router)
+
+
+@app.exception_handler(StarletteHTTPException)
+async def count_http_exception(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+    """Count the error by the type the routers put in ``detail`` and answer as usual."""
+    error_type = exc.detail.get("error") if isinstance(exc.detail, dict) else None
+    metrics.record_error(route_label(request.scope), error_type or f"HTTP{exc.status_code}")
+    return await http_exception_handler(request, exc)
+
+
+@app.exception_handler(RequestValidationError)
+async def count_validation_error(request: Request, exc: RequestValidationError) -> JSONResponse:
+    """Count invalid request bodies/parameters and answer with the usual 422."""
+    metrics.record_error(route_label(request.scope), "ValidationError")
+    return await request_validation_exception_handler(request, exc)
+
+
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturated) -> JSONResponse:
+    """Shed load with a 503 when an inference pool queue is full."""
+    metrics.record_error(route_label(request.scope), "ServiceBusy")
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": str(exc.retry_after)},
+        content={
+            "detail": {
+                "error": "ServiceBusy",
+                "message": f"Servidor ocupado ({exc.name}), intente de nuevo en {exc.retry_after}s",
+                "details": {
+                    "subsystem": exc.name,
+                    "queue_depth": exc.queue_depth,
+                    "max_queue": exc.max_queue
+                }
+            }
+        }
+    )
+
+
+@app.on_event("startup")
+async def start_model_watcher():
+    """Hot-reload retrained models when JARVIS_MODEL_WATCH_INTERVAL is set."""
+    if model_watcher.interval > 0:
+        model_watcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_model_watcher():
+    """Stop the model watcher thread."""
+    model_watcher.stop()
+
+
+@app.on_event("shutdown")
+async def flush_logs():
+    """Write out queued log records before the process exits."""
+    shutdown_logging()
 
 
 @app.get("/", include_in_schema=False)
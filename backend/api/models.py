@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
@@ -39,6 +40,10 @@ class PredictionResponse(BaseModel):
     prediction: Any = Field(..., description="Predicted value or class")
     task_type: str = Field(..., description="Type of ML task (regression/classification)")
     confidence: Optional[float] = Field(None, description="Confidence score (for classification)")
+    probabilities: Optional[Dict[str, float]] = Field(
+        None,
+        description="Probability of each class (classification, only when requested)"
+    )
     
     class Config:
         json_schema_extra = {
@@ -46,7 +51,153 @@ class PredictionResponse(BaseModel):
                 "dataset": "Churn de clientes Telco",
                 "prediction": 1,
                 "task_type": "classification",
-                "confidence": 0.87
+                "confidence": 0.87,
+                "probabilities": {"0": 0.13, "1": 0.87}
+            }
+        }
+
+
+MAX_BATCH_RECORDS = 10000
+
+
+class BatchPredictionRequest(BaseModel):
+    """Request model for batch predictions."""
+    
+    records: List[Dict[str, Any]] = Field(
+        ...,
+        description="List of feature dictionaries, one per record to score",
+        min_length=1,
+        max_length=MAX_BATCH_RECORDS
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "records": [
+                    {"gender": "Male", "tenure": 24, "monthly_charges": 89.5},
+                    {"gender": "Female", "tenure": 3, "monthly_charges": 70.1}
+                ]
+            }
+        }
+
+
+class BatchPredictionItem(BaseModel):
+    """Prediction result for a single record of a batch."""
+    
+    index: int = Field(..., description="Position of the record in the request")
+    prediction: Any = Field(None, description="Predicted value or class")
+    confidence: Optional[float] = Field(None, description="Confidence score (for classification)")
+    probabilities: Optional[Dict[str, float]] = Field(
+        None,
+        description="Probability of each class (classification, only when requested)"
+    )
+    error: Optional[str] = Field(None, description="Error message if this record could not be scored")
+
+
+class BatchPredictionResponse(BaseModel):
+    """Response model for batch predictions."""
+    
+    dataset: str = Field(..., description="Name of the dataset/model used")
+    task_type: str = Field(..., description="Type of ML task (regression/classification)")
+    n_records: int = Field(..., description="Number of records received")
+    n_errors: int = Field(..., description="Number of records that could not be scored")
+    results: List[BatchPredictionItem] = Field(..., description="Per-record results, in request order")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "dataset": "Churn de clientes Telco",
+                "task_type": "classification",
+                "n_records": 2,
+                "n_errors": 1,
+                "results": [
+                    {"index": 0, "prediction": "No", "confidence": 0.91, "error": None},
+                    {"index": 1, "prediction": None, "confidence": None, "error": "columns are missing: {'tenure'}"}
+                ]
+            }
+        }
+
+
+class ObservationRequest(BaseModel):
+    """New observation of a time-series target."""
+    
+    value: float = Field(..., description="Observed target value (e.g. Bitcoin close price)")
+    timestamp: Optional[datetime] = Field(
+        None,
+        description="Time of the observation; repeating the last timestamp corrects its value"
+    )
+    group: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Values of the dataset's series keys, for datasets with several series"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "value": 2875.34,
+                "timestamp": "2017-08-01"
+            }
+        }
+
+
+class HistoryFeaturesResponse(BaseModel):
+    """State of a series in the online feature store."""
+    
+    dataset: str = Field(..., description="Dataset/model key")
+    n_observations: int = Field(..., description="Observations recorded for the series")
+    last_timestamp: Optional[str] = Field(None, description="Time of the latest observation")
+    features: Dict[str, Optional[float]] = Field(
+        ...,
+        description="Lag/rolling features used for the next prediction when the client omits them"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "dataset": "bitcoin_price",
+                "n_observations": 1557,
+                "last_timestamp": "2017-08-01T00:00:00",
+                "features": {"lag_1": 2875.34, "lag_7": 2550.27, "rolling_mean_7": 2707.8}
+            }
+        }
+
+
+# Upper bound for POST /predictions/{dataset_key}/forecast?horizon=N
+MAX_FORECAST_HORIZON = 365
+
+
+class ForecastPoint(BaseModel):
+    """One step of a multi-step forecast."""
+    
+    step: int = Field(..., description="Steps after the last observation (1-based)")
+    timestamp: Optional[str] = Field(None, description="Estimated time of the step, if the series spacing is known")
+    prediction: float = Field(..., description="Forecast value")
+
+
+class ForecastResponse(BaseModel):
+    """Multi-step forecast of a time-series model."""
+    
+    dataset: str = Field(..., description="Dataset name")
+    horizon: int = Field(..., description="Number of forecast steps")
+    last_observed: Optional[str] = Field(None, description="Time of the last known observation")
+    predictions: List[ForecastPoint] = Field(..., description="Forecast per step")
+    imputed: List[str] = Field(
+        default_factory=list,
+        description="Exogenous features filled with training values (only with impute_missing=true)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "dataset": "Precio histórico de Bitcoin",
+                "horizon": 3,
+                "last_observed": "2017-07-31T00:00:00",
+                "predictions": [
+                    {"step": 1, "timestamp": "2017-08-01T00:00:00", "prediction": 2861.2},
+                    {"step": 2, "timestamp": "2017-08-02T00:00:00", "prediction": 2855.9},
+                    {"step": 3, "timestamp": "2017-08-03T00:00:00", "prediction": 2850.4}
+                ],
+                "imputed": []
             }
         }
 
@@ -164,14 +315,76 @@ class HealthResponse(BaseModel):
     
     status: str = Field(..., description="Service status")
     version: str = Field(..., description="API version")
-    models_loaded: int = Field(..., description="Number of models loaded")
+    models_loaded: int = Field(..., description="Number of models available (resident or loadable on demand)")
+    model_cache: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Model residency and hit/miss/eviction counters"
+    )
+    prediction_cache: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Prediction cache size and per-model hit ratios (null when disabled)"
+    )
+    executors: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        description="Load and rejection counters of the inference pools"
+    )
     
     class Config:
         json_schema_extra = {
             "example": {
                 "status": "healthy",
                 "version": "1.0.0",
-                "models_loaded": 9
+                "models_loaded": 9,
+                "model_cache": {
+                    "lazy": True,
+                    "resident": 3,
+                    "resident_mb": 1.42,
+                    "max_models": 3,
+                    "max_memory_mb": 0,
+                    "hits": 120,
+                    "misses": 5,
+                    "evictions": 2
+                },
+                "prediction_cache": {
+                    "size": 42,
+                    "max_entries": 1024,
+                    "ttl_seconds": 300.0,
+                    "evictions": 0,
+                    "invalidations": 1,
+                    "models": {
+                        "telco_churn": {"hits": 30, "misses": 12, "hit_ratio": 0.7143}
+                    }
+                }
+            }
+        }
+
+
+class ModelStatus(BaseModel):
+    """Loaded and on-disk versions of a model artifact."""
+    
+    dataset: str = Field(..., description="Dataset/model key")
+    path: str = Field(..., description="Artifact path")
+    resident: bool = Field(..., description="Whether the model is loaded in memory")
+    loaded_version: Optional[List[int]] = Field(None, description="(mtime_ns, size) of the loaded artifact")
+    disk_version: Optional[List[int]] = Field(None, description="(mtime_ns, size) of the artifact on disk")
+    changed: bool = Field(..., description="Whether the artifact changed since it was loaded")
+
+
+class ReloadResponse(BaseModel):
+    """Result of a hot model reload."""
+    
+    dataset: str = Field(..., description="Dataset/model key")
+    previous_version: Optional[List[int]] = Field(None, description="(mtime_ns, size) of the replaced artifact")
+    version: Optional[List[int]] = Field(None, description="(mtime_ns, size) of the new artifact")
+    duration_ms: float = Field(..., description="Load and validation time in milliseconds")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "dataset": "bitcoin_price",
+                "previous_version": [1728000000000000000, 812345],
+                "version": [1728100000000000000, 815022],
+                "duration_ms": 184.3
             }
         }
 
@@ -191,3 +404,8 @@ class ErrorResponse(BaseModel):
                 "details": {"dataset_key": "invalid_key"}
             }
         }
+
+
+# Rows parsed and scored per step of POST /predictions/{dataset_key}/score-file
+DEFAULT_SCORE_CHUNK_SIZE = 10_000
+MAX_SCORE_CHUNK_SIZE = 100_000
@@ -0,0 +1,112 @@
+"""Administrative endpoints for model rollouts."""
+
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, Header, HTTPException
+
+from ..models import ErrorResponse, ModelStatus, ReloadResponse
+from ..services.model_service import model_service
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+# When set, admin endpoints require a matching X-Admin-Token header
+ADMIN_TOKEN = os.getenv("JARVIS_ADMIN_TOKEN")
+
+
+def _check_token(token: Optional[str]) -> None:
+    if ADMIN_TOKEN and token != ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "Forbidden",
+                "message": "Invalid or missing X-Admin-Token header"
+            }
+        )
+
+
+# Reload endpoints are plain functions so FastAPI runs them in its thread pool:
+# loading a model never blocks the event loop serving other requests.
+
+@router.get(
+    "/models",
+    response_model=List[ModelStatus],
+    summary="Model Artifact Status",
+    description="Muestra qué modelos están cargados y si su artefacto cambió en disco"
+)
+def list_model_status(x_admin_token: Optional[str] = Header(None)) -> List[ModelStatus]:
+    """List residency and loaded/on-disk versions of every model."""
+    _check_token(x_admin_token)
+    return [ModelStatus(**status) for status in model_service.get_model_status()]
+
+
+@router.post(
+    "/models/reload",
+    response_model=List[ReloadResponse],
+    summary="Reload Changed Models",
+    description="Recarga todos los modelos cargados cuyo artefacto cambió en disco"
+)
+def reload_changed_models(x_admin_token: Optional[str] = Header(None)) -> List[ReloadResponse]:
+    """
+    Hot-reload every resident model whose artifact changed.
+    
+    Models that fail validation keep serving their previous version and are
+    left out of the response.
+    """
+    _check_token(x_admin_token)
+    reloaded = []
+    for dataset_key in model_service.get_changed_models():
+        try:
+            reloaded.append(ReloadResponse(**model_service.reload_model(dataset_key)))
+        except ValueError:
+            continue
+    return reloaded
+
+
+@router.post(
+    "/models/{dataset_key}/reload",
+    response_model=ReloadResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Model not found"},
+        422: {"model": ErrorResponse, "description": "New artifact failed validation"}
+    },
+    summary="Reload Model",
+    description="Carga el artefacto actual de un modelo, lo valida y lo activa sin reiniciar la API"
+)
+def reload_model(dataset_key: str, x_admin_token: Optional[str] = Header(None)) -> ReloadResponse:
+    """
+    Hot-reload one model.
+    
+    Args:
+        dataset_key: Identifier of the dataset/model (e.g., 'bitcoin_price')
+        
+    Returns:
+        Previous and new artifact versions
+        
+    Raises:
+        HTTPException: If the model is unknown or the new artifact is invalid
+    """
+    _check_token(x_admin_token)
+    if dataset_key not in model_service.get_available_models():
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ModelNotFound",
+                "message": f"Model '{dataset_key}' not found",
+                "details": {
+                    "available_models": model_service.get_available_models()
+                }
+            }
+        )
+    
+    try:
+        return ReloadResponse(**model_service.reload_model(dataset_key))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ReloadRejected",
+                "message": str(e),
+                "details": {"active_version": "previous"}
+            }
+        )
@@ -6,9 +6,12 @@ from typing import Dict, List, Optional
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from pydantic import BaseModel
 
+from ..logging_config import get_logger
 from ..services import face_recognition_service
+from ..services.inference_executor import ExecutorSaturated, face_executor
 
 router = APIRouter(prefix="/face", tags=["Face Recognition"])
+logger = get_logger(__name__)
 
 
 # Request/Response Models
@@ -87,10 +90,12 @@ async def detect_emotion_base64(request: ImageBase64Request):
         image_data = base64.b64decode(request.image)
         
         # Analyze emotions
-        result = face_recognition_service.analyze_emotions(image_data)
+        result = await face_executor.run(face_recognition_service.analyze_emotions, image_data)
         
         return result
     
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -119,23 +124,24 @@ async def detect_emotion_upload(file: UploadFile = File(...)):
         # Read file content
         image_data = await file.read()
         
-        # Log image info
-        print(f"📷 Imagen recibida:")
-        print(f"   - Tamaño: {len(image_data)} bytes")
-        print(f"   - Tipo: {file.content_type}")
-        print(f"   - Nombre: {file.filename}")
+        logger.debug(
+            "📷 Imagen recibida",
+            extra={"image_bytes": len(image_data), "content_type": file.content_type, "upload_name": file.filename}
+        )
         
         # Validate image data
         if len(image_data) == 0:
             raise ValueError("La imagen está vacía")
         
         # Analyze emotions
-        result = face_recognition_service.analyze_emotions(image_data)
+        result = await face_executor.run(face_recognition_service.analyze_emotions, image_data)
         
         return result
     
+    except ExecutorSaturated:
+        raise
     except Exception as e:
-        print(f"❌ Error en emotion/upload: {str(e)}")
+        logger.exception("❌ Error en emotion/upload")
         raise HTTPException(
             status_code=500,
             detail=f"Error analyzing emotions: {str(e)}"
@@ -171,10 +177,12 @@ async def analyze_face_attributes(file: UploadFile = File(...)):
         image_data = await file.read()
         
         # Analyze face attributes
-        result = face_recognition_service.analyze_face_attributes(image_data)
+        result = await face_executor.run(face_recognition_service.analyze_face_attributes, image_data)
         
         return result
     
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -204,10 +212,12 @@ async def analyze_face_attributes_base64(request: ImageBase64Request):
         image_data = base64.b64decode(request.image)
         
         # Analyze face attributes
-        result = face_recognition_service.analyze_face_attributes(image_data)
+        result = await face_executor.run(face_recognition_service.analyze_face_attributes, image_data)
         
         return result
     
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -237,13 +247,15 @@ async def detect_multiple_faces(file: UploadFile = File(...)):
         image_data = await file.read()
         
         # Detect multiple faces
-        result = face_recognition_service.detect_multiple_faces(image_data)
+        result = await face_executor.run(face_recognition_service.detect_multiple_faces, image_data)
         
         return {
             "num_faces": len(result),
             "faces": result
         }
     
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from ..models import HealthResponse
+from ..services.inference_executor import get_executor_stats
 from ..services.model_service import model_service
 
 router = APIRouter(prefix="/health", tags=["Health"])
@@ -19,5 +20,8 @@ async def health_check() -> HealthResponse:
     return HealthResponse(
         status="healthy",
         version="1.0.0",
-        models_loaded=model_service.get_models_count()
+        models_loaded=model_service.get_models_count(),
+        model_cache=model_service.get_cache_stats(),
+        prediction_cache=model_service.get_prediction_cache_stats(),
+        executors=get_executor_stats()
     )
@@ -0,0 +1,73 @@
+"""Prometheus-style metrics endpoint."""
+
+from typing import List
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..services.inference_executor import get_executor_stats
+from ..services.metrics import Snapshot, metrics
+from ..services.model_service import model_service
+
+router = APIRouter(tags=["Metrics"])
+
+# Text exposition format understood by Prometheus scrapers
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _snapshots() -> List[Snapshot]:
+    """Values the executors and caches keep themselves, read at scrape time."""
+    executors = get_executor_stats()
+    model_cache = model_service.get_cache_stats()
+    snapshots: List[Snapshot] = [
+        (
+            "jarvis_executor_queue_depth", "gauge",
+            "Calls waiting for a free worker in each inference pool.",
+            ("executor",), {(name,): stats["queue_depth"] for name, stats in executors.items()},
+        ),
+        (
+            "jarvis_executor_in_flight", "gauge",
+            "Calls currently running in each inference pool.",
+            ("executor",), {(name,): stats["in_flight"] for name, stats in executors.items()},
+        ),
+        (
+            "jarvis_executor_max_queue", "gauge",
+            "Calls each inference pool accepts in its queue before answering 503.",
+            ("executor",), {(name,): stats["max_queue"] for name, stats in executors.items()},
+        ),
+        (
+            "jarvis_executor_completed_total", "counter",
+            "Calls finished by each inference pool.",
+            ("executor",), {(name,): stats["completed"] for name, stats in executors.items()},
+        ),
+        (
+            "jarvis_executor_rejected_total", "counter",
+            "Calls rejected with 503 because the pool queue was full.",
+            ("executor",), {(name,): stats["rejected"] for name, stats in executors.items()},
+        ),
+        (
+            "jarvis_models_resident", "gauge",
+            "Models currently loaded in memory.",
+            (), {(): model_cache["resident"]},
+        ),
+    ]
+    prediction_cache = model_service.get_prediction_cache_stats()
+    if prediction_cache is not None:
+        for result in ("hits", "misses"):
+            snapshots.append((
+                f"jarvis_prediction_cache_{result}_total", "counter",
+                f"Prediction cache {result} per model.",
+                ("model",), {(key,): stats[result] for key, stats in prediction_cache["models"].items()},
+            ))
+    return snapshots
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus Metrics",
+    description="Métricas de latencia por ruta, modelo y etapa de inferencia, contadores de errores y colas"
+)
+async def get_metrics() -> PlainTextResponse:
+    """Render every metric in the Prometheus text exposition format."""
+    return PlainTextResponse(metrics.render(_snapshots()), media_type=CONTENT_TYPE)
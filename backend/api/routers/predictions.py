@@ -1,19 +1,39 @@
 """Prediction endpoints for ML models."""
 
-from typing import List
+import asyncio
+import json
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+import pandas as pd
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 
+from ..logging_config import get_logger, log_payload
 from ..models import (
+    BatchPredictionItem,
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    DEFAULT_SCORE_CHUNK_SIZE,
+    ForecastPoint,
+    ForecastResponse,
+    MAX_FORECAST_HORIZON,
+    MAX_SCORE_CHUNK_SIZE,
+    HistoryFeaturesResponse,
+    ObservationRequest,
     PredictionRequest,
     PredictionResponse,
     DatasetInfo as DatasetInfoModel,
     ErrorResponse
 )
-from ..services.model_service import model_service
+from ..services.feature_store import feature_store
+from ..services.inference_executor import ExecutorSaturated, model_executor
+from ..services.metrics import metrics
+from ..services.model_service import MissingFeaturesError, model_service
 from ..services.voice_command_service import voice_service
 
 router = APIRouter(prefix="/predictions", tags=["Predictions"])
+logger = get_logger(__name__)
 
 
 @router.get(
@@ -48,14 +68,16 @@ async def list_datasets() -> List[DatasetInfoModel]:
     response_model=PredictionResponse,
     responses={
         404: {"model": ErrorResponse, "description": "Model not found"},
-        400: {"model": ErrorResponse, "description": "Invalid input features"}
+        400: {"model": ErrorResponse, "description": "Invalid input features"},
+        503: {"model": ErrorResponse, "description": "Inference queue full"}
     },
     summary="Make Prediction",
     description="Realiza una predicción usando el modelo especificado"
 )
 async def make_prediction(
     dataset_key: str,
-    request: PredictionRequest
+    request: PredictionRequest,
+    include_probabilities: bool = False
 ) -> PredictionResponse:
     """
     Make a prediction using the specified model.
@@ -63,6 +85,7 @@ async def make_prediction(
     Args:
         dataset_key: Identifier of the dataset/model (e.g., 'telco_churn', 'bitcoin_price')
         request: Features for prediction
+        include_probabilities: Return the full class-probability vector (classification only)
         
     Returns:
         Prediction result with confidence score
@@ -71,11 +94,8 @@ async def make_prediction(
         HTTPException: If model not found or prediction fails
     """
     try:
-        # Log incoming request for debugging
-        print(f"\n🔍 Predicción para: {dataset_key}")
-        print(f"📥 Features recibidas: {request.features}")
-        print(f"📊 Tipo de features: {type(request.features)}")
-        print(f"📊 Keys: {list(request.features.keys())}")
+        # Incoming payloads are only logged when JARVIS_LOG_PAYLOADS=1 (sampled)
+        log_payload(logger, "🔍 Predicción solicitada", dataset=dataset_key, features=request.features)
         
         # Get dataset info
         dataset_info = model_service.get_model_info(dataset_key)
@@ -92,20 +112,28 @@ async def make_prediction(
             )
         
         # Make prediction
-        prediction, confidence = model_service.predict(dataset_key, request.features)
-        print(f"✅ Predicción exitosa: {prediction} (confianza: {confidence})")
-        
-        return PredictionResponse(
-            dataset=dataset_info.name,
-            prediction=prediction,
-            task_type=dataset_info.task.value,
-            confidence=confidence
+        prediction, confidence, probabilities = await model_executor.run(
+            model_service.predict_with_probabilities,
+            dataset_key, request.features, include_probabilities
         )
+        logger.debug(
+            "✅ Predicción exitosa",
+            extra={"dataset": dataset_key, "prediction": prediction, "confidence": confidence}
+        )
+        
+        with metrics.stage(dataset_key, "serialize"):
+            return PredictionResponse(
+                dataset=dataset_info.name,
+                prediction=prediction,
+                task_type=dataset_info.task.value,
+                confidence=confidence,
+                probabilities=probabilities
+            )
     
+    except (ExecutorSaturated, HTTPException):
+        raise
     except ValueError as e:
-        print(f"❌ ValueError: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("❌ Predicción rechazada: %s", e, extra={"dataset": dataset_key})
         raise HTTPException(
             status_code=400,
             detail={
@@ -115,9 +143,7 @@ async def make_prediction(
             }
         )
     except Exception as e:
-        print(f"❌ Exception: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error inesperado en la predicción", extra={"dataset": dataset_key})
         raise HTTPException(
             status_code=500,
             detail={
@@ -127,6 +153,394 @@ async def make_prediction(
         )
 
 
+@router.post(
+    "/{dataset_key}/batch",
+    response_model=BatchPredictionResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Model not found"},
+        503: {"model": ErrorResponse, "description": "Inference queue full"}
+    },
+    summary="Make Batch Prediction",
+    description="Realiza predicciones para un lote de registros en una sola llamada al modelo"
+)
+async def make_batch_prediction(
+    dataset_key: str,
+    request: BatchPredictionRequest,
+    include_probabilities: bool = False
+) -> BatchPredictionResponse:
+    """
+    Make predictions for many records using the specified model.
+    
+    Records that fail validation or prediction are reported individually
+    in the response instead of failing the whole batch.
+    
+    Args:
+        dataset_key: Identifier of the dataset/model (e.g., 'telco_churn')
+        request: List of feature dictionaries
+        include_probabilities: Return the full class-probability vector per record
+        
+    Returns:
+        Per-record predictions, confidences and errors
+        
+    Raises:
+        HTTPException: If model not found or the batch cannot be processed
+    """
+    dataset_info = model_service.get_model_info(dataset_key)
+    if not dataset_info:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ModelNotFound",
+                "message": f"Model '{dataset_key}' not found",
+                "details": {
+                    "available_models": model_service.get_available_models()
+                }
+            }
+        )
+    
+    try:
+        outcomes = await model_executor.run(
+            model_service.predict_batch, dataset_key, request.records, include_probabilities
+        )
+    except ExecutorSaturated:
+        raise
+    except Exception as e:
+        logger.exception("❌ Error inesperado en la predicción", extra={"dataset": dataset_key})
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalError",
+                "message": f"Unexpected error: {str(e)}"
+            }
+        )
+    
+    with metrics.stage(dataset_key, "serialize"):
+        results = [
+            BatchPredictionItem(
+                index=index,
+                prediction=prediction,
+                confidence=confidence,
+                probabilities=probabilities,
+                error=error
+            )
+            for index, (prediction, confidence, probabilities, error) in enumerate(outcomes)
+        ]
+        n_errors = sum(1 for item in results if item.error is not None)
+        response = BatchPredictionResponse(
+            dataset=dataset_info.name,
+            task_type=dataset_info.task.value,
+            n_records=len(results),
+            n_errors=n_errors,
+            results=results
+        )
+    logger.debug(
+        "✅ Lote procesado",
+        extra={"dataset": dataset_key, "records": len(results), "errors": n_errors}
+    )
+    
+    return response
+
+
+def _score_next_chunk(
+    reader: Iterator[pd.DataFrame],
+    dataset_key: str,
+    include_probabilities: bool,
+    output_format: str,
+    offset: int
+) -> Optional[Tuple[str, int]]:
+    """Parse and score the next CSV chunk; returns the serialized rows and their count."""
+    chunk = next(reader, None)
+    if chunk is None:
+        return None
+    scored = model_service.score_frame(dataset_key, chunk, include_probabilities)
+    with metrics.stage(dataset_key, "serialize"):
+        scored.insert(0, "index", range(offset, offset + len(scored)))
+        if output_format == "csv":
+            return scored.to_csv(index=False, header=offset == 0), len(scored)
+        return scored.to_json(orient="records", lines=True, double_precision=15), len(scored)
+
+
+async def _run_chunk(*args) -> Optional[Tuple[str, int]]:
+    # Mid-stream the status code is already sent, so wait for a free slot instead of a 503
+    while True:
+        try:
+            return await model_executor.run(_score_next_chunk, *args)
+        except ExecutorSaturated as e:
+            await asyncio.sleep(e.retry_after)
+
+
+@router.post(
+    "/{dataset_key}/score-file",
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "One scored row per input row, streamed as it is produced"
+        },
+        404: {"model": ErrorResponse, "description": "Model not found"},
+        400: {"model": ErrorResponse, "description": "Invalid or incompatible CSV"},
+        503: {"model": ErrorResponse, "description": "Inference queue full"}
+    },
+    summary="Score CSV File",
+    description="Puntúa un archivo CSV por bloques y devuelve las predicciones en streaming (NDJSON o CSV)"
+)
+async def score_file(
+    dataset_key: str,
+    file: UploadFile = File(...),
+    output_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    chunk_size: int = Query(DEFAULT_SCORE_CHUNK_SIZE, ge=1, le=MAX_SCORE_CHUNK_SIZE),
+    include_probabilities: bool = False
+) -> StreamingResponse:
+    """
+    Score every row of an uploaded CSV file.
+    
+    The file is parsed ``chunk_size`` rows at a time and each chunk is scored
+    in one vectorized call, so memory stays bounded by the chunk size rather
+    than the file size. Output rows keep the input order and carry their
+    0-based ``index``, the prediction, the confidence and a per-row ``error``.
+    
+    Args:
+        dataset_key: Identifier of the dataset/model (e.g., 'telco_churn')
+        file: CSV with a header row; column names may use any spelling the loaders accept
+        output_format: 'ndjson' (default) or 'csv'
+        chunk_size: Rows parsed and scored per step
+        include_probabilities: Add one probability column per class
+        
+    Returns:
+        Streaming response with the scored rows
+        
+    Raises:
+        HTTPException: If the model is not found or the first chunk cannot be scored
+    """
+    if not model_service.get_model_info(dataset_key):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ModelNotFound",
+                "message": f"Model '{dataset_key}' not found",
+                "details": {
+                    "available_models": model_service.get_available_models()
+                }
+            }
+        )
+    
+    # The first chunk is scored before streaming starts, so a bad file still
+    # gets a proper error status instead of a truncated 200
+    try:
+        reader = pd.read_csv(file.file, chunksize=chunk_size)
+        first = await model_executor.run(
+            _score_next_chunk, reader, dataset_key, include_probabilities, output_format, 0
+        )
+    except ExecutorSaturated:
+        raise
+    except (ValueError, pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "InvalidFile",
+                "message": str(e)
+            }
+        )
+    
+    async def stream():
+        chunk, n_rows = first or ("", 0)
+        try:
+            while chunk:
+                yield chunk
+                scored = await _run_chunk(reader, dataset_key, include_probabilities, output_format, n_rows)
+                if scored is None:
+                    break
+                chunk, rows = scored
+                n_rows += rows
+        except Exception as e:
+            logger.exception(
+                "❌ Error puntuando archivo",
+                extra={"dataset": dataset_key, "upload_name": file.filename, "rows_scored": n_rows}
+            )
+            if output_format == "ndjson":
+                yield f'{{"error": {json.dumps(str(e))}, "rows_scored": {n_rows}}}\n'
+            return
+        finally:
+            reader.close()
+        logger.info("✅ Archivo puntuado", extra={"dataset": dataset_key, "rows": n_rows})
+    
+    media_type = "text/csv" if output_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(stream(), media_type=media_type)
+
+
+def _history_response(dataset_key: str, state: Dict[str, Any]) -> HistoryFeaturesResponse:
+    features = {
+        name: None if value is None or math.isnan(value) else value
+        for name, value in state["features"].items()
+    }
+    return HistoryFeaturesResponse(
+        dataset=dataset_key,
+        n_observations=state["n_observations"],
+        last_timestamp=state["last_timestamp"],
+        features=features
+    )
+
+
+def _time_series_info(dataset_key: str):
+    info = model_service.get_model_info(dataset_key)
+    if not info or not feature_store.supports(info):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "TimeSeriesNotFound",
+                "message": f"Time-series model '{dataset_key}' not found",
+                "details": {
+                    "available_models": model_service.get_available_models()
+                }
+            }
+        )
+    return info
+
+
+@router.post(
+    "/{dataset_key}/observations",
+    response_model=HistoryFeaturesResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Time-series model not found"},
+        400: {"model": ErrorResponse, "description": "Invalid observation"}
+    },
+    summary="Append Observation",
+    description="Registra una nueva observación (p. ej. precio de cierre) en el historial en línea de una serie de tiempo"
+)
+async def append_observation(dataset_key: str, request: ObservationRequest) -> HistoryFeaturesResponse:
+    """
+    Append an observation to the online feature store.
+    
+    Later predictions that omit lag/rolling features get them from this history.
+    
+    Args:
+        dataset_key: Identifier of a time-series dataset (e.g., 'bitcoin_price')
+        request: Observed value, timestamp and series keys
+        
+    Returns:
+        Series state and the features of the next prediction
+    """
+    info = _time_series_info(dataset_key)
+    try:
+        state = await model_executor.run(
+            feature_store.append, dataset_key, info, request.value, request.timestamp, request.group
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "InvalidObservation",
+                "message": str(e)
+            }
+        )
+    logger.debug("📈 Observación registrada", extra={"dataset": dataset_key, "value": request.value})
+    return _history_response(dataset_key, state)
+
+
+@router.post(
+    "/{dataset_key}/forecast",
+    response_model=ForecastResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Time-series model not found"},
+        400: {"model": ErrorResponse, "description": "Invalid input features"},
+        503: {"model": ErrorResponse, "description": "Inference queue full"}
+    },
+    summary="Multi-step Forecast",
+    description="Pronostica N pasos hacia adelante realimentando cada predicción en los lags y medias móviles"
+)
+async def make_forecast(
+    dataset_key: str,
+    request: PredictionRequest,
+    horizon: int = Query(7, ge=1, le=MAX_FORECAST_HORIZON, description="Pasos a pronosticar"),
+    impute_missing: bool = Query(
+        False, description="Imputa las features exógenas faltantes con los valores de entrenamiento"
+    )
+) -> ForecastResponse:
+    """
+    Forecast a time series recursively in a single call.
+    
+    History features come from the online feature store; the exogenous
+    features in the request are held constant over the horizon. Missing or
+    empty exogenous features are rejected unless ``impute_missing`` is set.
+    
+    Args:
+        dataset_key: Identifier of a time-series dataset (e.g., 'bitcoin_price')
+        request: Exogenous features (e.g., Open, High, Low, Volume, Market Cap)
+        horizon: Number of steps to forecast
+        impute_missing: Impute missing exogenous features instead of returning 400
+        
+    Returns:
+        Prediction for every step of the horizon and the imputed features
+    """
+    info = _time_series_info(dataset_key)
+    try:
+        result = await model_executor.run(
+            model_service.forecast, dataset_key, request.features, horizon, impute_missing
+        )
+    except ExecutorSaturated:
+        raise
+    except MissingFeaturesError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "MissingFeatures",
+                "message": str(e),
+                "details": {"missing": e.columns}
+            }
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "PredictionError",
+                "message": str(e),
+                "details": {"features": request.features}
+            }
+        )
+    
+    last, spacing = result["last_timestamp"], result["step"]
+    predictions = [
+        ForecastPoint(
+            step=step,
+            timestamp=(last + step * spacing).isoformat() if last is not None and spacing is not None else None,
+            prediction=value
+        )
+        for step, value in enumerate(result["predictions"], start=1)
+    ]
+    logger.debug("✅ Pronóstico generado", extra={"dataset": dataset_key, "horizon": horizon})
+    return ForecastResponse(
+        dataset=info.name,
+        horizon=horizon,
+        last_observed=last.isoformat() if last is not None else None,
+        predictions=predictions,
+        imputed=result["imputed"]
+    )
+
+
+@router.get(
+    "/{dataset_key}/features",
+    response_model=HistoryFeaturesResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Time-series model not found"}
+    },
+    summary="Get History Features",
+    description="Muestra las features de historial (lags y medias móviles) que se usarán en la próxima predicción"
+)
+async def get_history_features(dataset_key: str) -> HistoryFeaturesResponse:
+    """Get the lag/rolling features the feature store currently provides."""
+    info = _time_series_info(dataset_key)
+    try:
+        state = await model_executor.run(feature_store.get_state, dataset_key, info)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "InvalidSeries",
+                "message": str(e)
+            }
+        )
+    return _history_response(dataset_key, state)
+
+
 @router.get(
     "/{dataset_key}/info",
     response_model=DatasetInfoModel,
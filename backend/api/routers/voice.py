@@ -3,11 +3,14 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File
 from google.api_core.exceptions import GoogleAPIError
 
+from ..logging_config import get_logger, log_payload
 from ..models import VoiceCommandRequest, VoiceCommandResponse, ErrorResponse
+from ..services.inference_executor import ExecutorSaturated, speech_executor
 from ..services.speech_service import speech_to_text_service
 from ..services.voice_command_service import voice_service
 
 router = APIRouter(prefix="/voice", tags=["Voice Commands"])
+logger = get_logger(__name__)
 
 
 @router.post(
@@ -36,13 +39,16 @@ async def process_voice_command(request: VoiceCommandRequest) -> VoiceCommandRes
     Raises:
         HTTPException: If speech recognition fails or API not configured
     """
-    print(f"\n🎤 Voice command received")
-    print(f"📊 Audio size: {len(request.audio_base64)} bytes (base64)")
-    print(f"🌍 Language: {request.language_code}")
-    
     # Check if service is available
     service_available = speech_to_text_service.is_available()
-    print(f"🔌 Service available: {service_available}")
+    logger.debug(
+        "🎤 Comando de voz recibido",
+        extra={
+            "audio_base64_bytes": len(request.audio_base64),
+            "language": request.language_code,
+            "service_available": service_available,
+        }
+    )
     
     if not service_available:
         raise HTTPException(
@@ -55,18 +61,17 @@ async def process_voice_command(request: VoiceCommandRequest) -> VoiceCommandRes
         )
     
     try:
-        print("🔄 Iniciando transcripción con Google Cloud...")
         # Transcribe audio
-        transcript, confidence = speech_to_text_service.transcribe_base64_audio(
+        transcript, confidence = await speech_executor.run(
+            speech_to_text_service.transcribe_base64_audio,
             audio_base64=request.audio_base64,
             language_code=request.language_code
         )
         
-        print(f"✅ Transcripción exitosa: '{transcript}' (confianza: {confidence})")
-        
         # Parse command
         dataset_key = voice_service.parse_command(transcript)
-        print(f"✅ Dataset key reconocido: {dataset_key}")
+        logger.debug("✅ Comando reconocido", extra={"dataset": dataset_key, "confidence": confidence})
+        log_payload(logger, "🎤 Transcripción", transcript=transcript)
         
         return VoiceCommandResponse(
             transcript=transcript,
@@ -75,10 +80,10 @@ async def process_voice_command(request: VoiceCommandRequest) -> VoiceCommandRes
             confidence=confidence
         )
     
+    except ExecutorSaturated:
+        raise
     except GoogleAPIError as e:
-        print(f"❌ GoogleAPIError: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error de Google Speech API")
         raise HTTPException(
             status_code=500,
             detail={
@@ -87,7 +92,7 @@ async def process_voice_command(request: VoiceCommandRequest) -> VoiceCommandRes
             }
         )
     except ValueError as e:
-        print(f"❌ ValueError: {str(e)}")
+        logger.warning("❌ Audio rechazado: %s", e)
         raise HTTPException(
             status_code=400,
             detail={
@@ -96,9 +101,7 @@ async def process_voice_command(request: VoiceCommandRequest) -> VoiceCommandRes
             }
         )
     except Exception as e:
-        print(f"❌ Exception genérica: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error procesando el comando de voz")
         raise HTTPException(
             status_code=400,
             detail={
@@ -147,7 +150,8 @@ async def upload_audio_file(
         audio_content = await file.read()
         
         # Transcribe
-        transcript, confidence = speech_to_text_service.transcribe_audio(
+        transcript, confidence = await speech_executor.run(
+            speech_to_text_service.transcribe_audio,
             audio_content=audio_content,
             language_code=language_code
         )
@@ -162,6 +166,8 @@ async def upload_audio_file(
             confidence=confidence
         )
     
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=400,
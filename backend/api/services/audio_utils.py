@@ -6,12 +6,16 @@ import io
 import wave
 from typing import Optional
 
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
 try:
     import pyaudio
     PYAUDIO_AVAILABLE = True
 except ImportError:
     PYAUDIO_AVAILABLE = False
-    print("⚠ PyAudio no disponible. Captura de audio no funcionará.")
+    logger.warning("⚠ PyAudio no disponible. Captura de audio no funcionará.")
 
 
 class AudioRecorder:
@@ -44,7 +48,7 @@ class AudioRecorder:
             input=True,
             frames_per_buffer=self.CHUNK
         )
-        print("🎤 Grabación iniciada...")
+        logger.info("🎤 Grabación iniciada...")
     
     def stop_recording(self) -> bytes:
         """
@@ -58,7 +62,7 @@ class AudioRecorder:
             self.stream.close()
             self.stream = None
         
-        print("🎤 Grabación detenida")
+        logger.info("🎤 Grabación detenida")
         
         # Convert frames to bytes
         audio_data = b''.join(self.frames)
@@ -103,7 +107,7 @@ class AudioRecorder:
             wf.setframerate(self.RATE)
             wf.writeframes(audio_data)
         
-        print(f"💾 Audio guardado en: {output_path}")
+        logger.info("💾 Audio guardado en: %s", output_path)
     
     def get_wav_bytes(self, audio_data: bytes) -> bytes:
         """
@@ -14,6 +14,10 @@ from azure.cognitiveservices.vision.face.models import (
 )
 from msrest.authentication import CognitiveServicesCredentials
 
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
 
 class FaceRecognitionService:
     """
@@ -52,12 +56,10 @@ class FaceRecognitionService:
         
         if self.api_key and self.endpoint:
             self._credentials_configured = True
-            print(f"✓ Azure Face API configurada (Primary)")
-            print(f"  Endpoint: {self.endpoint}")
+            logger.info("✓ Azure Face API configurada (Primary)", extra={"endpoint": self.endpoint})
         else:
             self._credentials_configured = False
-            print("⚠ Azure Face API NO configurada")
-            print("  Configure AZURE_FACE_KEY y AZURE_FACE_ENDPOINT")
+            logger.warning("⚠ Azure Face API NO configurada. Configure AZURE_FACE_KEY y AZURE_FACE_ENDPOINT")
     
     def _init_local_fallback(self) -> None:
         """Initialize local emotion detection as fallback."""
@@ -67,15 +69,13 @@ class FaceRecognitionService:
             import deepface
             from deepface import DeepFace
             self._local_fallback_available = True
-            print("+ DeepFace disponible (Local Fallback)")
-            print("  Nota: Se usara si Azure Face API no esta disponible")
+            logger.info("+ DeepFace disponible (Local Fallback, se usa si Azure Face API no está disponible)")
         except ImportError as e:
             self._local_fallback_available = False
-            print(f"! DeepFace no disponible: {str(e)}")
-            print("  Instalar con: pip install deepface")
+            logger.warning("! DeepFace no disponible: %s. Instalar con: pip install deepface", e)
         except Exception as e:
             self._local_fallback_available = False
-            print(f"! Error al cargar DeepFace: {str(e)}")
+            logger.warning("! Error al cargar DeepFace: %s", e)
     
     def _get_client(self) -> FaceClient:
         """Get or create Face API client."""
@@ -147,13 +147,15 @@ class FaceRecognitionService:
             
             return detected_faces
         except Exception as e:
-            print(f"❌ Error detallado de Azure Face API:")
-            print(f"   - Tipo de error: {type(e).__name__}")
-            print(f"   - Mensaje: {str(e)}")
-            if hasattr(e, 'response'):
-                print(f"   - Response: {e.response}")
-            if hasattr(e, 'error'):
-                print(f"   - Error details: {e.error}")
+            logger.error(
+                "❌ Error detallado de Azure Face API: %s",
+                e,
+                extra={
+                    "error_type": type(e).__name__,
+                    "response": getattr(e, "response", None),
+                    "error_details": getattr(e, "error", None),
+                }
+            )
             raise
     
     def analyze_emotions(
@@ -171,26 +173,22 @@ class FaceRecognitionService:
         Returns:
             Dictionary with emotion analysis results
         """
-        print(f"🔍 Analizando emociones (Hybrid Mode)...")
-        print(f"   - Tamaño de imagen: {len(image_data)} bytes")
+        logger.debug("🔍 Analizando emociones (Hybrid Mode)", extra={"image_bytes": len(image_data)})
         
         # Try Azure Face API first
         if self._credentials_configured:
             try:
-                print(f"   - Intentando con Azure Face API...")
                 return self._analyze_emotions_azure(image_data)
             except Exception as e:
-                print(f"⚠️ Azure Face API falló: {str(e)}")
-                print(f"   - Probablemente requiere aprobación de Microsoft")
-                print(f"   - Cambiando a fallback local (DeepFace)...")
+                # Usually the Face API still needs Microsoft's approval
+                logger.warning("⚠️ Azure Face API falló, se usa DeepFace: %s", e)
         
         # Fallback to local DeepFace
         if self._local_fallback_available:
             try:
-                print(f"   - Usando DeepFace (Local Fallback)...")
                 return self._analyze_emotions_local(image_data)
             except Exception as e:
-                print(f"❌ Error en DeepFace: {str(e)}")
+                logger.error("❌ Error en DeepFace: %s", e)
                 raise
         
         # No service available
@@ -496,7 +494,7 @@ class FaceRecognitionService:
             }
             
         except Exception as e:
-            print(f"❌ Error en análisis DeepFace: {str(e)}")
+            logger.error("❌ Error en análisis DeepFace: %s", e)
             raise
 
 
@@ -0,0 +1,292 @@
+"""Online feature store with the recent history of time-series targets."""
+
+import copy
+import math
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.dataset_registry import DatasetInfo, TaskType
+from src.time_series_features import TimeSeriesFeatureConfig
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+GroupKey = Tuple[Any, ...]
+
+
+class SeriesBuffer:
+    """
+    Ring buffer with the last observations of one series.
+
+    Holds only as many values as the longest lag or window needs, so
+    appending and reading features cost O(1) in the length of the history
+    (O(window) for rolling statistics, which are a handful of values).
+    """
+
+    def __init__(self, config: TimeSeriesFeatureConfig):
+        self.config = config
+        self.capacity = config.history_length
+        self._values = np.full(self.capacity, np.nan)
+        self._head = 0  # next slot to write
+        self.count = 0  # observations seen, including those already overwritten
+        self.last_timestamp: Optional[pd.Timestamp] = None
+        # Typical spacing between observations, used to date forecast steps
+        self.step: Optional[pd.Timedelta] = None
+        # Incremental EWM (pandas adjust=True): weighted sum and weight per span
+        self._ewm = {span: [0.0, 0.0] for span in config.ewm_spans}
+
+    def _recent(self, n: int) -> np.ndarray:
+        """Last ``n`` values (or fewer if the history is shorter), oldest first."""
+        n = min(n, self.count)
+        idx = (self._head - n + np.arange(n)) % self.capacity
+        return self._values[idx]
+
+    def append(self, value: float, timestamp: Optional[pd.Timestamp] = None) -> None:
+        """
+        Add the newest observation.
+
+        Raises:
+            ValueError: If the value is not finite or older than the last one
+        """
+        if not math.isfinite(value):
+            raise ValueError("Observation must be a finite number")
+        if timestamp is not None and self.last_timestamp is not None:
+            if timestamp < self.last_timestamp:
+                raise ValueError(
+                    f"Observation at {timestamp} is older than the last one ({self.last_timestamp})"
+                )
+            if timestamp == self.last_timestamp:
+                # Same period again: correct the last value instead of appending
+                self._values[(self._head - 1) % self.capacity] = value
+                self._rebuild_ewm()
+                return
+
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self.count += 1
+        if timestamp is not None:
+            self.last_timestamp = timestamp
+        for span, state in self._ewm.items():
+            decay = 1.0 - 2.0 / (span + 1.0)
+            state[0] = value + decay * state[0]
+            state[1] = 1.0 + decay * state[1]
+
+    def copy(self) -> "SeriesBuffer":
+        """Independent copy, e.g. to roll a forecast forward without touching the store."""
+        return copy.deepcopy(self)
+
+    def _rebuild_ewm(self) -> None:
+        # Only reachable on corrections; older values are gone, so restart from the buffer
+        values = self._recent(self.capacity)
+        for span, state in self._ewm.items():
+            decay = 1.0 - 2.0 / (span + 1.0)
+            state[0] = state[1] = 0.0
+            for value in values:
+                state[0] = value + decay * state[0]
+                state[1] = 1.0 + decay * state[1]
+
+    def features(self) -> Dict[str, float]:
+        """
+        Features of the next, not yet observed, step.
+
+        Every feature matches training: ``lag_k`` is the value k steps back,
+        and rolling and EWM statistics cover the observations before the
+        step, never the target being predicted.
+        """
+        config = self.config
+        features: Dict[str, float] = {}
+        for lag, column in zip(config.lags, config.lag_columns):
+            features[column] = float(self._recent(lag)[0]) if lag <= self.count else math.nan
+        for window in config.rolling_windows:
+            values = self._recent(window)
+            enough = len(values) >= config.min_periods
+            for stat in config.rolling_stats:
+                if not enough or (stat == "std" and len(values) < 2):
+                    features[f"rolling_{stat}_{window}"] = math.nan
+                elif stat == "std":
+                    features[f"rolling_{stat}_{window}"] = float(np.std(values, ddof=1))
+                else:
+                    features[f"rolling_{stat}_{window}"] = float(getattr(np, stat)(values))
+        for span, (weighted_sum, weight) in self._ewm.items():
+            usable = self.count >= config.min_periods and weight > 0
+            features[f"ewm_mean_{span}"] = weighted_sum / weight if usable else math.nan
+        return features
+
+
+class FeatureStore:
+    """
+    Per-dataset ring buffers seeded from the cleaned training history.
+
+    A dataset is seeded on first use. Series are identified by the values of
+    the dataset's ``group_keys`` (a single series when it has none).
+    """
+
+    def __init__(self):
+        self._series: Dict[str, Dict[GroupKey, SeriesBuffer]] = {}
+        self._infos: Dict[str, DatasetInfo] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def supports(dataset_info: DatasetInfo) -> bool:
+        return dataset_info.task == TaskType.TIME_SERIES and dataset_info.time_column is not None
+
+    def _seed(self, dataset_key: str, dataset_info: DatasetInfo) -> Dict[GroupKey, SeriesBuffer]:
+        """Build the buffers from the training data (lock held)."""
+        config = dataset_info.time_series_features
+        group_keys = list(dataset_info.group_keys or [])
+        df = dataset_info.load_dataframe()
+        df = df.assign(**{dataset_info.time_column: pd.to_datetime(df[dataset_info.time_column], errors="coerce")})
+        df = df.dropna(subset=[dataset_info.time_column, dataset_info.target])
+        df = df.sort_values(group_keys + [dataset_info.time_column])
+
+        series: Dict[GroupKey, SeriesBuffer] = {}
+        groups = df.groupby(group_keys, sort=False) if group_keys else [((), df)]
+        for key, group_df in groups:
+            key = key if isinstance(key, tuple) else (key,)
+            buffer = SeriesBuffer(config)
+            # Only the tail matters once the buffer is full (EWM needs the whole series)
+            tail = group_df if config.ewm_spans else group_df.tail(buffer.capacity)
+            for timestamp, value in zip(tail[dataset_info.time_column], tail[dataset_info.target]):
+                buffer.append(float(value), timestamp)
+            buffer.count += len(group_df) - len(tail)
+            spacing = group_df[dataset_info.time_column].diff().dropna()
+            if not spacing.empty:
+                buffer.step = spacing.median()
+            series[key] = buffer
+
+        self._infos[dataset_key] = dataset_info
+        self._series[dataset_key] = series
+        logger.info(
+            "✓ Historial en línea de %s", dataset_key, extra={"series": len(series), "observations": len(df)}
+        )
+        return series
+
+    def _buffers(self, dataset_key: str, dataset_info: DatasetInfo) -> Dict[GroupKey, SeriesBuffer]:
+        series = self._series.get(dataset_key)
+        if series is None:
+            series = self._seed(dataset_key, dataset_info)
+        return series
+
+    @staticmethod
+    def _group_key(dataset_info: DatasetInfo, values: Dict[str, Any]) -> GroupKey:
+        group_keys = dataset_info.group_keys or []
+        missing = [key for key in group_keys if key not in values]
+        if missing:
+            raise ValueError(f"Series keys are missing: {missing}")
+        return tuple(values[key] for key in group_keys)
+
+    def append(
+        self,
+        dataset_key: str,
+        dataset_info: DatasetInfo,
+        value: float,
+        timestamp: Optional[datetime] = None,
+        group: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Record a new observation of the target.
+
+        Args:
+            dataset_key: Key identifying the dataset/model
+            dataset_info: Registry entry of the dataset
+            value: Observed target value
+            timestamp: Time of the observation; equal to the last one replaces it
+            group: Values of the dataset's group keys, if any
+
+        Returns:
+            Series state after the append and the features of the next step
+
+        Raises:
+            ValueError: If the dataset is not a time series or the observation is invalid
+        """
+        if not self.supports(dataset_info):
+            raise ValueError(f"Dataset '{dataset_key}' is not a time series")
+        key = self._group_key(dataset_info, group or {})
+        stamp = pd.Timestamp(timestamp) if timestamp is not None else None
+        if stamp is not None and stamp.tzinfo is not None:
+            stamp = stamp.tz_convert(None)
+        with self._lock:
+            series = self._buffers(dataset_key, dataset_info)
+            buffer = series.get(key)
+            if buffer is None:
+                buffer = series[key] = SeriesBuffer(dataset_info.time_series_features)
+            buffer.append(float(value), stamp)
+            return self._state(buffer)
+
+    @staticmethod
+    def _state(buffer: SeriesBuffer) -> Dict[str, Any]:
+        return {
+            "n_observations": buffer.count,
+            "last_timestamp": buffer.last_timestamp.isoformat() if buffer.last_timestamp is not None else None,
+            "features": buffer.features(),
+        }
+
+    def get_state(
+        self,
+        dataset_key: str,
+        dataset_info: DatasetInfo,
+        group: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Observation count, last timestamp and next-step features of a series."""
+        if not self.supports(dataset_info):
+            raise ValueError(f"Dataset '{dataset_key}' is not a time series")
+        key = self._group_key(dataset_info, group or {})
+        with self._lock:
+            buffer = self._buffers(dataset_key, dataset_info).get(key)
+            if buffer is None:
+                raise ValueError(f"No history for series {key}")
+            return self._state(buffer)
+
+    def snapshot(
+        self,
+        dataset_key: str,
+        dataset_info: DatasetInfo,
+        group: Optional[Dict[str, Any]] = None
+    ) -> SeriesBuffer:
+        """Copy of a series buffer, safe to modify outside the store."""
+        if not self.supports(dataset_info):
+            raise ValueError(f"Dataset '{dataset_key}' is not a time series")
+        key = self._group_key(dataset_info, group or {})
+        with self._lock:
+            buffer = self._buffers(dataset_key, dataset_info).get(key)
+            if buffer is None:
+                raise ValueError(f"No history for series {key}")
+            return buffer.copy()
+
+    def fill_features(
+        self,
+        dataset_key: str,
+        dataset_info: DatasetInfo,
+        features: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Add the history features the caller did not send, in place.
+
+        Returns:
+            Names of the features that were filled
+        """
+        config = dataset_info.time_series_features
+        missing = [name for name in config.feature_names if features.get(name) is None]
+        if not missing or not self.supports(dataset_info):
+            return []
+        try:
+            key = self._group_key(dataset_info, features)
+        except ValueError:
+            return []
+        with self._lock:
+            buffer = self._buffers(dataset_key, dataset_info).get(key)
+            if buffer is None:
+                return []
+            history = buffer.features()
+        for name in missing:
+            features[name] = history[name]
+        return missing
+
+
+# Global singleton instance
+feature_store = FeatureStore()
@@ -0,0 +1,157 @@
+"""Bounded thread pools that keep blocking inference off the event loop."""
+
+import asyncio
+import functools
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from .metrics import metrics
+
+# Set JARVIS_INFERENCE_EXECUTOR=0 to run blocking calls inline (previous behavior)
+EXECUTOR_ENABLED = os.getenv("JARVIS_INFERENCE_EXECUTOR", "1") != "0"
+
+
+class ExecutorSaturated(Exception):
+    """Raised when a subsystem already has as many calls queued as it accepts."""
+
+    def __init__(self, name: str, queue_depth: int, max_queue: int, retry_after: int):
+        super().__init__(
+            f"{name} executor saturated: {queue_depth} calls queued (limit {max_queue})"
+        )
+        self.name = name
+        self.queue_depth = queue_depth
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a hard limit on waiting calls.
+
+    Up to ``max_workers`` calls run concurrently and up to ``max_queue`` more
+    wait; anything beyond that is rejected immediately with
+    ExecutorSaturated instead of growing latency without bound. Threads are
+    used rather than processes because the services hold loaded models and
+    API clients that cannot be pickled; NumPy, scikit-learn and the cloud
+    SDKs release the GIL in their heavy sections.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, enabled: bool = EXECUTOR_ENABLED):
+        """
+        Args:
+            name: Subsystem name used in errors and stats
+            max_workers: Calls that may run concurrently
+            max_queue: Calls that may wait for a free worker
+            enabled: Run calls in the pool; when False they run inline on the caller
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.enabled = enabled
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"jarvis-{name}")
+        self._lock = threading.Lock()
+        self._pending = 0  # running + queued
+        self._completed = 0
+        self._rejected = 0
+        self._avg_seconds = 0.0  # moving average of call duration
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker."""
+        return max(0, self._pending - self.max_workers)
+
+    def _retry_after(self) -> int:
+        """Seconds until the current backlog is expected to drain."""
+        backlog = self._pending / self.max_workers
+        return max(1, math.ceil(backlog * self._avg_seconds))
+
+    def _call(self, func: Callable[..., Any], submitted: float) -> Any:
+        # Runs in the worker thread; the slot itself is released by _release
+        start = time.perf_counter()
+        metrics.observe_executor_wait(self.name, start - submitted)
+        try:
+            return func()
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._completed += 1
+                self._avg_seconds = elapsed if self._completed == 1 else 0.9 * self._avg_seconds + 0.1 * elapsed
+
+    def _release(self, future: "Future[Any]") -> None:
+        # Done callback of the pool future: fires once whether the call ran or
+        # was cancelled while still queued (client disconnect, shutdown), in
+        # which case _call never runs
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking call in the pool and await its result.
+
+        Raises:
+            ExecutorSaturated: If the queue is full
+        """
+        call = functools.partial(func, *args, **kwargs)
+        if not self.enabled:
+            return call()
+
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturated(self.name, self.queue_depth, self.max_queue, self._retry_after())
+            self._pending += 1
+
+        try:
+            future = self._pool.submit(self._call, call, time.perf_counter())
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Concurrency limits, current load and counters."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": min(self._pending, self.max_workers),
+                "queue_depth": self.queue_depth,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_ms": round(self._avg_seconds * 1000, 2),
+            }
+
+    def shutdown(self) -> None:
+        """Wait for running calls and release the threads."""
+        self._pool.shutdown(wait=True)
+
+
+# Per-subsystem pools (JARVIS_<NAME>_WORKERS / JARVIS_<NAME>_QUEUE)
+model_executor = BoundedExecutor(
+    "models",
+    max_workers=int(os.getenv("JARVIS_MODEL_WORKERS", "4")),
+    max_queue=int(os.getenv("JARVIS_MODEL_QUEUE", "32")),
+)
+face_executor = BoundedExecutor(
+    "face",
+    max_workers=int(os.getenv("JARVIS_FACE_WORKERS", "1")),
+    max_queue=int(os.getenv("JARVIS_FACE_QUEUE", "4")),
+)
+speech_executor = BoundedExecutor(
+    "speech",
+    max_workers=int(os.getenv("JARVIS_SPEECH_WORKERS", "2")),
+    max_queue=int(os.getenv("JARVIS_SPEECH_QUEUE", "8")),
+)
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of every inference pool, keyed by subsystem."""
+    return {executor.name: executor.stats() for executor in (model_executor, face_executor, speech_executor)}
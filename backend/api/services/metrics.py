@@ -0,0 +1,279 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Counters and fixed-bucket histograms are plain Python objects guarded by a
+lock, so recording a sample costs one ``bisect`` and a few integer updates
+(about a microsecond) and the instrumentation can stay on in production.
+Nothing is pushed anywhere: ``GET /metrics`` renders the current values.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Set JARVIS_METRICS=0 to skip recording (GET /metrics then only shows snapshots)
+METRICS_ENABLED = os.getenv("JARVIS_METRICS", "1") != "0"
+
+# Seconds; spans cached single predictions (sub-ms) up to speech/face calls
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+Labels = Tuple[str, ...]
+
+# (name, "gauge" | "counter", help, label names, {label values: value})
+Snapshot = Tuple[str, str, str, Sequence[str], Dict[Labels, float]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with a fixed set of label names."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Fixed-bucket histogram; buckets are cumulated only when rendering."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [count per bucket (last one is +Inf), sum]
+        self._series: Dict[Labels, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series is not None else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._series.items())
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class _StageTimer:
+    """Context manager that records its duration in a histogram."""
+
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: Histogram, labels: Labels):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> "_StageTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._histogram.observe(time.perf_counter() - self._start, *self._labels)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """The API's metrics: HTTP requests, inference stages and executor queues."""
+
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        self.enabled = enabled
+        self.requests = Counter(
+            "jarvis_http_requests_total",
+            "HTTP requests by route template, model and status code.",
+            ("method", "route", "model", "status"),
+        )
+        self.request_duration = Histogram(
+            "jarvis_http_request_duration_seconds",
+            "Time from receiving a request to sending the last byte of its response.",
+            ("method", "route", "model"),
+        )
+        self.errors = Counter(
+            "jarvis_http_errors_total",
+            "Error responses by route template and error type.",
+            ("route", "type"),
+        )
+        self.stage_duration = Histogram(
+            "jarvis_inference_stage_seconds",
+            "Time spent per inference stage (normalize, dataframe, transform, model, serialize).",
+            ("model", "stage"),
+        )
+        self.executor_wait = Histogram(
+            "jarvis_executor_wait_seconds",
+            "Time calls wait in an inference pool queue before a worker picks them up.",
+            ("executor",),
+        )
+
+    def stage(self, model: str, stage: str):
+        """Context manager timing one inference stage of ``model``."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self.stage_duration, (model, stage))
+
+    def observe_request(self, method: str, route: str, model: str, status: int, seconds: float) -> None:
+        if not self.enabled:
+            return
+        self.requests.inc(method, route, model, str(status))
+        self.request_duration.observe(seconds, method, route, model)
+
+    def record_error(self, route: str, error_type: str) -> None:
+        if self.enabled:
+            self.errors.inc(route, error_type)
+
+    def observe_executor_wait(self, executor: str, seconds: float) -> None:
+        if self.enabled:
+            self.executor_wait.observe(seconds, executor)
+
+    def render(self, snapshots: Optional[Iterable[Snapshot]] = None) -> str:
+        """
+        Text exposition of every metric.
+
+        Args:
+            snapshots: Values other components keep themselves (queue depths,
+                cache counters), read at scrape time as
+                (name, type, help, label names, {label values: value}) tuples
+
+        Returns:
+            Body for ``GET /metrics`` (content type ``text/plain; version=0.0.4``)
+        """
+        lines: List[str] = []
+        for metric in (self.requests, self.request_duration, self.errors, self.stage_duration, self.executor_wait):
+            lines += metric.render()
+        for name, kind, documentation, labelnames, values in snapshots or ():
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+            for labels, value in sorted(values.items()):
+                lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts and latency per route template.
+
+    Routes are labelled by their template (``/predictions/{dataset_key}``), never
+    the raw path, so label cardinality stays bounded. The model label is the
+    ``dataset_key`` path parameter when it names a known model and "other"
+    otherwise, so clients cannot create series with made-up keys.
+    """
+
+    def __init__(self, app, registry: "MetricsRegistry", known_models: Callable[[], Iterable[str]] = tuple):
+        """
+        Args:
+            app: Wrapped ASGI application
+            registry: Where to record the requests
+            known_models: Returns the dataset keys allowed as model labels
+        """
+        self.app = app
+        self.registry = registry
+        self.known_models = known_models
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as exc:
+            self.registry.record_error(route_label(scope), type(exc).__name__)
+            raise
+        finally:
+            model = scope.get("path_params", {}).get("dataset_key", "")
+            if model and model not in self.known_models():
+                model = "other"
+            self.registry.observe_request(
+                scope["method"], route_label(scope), model, status, time.perf_counter() - start
+            )
+
+
+def route_label(scope: Dict[str, Any]) -> str:
+    """Route template of a request, or 'unmatched' if no route handled it."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+# Global singleton instance
+metrics = MetricsRegistry()
@@ -2,15 +2,40 @@
 
 from __future__ import annotations
 
+import math
+import os
 import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Collection, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from sklearn.pipeline import Pipeline
 
+from src.data_loading import _clean_numeric_strings, _normalize_columns
 from src.dataset_registry import DatasetInfo, TaskType, iter_datasets, get_dataset
+from src.time_series_features import FEATURE_VERSION, FEATURE_VERSION_ATTRIBUTE
+from src.model_compiler import (
+    CompiledPipeline,
+    bundle_matches,
+    bundle_path_for,
+    check_parity,
+    compile_pipeline,
+    load_bundle,
+)
+
+from ..logging_config import get_logger, log_payload
+from .feature_store import feature_store
+from .metrics import metrics
+from .prediction_cache import PredictionCache
+
+logger = get_logger(__name__)
 
 # Path relativo desde api/services/ -> backend/reports/
 MODELS_DIR = Path(__file__).resolve().parent.parent.parent / "reports"
@@ -20,20 +45,211 @@ if not MODELS_DIR.exists():
     # Estamos en backend/api/services/, necesitamos backend/reports/
     MODELS_DIR = Path(__file__).resolve().parent.parent.parent / "reports"
     
-print(f"📂 Buscando modelos en: {MODELS_DIR}")
-print(f"📂 Path existe: {MODELS_DIR.exists()}")
+logger.info("📂 Buscando modelos", extra={"models_dir": str(MODELS_DIR), "exists": MODELS_DIR.exists()})
+
+# Set JARVIS_COMPILED_INFERENCE=0 to always run the sklearn pipelines
+COMPILED_INFERENCE = os.getenv("JARVIS_COMPILED_INFERENCE", "1") != "0"
+
+# JARVIS_LAZY_MODELS=1 only indexes models at startup and unpickles them on
+# first use; JARVIS_MAX_LOADED_MODELS / JARVIS_MODEL_MEMORY_MB bound how many
+# stay resident (0 = unlimited), evicting the least recently used first.
+LAZY_MODELS = os.getenv("JARVIS_LAZY_MODELS", "0") == "1"
+MAX_LOADED_MODELS = int(os.getenv("JARVIS_MAX_LOADED_MODELS", "0"))
+MODEL_MEMORY_MB = float(os.getenv("JARVIS_MODEL_MEMORY_MB", "0"))
+
+# JARVIS_PREDICTION_CACHE_SIZE > 0 caches single-record predictions (LRU + TTL).
+# Artifacts on disk are re-checked at most every JARVIS_PREDICTION_CACHE_CHECK_SECONDS.
+PREDICTION_CACHE_SIZE = int(os.getenv("JARVIS_PREDICTION_CACHE_SIZE", "0"))
+PREDICTION_CACHE_TTL = float(os.getenv("JARVIS_PREDICTION_CACHE_TTL", "300"))
+PREDICTION_CACHE_CHECK_SECONDS = float(os.getenv("JARVIS_PREDICTION_CACHE_CHECK_SECONDS", "1"))
+
+# Precompiled patterns for _to_snake_case (only hit for keys outside a model's table)
+_CAMEL_WORD = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY = re.compile('([a-z0-9])([A-Z])')
+
+# incoming feature name -> (training column name, whether the column is numeric)
+KeyTable = Dict[str, Tuple[str, bool]]
+
+# Upper bound for the dense encoded matrix of one score_frame block. Wide
+# one-hot encodings (telco's customer_id has thousands of categories) would
+# otherwise need hundreds of MB per 10k-row chunk.
+ENCODE_BLOCK_BYTES = 32 * 1024 * 1024
+
+# Columns some models were trained with that clients are not expected to send
+_FEATURE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "car_prices": {"car_name": "unknown"},  # Car prices needs car_name
+    "telco_churn": {"customer_id": "PRED-0000"},  # Telco needs customer_id (can be dummy for prediction)
+}
+
+# (prediction, confidence, probabilities, error) for one record of a batch
+BatchOutcome = Tuple[Any, Optional[float], Optional[Dict[str, float]], Optional[str]]
+
+
+class MissingFeaturesError(ValueError):
+    """Required input features are absent or blank and imputation was not requested."""
+    
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+        super().__init__(f"features are missing or empty: {columns}")
+
+
+def _is_blank(value: Any) -> bool:
+    """True for values a client leaves out: None, NaN or an empty string."""
+    if isinstance(value, str):
+        return not value.strip()
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _to_snake_case(text: str) -> str:
+    """
+    Convert PascalCase/camelCase to snake_case.
+    Examples:
+        PaperlessBilling -> paperless_billing
+        MonthlyCharges -> monthly_charges
+        SeniorCitizen -> senior_citizen
+    """
+    # Insert underscore before uppercase letters that follow lowercase letters
+    s1 = _CAMEL_WORD.sub(r'\1_\2', text)
+    # Insert underscore before uppercase letters that follow lowercase or numbers
+    return _CAMEL_BOUNDARY.sub(r'\1_\2', s1).lower()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_key(key: str) -> str:
+    """Translate an incoming feature name to the column name used in training."""
+    # Handle special cases first
+    if key == "pH":
+        return "p_h"
+    if key.startswith("4"):  # Avocado PLU codes (4046, 4225, 4770)
+        return f"col_{key}"
+    # Standard normalization:
+    # 1. If key has spaces, just lowercase and replace spaces
+    # 2. If key is PascalCase (no spaces), use to_snake_case
+    if ' ' in key:
+        # Simple case: "Market Cap" -> "market_cap"
+        return key.lower().replace(' ', '_')
+    # PascalCase: "PaperlessBilling" -> "paperless_billing"
+    return _to_snake_case(key)
+
+
+def build_key_table(columns: List[str], numeric: Optional[Collection[str]] = None) -> KeyTable:
+    """
+    Precompute key translations for a model's input columns.
+    
+    Each column is registered under the spellings clients commonly send
+    (snake_case, PascalCase, camelCase, "Title Case", "lower case", and the bare
+    PLU code for ``col_*`` columns). A spelling is only added if the generic
+    rules translate it to that same column, so lookups never change results.
+    Columns outside ``numeric`` are marked categorical, so their values are
+    passed through unparsed; ``None`` marks every column numeric.
+    """
+    table: KeyTable = {}
+    for column in columns:
+        kind = numeric is None or column in numeric
+        parts = column.split('_')
+        variants = [
+            column,
+            ''.join(part.capitalize() for part in parts),
+            parts[0] + ''.join(part.capitalize() for part in parts[1:]),
+            ' '.join(part.capitalize() for part in parts),
+            ' '.join(parts),
+        ]
+        if column.startswith("col_"):
+            variants.append(column[len("col_"):])
+        for variant in variants:
+            if variant and _normalize_key(variant) == column:
+                table[variant] = (column, kind)
+    return table
+
+
+def _read_pickle(path: Path) -> Any:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _artifact_version(path: Path) -> Optional[Tuple[int, int]]:
+    """Identify an artifact on disk by (mtime_ns, size); None if it is gone."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class ModelEntry:
+    """A resident model together with everything derived from it at load time."""
+    
+    compiled: Optional[CompiledPipeline]
+    path: Path
+    dataset_key: str
+    size_bytes: int
+    version: Optional[Tuple[int, int]] = None
+    key_table: KeyTable = field(default_factory=dict)
+    _model: Any = None
+    _model_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    
+    @property
+    def model(self) -> Any:
+        """The unpickled model; entries opened from a bundle load it on first fallback."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = _read_pickle(self.path)
+        return self._model
+    
+    @property
+    def feature_names(self) -> Optional[List[str]]:
+        """Input columns the model expects, if known."""
+        if self.compiled is not None:
+            return self.compiled.feature_names
+        names = getattr(self.model, "feature_names_in_", None)
+        return list(names) if names is not None else None
 
 
 class ModelService:
     """Service for loading and managing ML models."""
     
-    def __init__(self):
-        self._models: Dict[str, Any] = {}
+    def __init__(
+        self,
+        lazy: Optional[bool] = None,
+        max_models: Optional[int] = None,
+        max_memory_mb: Optional[float] = None,
+        prediction_cache_size: Optional[int] = None,
+        prediction_cache_ttl: Optional[float] = None
+    ):
+        """
+        Args:
+            lazy: Defer unpickling until first use (default: JARVIS_LAZY_MODELS)
+            max_models: Maximum resident models, 0 for no limit
+            max_memory_mb: Approximate resident size budget in MB, 0 for no limit.
+                Artifact size on disk is used as the estimate of a model's footprint.
+            prediction_cache_size: Cached single-record results, 0 to disable
+            prediction_cache_ttl: Lifetime of a cached result in seconds, 0 for no expiry
+        """
+        self._lazy = LAZY_MODELS if lazy is None else lazy
+        self._max_models = MAX_LOADED_MODELS if max_models is None else max_models
+        budget_mb = MODEL_MEMORY_MB if max_memory_mb is None else max_memory_mb
+        self._max_bytes = int(budget_mb * 1024 * 1024)
+        
+        self._model_paths: Dict[str, Path] = {}
         self._dataset_info: Dict[str, DatasetInfo] = {}
+        # Resident models in least-recently-used order
+        self._models: "OrderedDict[str, ModelEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "reloads": 0, "reload_failures": 0}
+        
+        cache_size = PREDICTION_CACHE_SIZE if prediction_cache_size is None else prediction_cache_size
+        cache_ttl = PREDICTION_CACHE_TTL if prediction_cache_ttl is None else prediction_cache_ttl
+        self._prediction_cache = PredictionCache(cache_size, cache_ttl) if cache_size > 0 else None
+        # dataset_key -> (monotonic time of last stat, version on disk)
+        self._disk_versions: Dict[str, Tuple[float, Optional[Tuple[int, int]]]] = {}
+        
         self._load_all_models()
     
     def _load_all_models(self) -> None:
-        """Load all trained models from disk."""
+        """Index trained models on disk and, unless lazy, load them."""
         for dataset_info in iter_datasets():
             try:
                 # Determine model file path
@@ -48,17 +264,300 @@ class ModelService:
                     model_path = recommender_path
                 
                 if model_path.exists():
-                    with open(model_path, "rb") as f:
-                        model = pickle.load(f)
-                    
                     key = self._get_dataset_key(dataset_info.name)
-                    self._models[key] = model
+                    self._model_paths[key] = model_path
                     self._dataset_info[key] = dataset_info
-                    print(f"✓ Modelo cargado: {dataset_info.name} ({key})")
+                    self._load_locks[key] = threading.Lock()
+                    if self._lazy:
+                        logger.info("✓ Modelo indexado: %s (%s)", dataset_info.name, key)
+                    else:
+                        try:
+                            self._get_entry(key)
+                        except Exception:
+                            # Keep the previous contract: broken models are not listed
+                            del self._model_paths[key]
+                            raise
                 else:
-                    print(f"⚠ Modelo no encontrado: {model_path}")
+                    logger.warning("⚠ Modelo no encontrado: %s", model_path)
             except Exception as e:
-                print(f"✗ Error cargando {dataset_info.name}: {e}")
+                logger.error("✗ Error cargando %s: %s", dataset_info.name, e)
+    
+    def _load_entry(self, dataset_key: str, model_path: Path) -> ModelEntry:
+        """
+        Load a model, preferring its memory-mapped bundle over the pickle.
+        
+        Bundle arrays are mapped read-only, so every worker process shares one
+        copy through the page cache; the pickle is then only unpickled if a
+        request needs the sklearn fallback.
+        
+        Raises:
+            ValueError: If a time-series model was trained on other history
+                features than the feature store serves (see _check_feature_version)
+        """
+        name = self._dataset_info[dataset_key].name
+        bundle_path = bundle_path_for(model_path)
+        if COMPILED_INFERENCE and bundle_path.is_dir():
+            if bundle_matches(bundle_path, model_path):
+                try:
+                    compiled = load_bundle(bundle_path, mmap_mode="r")
+                except Exception as e:
+                    logger.warning("⚠ Bundle inválido para %s: %s", dataset_key, e)
+                else:
+                    self._check_feature_version(dataset_key, compiled.feature_version)
+                    logger.info("✓ Modelo mapeado en memoria: %s (%s)", name, dataset_key)
+                    return ModelEntry(
+                        compiled=compiled,
+                        path=model_path,
+                        dataset_key=dataset_key,
+                        size_bytes=sum(f.stat().st_size for f in bundle_path.iterdir()),
+                        version=_artifact_version(model_path),
+                        key_table=self._build_key_table(None, compiled),
+                    )
+            else:
+                logger.warning("⚠ Bundle desactualizado para %s; se usa el .pkl", dataset_key)
+        
+        version = _artifact_version(model_path)
+        model = _read_pickle(model_path)
+        self._check_feature_version(dataset_key, getattr(model, FEATURE_VERSION_ATTRIBUTE, None))
+        logger.info("✓ Modelo cargado: %s (%s)", name, dataset_key)
+        compiled = self._compile_model(dataset_key, model)
+        return ModelEntry(
+            compiled=compiled,
+            path=model_path,
+            dataset_key=dataset_key,
+            size_bytes=model_path.stat().st_size,
+            version=version,
+            key_table=self._build_key_table(model, compiled),
+            _model=model,
+        )
+    
+    def _check_feature_version(self, dataset_key: str, version: Optional[int]) -> None:
+        """
+        Refuse a time-series model trained on other history features than the
+        feature store computes, instead of silently feeding it mismatched inputs.
+        
+        Raises:
+            ValueError: If the model's feature version is not FEATURE_VERSION
+        """
+        if not feature_store.supports(self._dataset_info[dataset_key]) or version == FEATURE_VERSION:
+            return
+        raise ValueError(
+            f"Model '{dataset_key}' was trained with time-series features v{version or 1}, "
+            f"but the feature store serves v{FEATURE_VERSION}; retrain it with "
+            f"`python -m src.pipeline --dataset {dataset_key}`"
+        )
+    
+    @classmethod
+    def _build_key_table(cls, model: Any, compiled: Optional[CompiledPipeline]) -> KeyTable:
+        """Key translations and column kinds for the input columns of a model."""
+        if compiled is not None:
+            names = compiled.feature_names
+        else:
+            names = getattr(model, "feature_names_in_", None)
+        if names is None:
+            return {}
+        numeric = cls._numeric_input_columns(model, compiled)
+        return build_key_table(list(names), set(numeric) if numeric is not None else None)
+    
+    def _get_entry(self, dataset_key: str) -> ModelEntry:
+        """
+        Return the resident entry for a model, loading it on a miss.
+        
+        Loads happen outside the service lock (one loader per model), so a
+        cold model never blocks requests for models that are already resident.
+        """
+        with self._lock:
+            entry = self._models.get(dataset_key)
+            if entry is not None:
+                self._models.move_to_end(dataset_key)
+                self._cache_stats["hits"] += 1
+                return entry
+            if dataset_key not in self._model_paths:
+                raise ValueError(f"Model '{dataset_key}' not found. Available: {self.get_available_models()}")
+        
+        with self._load_locks[dataset_key]:
+            with self._lock:
+                # Another request may have loaded it while we waited
+                entry = self._models.get(dataset_key)
+                if entry is not None:
+                    self._models.move_to_end(dataset_key)
+                    self._cache_stats["hits"] += 1
+                    return entry
+                self._cache_stats["misses"] += 1
+            
+            entry = self._load_entry(dataset_key, self._model_paths[dataset_key])
+            
+            with self._lock:
+                self._models[dataset_key] = entry
+                self._evict_cold_models()
+            return entry
+    
+    def _smoke_test(self, dataset_key: str, entry: ModelEntry) -> None:
+        """
+        Score a few synthetic records with a freshly loaded entry.
+        
+        Raises:
+            ValueError: If the model cannot produce finite predictions
+        """
+        model = entry._model
+        if entry.compiled is None and isinstance(model, dict):
+            missing = {"global_mean", "user_means", "movie_means"} - model.keys()
+            if missing:
+                raise ValueError(f"Recommender artifact is missing {missing}")
+            return
+        
+        if entry.compiled is not None:
+            rows = entry.compiled.sample_records(8)
+        else:
+            if not isinstance(entry.model, Pipeline):
+                raise ValueError(f"Unknown model type: {type(entry.model)}")
+            names = entry.feature_names
+            if names is None:
+                raise ValueError("Model does not expose its input columns")
+            # Imputers of the pipeline turn an all-missing row into a valid input
+            rows = [{name: np.nan for name in names}]
+        
+        predictions, confidences, _ = self._predict_records(
+            entry, self._dataset_info[dataset_key], rows
+        )
+        if len(predictions) != len(rows):
+            raise ValueError(f"Expected {len(rows)} predictions, got {len(predictions)}")
+        if self._dataset_info[dataset_key].task == TaskType.CLASSIFICATION:
+            values = np.asarray(confidences, dtype=float)
+        else:
+            values = np.asarray(predictions, dtype=float)
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Smoke input produced non-finite outputs")
+    
+    def reload_model(self, dataset_key: str) -> Dict[str, Any]:
+        """
+        Load the current artifact of a model, validate it and swap it in.
+        
+        The new version is loaded and smoke-tested without holding the service
+        lock, so other models keep serving meanwhile. Requests that already
+        hold the previous entry finish on it; later requests get the new one.
+        If loading or validation fails the previous version stays active.
+        
+        Args:
+            dataset_key: Key identifying the model to reload
+            
+        Returns:
+            Previous and new artifact versions and the reload duration
+            
+        Raises:
+            ValueError: If the model is unknown or the new artifact fails validation
+        """
+        if dataset_key not in self._model_paths:
+            raise ValueError(f"Model '{dataset_key}' not found. Available: {self.get_available_models()}")
+        
+        start = time.perf_counter()
+        # One loader per model: a lazy first load cannot race with the reload
+        with self._load_locks[dataset_key]:
+            with self._lock:
+                previous = self._models.get(dataset_key)
+            try:
+                entry = self._load_entry(dataset_key, self._model_paths[dataset_key])
+                self._smoke_test(dataset_key, entry)
+            except Exception as e:
+                with self._lock:
+                    self._cache_stats["reload_failures"] += 1
+                logger.error("✗ Recarga rechazada para %s, se mantiene la versión anterior: %s", dataset_key, e)
+                raise ValueError(f"Reload of '{dataset_key}' failed validation: {e}") from e
+            
+            with self._lock:
+                self._models[dataset_key] = entry
+                self._models.move_to_end(dataset_key)
+                self._cache_stats["reloads"] += 1
+                self._evict_cold_models()
+        
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info("🔄 Modelo recargado: %s", dataset_key, extra={"duration_ms": round(duration_ms)})
+        return {
+            "dataset": dataset_key,
+            "previous_version": previous.version if previous is not None else None,
+            "version": entry.version,
+            "duration_ms": round(duration_ms, 2),
+        }
+    
+    def get_changed_models(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Resident models whose artifact on disk differs from the loaded one."""
+        with self._lock:
+            resident = list(self._models.items())
+        changed = {}
+        for dataset_key, entry in resident:
+            disk_version = _artifact_version(entry.path)
+            if disk_version != entry.version:
+                changed[dataset_key] = disk_version
+        return changed
+    
+    def get_model_status(self) -> List[Dict[str, Any]]:
+        """Residency and loaded/on-disk artifact versions of every model."""
+        with self._lock:
+            resident = dict(self._models)
+        status = []
+        for dataset_key, path in self._model_paths.items():
+            entry = resident.get(dataset_key)
+            disk_version = _artifact_version(path)
+            status.append({
+                "dataset": dataset_key,
+                "path": str(path),
+                "resident": entry is not None,
+                "loaded_version": entry.version if entry is not None else None,
+                "disk_version": disk_version,
+                "changed": entry is not None and entry.version != disk_version,
+            })
+        return status
+    
+    def _cacheable_version(self, dataset_key: str, entry: ModelEntry) -> Optional[Tuple[int, int]]:
+        """
+        Version to cache results of ``entry`` under, or None to bypass the cache.
+        
+        The artifact is stat'ed at most every PREDICTION_CACHE_CHECK_SECONDS.
+        A changed file drops the model's cached results, and results of the
+        resident (now outdated) model are not cached until it is reloaded.
+        """
+        now = time.monotonic()
+        checked = self._disk_versions.get(dataset_key)
+        if checked is None or now - checked[0] >= PREDICTION_CACHE_CHECK_SECONDS:
+            checked = (now, _artifact_version(entry.path))
+            self._disk_versions[dataset_key] = checked
+            if checked[1] is not None:
+                self._prediction_cache.sync_version(dataset_key, checked[1])
+        
+        disk_version = checked[1]
+        if disk_version is None or disk_version != entry.version:
+            return None
+        return disk_version
+    
+    def _evict_cold_models(self) -> None:
+        """Drop least recently used models until the budget is met (lock held)."""
+        while len(self._models) > 1:
+            over_count = self._max_models and len(self._models) > self._max_models
+            resident_bytes = sum(entry.size_bytes for entry in self._models.values())
+            over_memory = self._max_bytes and resident_bytes > self._max_bytes
+            if not (over_count or over_memory):
+                return
+            evicted_key, _ = self._models.popitem(last=False)
+            self._cache_stats["evictions"] += 1
+            logger.info("♻ Modelo descargado de memoria: %s", evicted_key)
+    
+    def _compile_model(self, dataset_key: str, model: Any) -> Optional[CompiledPipeline]:
+        """Build the NumPy fast path for a model and verify it against sklearn."""
+        if not COMPILED_INFERENCE:
+            return None
+        try:
+            compiled = compile_pipeline(model)
+            if compiled is None:
+                logger.info("· Sin ruta compilada para %s (se usa el pipeline)", dataset_key)
+                return None
+            if not check_parity(compiled, model):
+                logger.warning("⚠ Ruta compilada de %s no coincide con sklearn; se descarta", dataset_key)
+                return None
+            logger.info("⚡ Ruta compilada verificada: %s", dataset_key)
+            return compiled
+        except Exception as e:
+            logger.warning("⚠ Error compilando %s: %s", dataset_key, e)
+            return None
     
     @staticmethod
     def _get_dataset_key(name: str) -> str:
@@ -79,26 +578,12 @@ class ModelService:
     
     def get_available_models(self) -> List[str]:
         """Get list of available model keys."""
-        return list(self._models.keys())
+        return list(self._model_paths.keys())
     
     def get_model_info(self, dataset_key: str) -> Optional[DatasetInfo]:
         """Get information about a specific dataset."""
         return self._dataset_info.get(dataset_key)
     
-    def _to_snake_case(self, text: str) -> str:
-        """
-        Convert PascalCase/camelCase to snake_case.
-        Examples:
-            PaperlessBilling -> paperless_billing
-            MonthlyCharges -> monthly_charges
-            SeniorCitizen -> senior_citizen
-        """
-        import re
-        # Insert underscore before uppercase letters that follow lowercase letters
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-        # Insert underscore before uppercase letters that follow lowercase or numbers
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-    
     def _clean_numeric_value(self, value: Any) -> Any:
         """
         Clean numeric values that might have commas or other formatting.
@@ -116,57 +601,176 @@ class ModelService:
                 return value
         return value
     
-    def _normalize_features(self, dataset_key: str, features: Dict[str, Any]) -> Dict[str, Any]:
+    def _normalize_features(
+        self,
+        dataset_key: str,
+        features: Dict[str, Any],
+        key_table: Optional[KeyTable] = None
+    ) -> Dict[str, Any]:
         """
         Normalize feature names and add model-specific features.
         
         Args:
             dataset_key: Key identifying the model
             features: Original feature dictionary
+            key_table: Precomputed key translations of the model (see build_key_table)
             
         Returns:
             Normalized feature dictionary with all required features
         """
         normalized = {}
+        key_table = key_table or {}
         
         # Step 1: Normalize all incoming feature names and values
+        # Known spellings resolve with one dict lookup; anything else goes
+        # through the memoized rules.
+        # Only numeric columns are parsed; names outside the table keep the
+        # old behaviour of parsing any number-like string.
         for key, value in features.items():
-            # Clean numeric values (remove commas)
-            cleaned_value = self._clean_numeric_value(value)
-            
-            # Handle special cases first
-            if key == "pH":
-                normalized["p_h"] = cleaned_value
-            elif key.startswith("4"):  # Avocado PLU codes (4046, 4225, 4770)
-                normalized[f"col_{key}"] = cleaned_value
-            else:
-                # Standard normalization: 
-                # 1. If key has spaces, just lowercase and replace spaces
-                # 2. If key is PascalCase (no spaces), use to_snake_case
-                if ' ' in key:
-                    # Simple case: "Market Cap" -> "market_cap"
-                    normalized_key = key.lower().replace(' ', '_')
-                else:
-                    # PascalCase: "PaperlessBilling" -> "paperless_billing"
-                    normalized_key = self._to_snake_case(key)
-                normalized[normalized_key] = cleaned_value
+            translation = key_table.get(key)
+            if translation is None:
+                normalized_key = _normalize_key(key)
+                translation = key_table.get(normalized_key, (normalized_key, True))
+            normalized_key, numeric = translation
+            normalized[normalized_key] = self._clean_numeric_value(value) if numeric else value
         
         # Step 2: Add model-specific engineered features
-        # Note: For Bitcoin, lag_1, lag_7, and rolling_mean_7 should be provided by the user
-        # as they represent historical price data that affects the prediction
-        
-        if dataset_key == "car_prices":
-            # Car prices needs car_name
-            if 'car_name' not in normalized:
-                normalized['car_name'] = 'unknown'
+        # Time series (Bitcoin): lag_1, lag_7 and rolling_mean_7 the client omits
+        # are filled from the online feature store
+        dataset_info = self._dataset_info.get(dataset_key)
+        if dataset_info is not None and feature_store.supports(dataset_info):
+            feature_store.fill_features(dataset_key, dataset_info, normalized)
         
-        elif dataset_key == "telco_churn":
-            # Telco needs customer_id (can be dummy for prediction)
-            if 'customer_id' not in normalized:
-                normalized['customer_id'] = 'PRED-0000'
+        for column, value in _FEATURE_DEFAULTS.get(dataset_key, {}).items():
+            normalized.setdefault(column, value)
         
         return normalized
     
+    def _predict_frame(
+        self,
+        model: Pipeline,
+        dataset_info: DatasetInfo,
+        df: pd.DataFrame,
+        include_probabilities: bool = False,
+        dataset_key: str = ""
+    ) -> Tuple[List[Any], List[Optional[float]], List[Optional[Dict[str, float]]]]:
+        """
+        Run a fitted pipeline over a frame of already normalized features.
+        
+        The preprocessing steps run once and their output feeds the estimator;
+        for classifiers the label is the arg-max of ``predict_proba``, which is
+        what ``predict`` computes anyway, so the pipeline is not traversed twice.
+        
+        Args:
+            model: Fitted sklearn pipeline
+            dataset_info: Metadata of the dataset the model was trained on
+            df: One row per record to score
+            include_probabilities: Whether to return the full class-probability vectors
+            dataset_key: Model label of the stage metrics
+            
+        Returns:
+            Tuple of (predictions, confidences, probabilities) as plain Python values
+        """
+        n_rows = len(df)
+        confidences: List[Optional[float]] = [None] * n_rows
+        probabilities: List[Optional[Dict[str, float]]] = [None] * n_rows
+        
+        transformed = df
+        with metrics.stage(dataset_key, "transform"):
+            for _, step in model.steps[:-1]:
+                transformed = step.transform(transformed)
+        
+        estimator = model.steps[-1][1]
+        with metrics.stage(dataset_key, "model"):
+            if dataset_info.task != TaskType.CLASSIFICATION or not hasattr(estimator, 'predict_proba'):
+                # .tolist() converts numpy scalars to Python types for JSON serialization
+                return estimator.predict(transformed).tolist(), confidences, probabilities
+            
+            try:
+                proba = estimator.predict_proba(transformed)
+            except Exception:
+                return estimator.predict(transformed).tolist(), confidences, probabilities
+            
+            predictions = estimator.classes_[np.argmax(proba, axis=1)].tolist()
+            confidences = np.max(proba, axis=1).tolist()
+            if include_probabilities:
+                labels = [str(label) for label in estimator.classes_]
+                probabilities = [dict(zip(labels, row)) for row in proba.tolist()]
+        
+        return predictions, confidences, probabilities
+    
+    def _predict_compiled(
+        self,
+        compiled: CompiledPipeline,
+        encoded: np.ndarray,
+        include_probabilities: bool = False
+    ) -> Tuple[List[Any], List[Optional[float]], List[Optional[Dict[str, float]]]]:
+        """Evaluate an already encoded matrix with the compiled NumPy kernels."""
+        n_rows = encoded.shape[0]
+        if not compiled.is_classifier:
+            return compiled.predict(encoded).tolist(), [None] * n_rows, [None] * n_rows
+        
+        proba = compiled.predict_proba(encoded)
+        predictions = compiled.classes[np.argmax(proba, axis=1)].tolist()
+        confidences = np.max(proba, axis=1).tolist()
+        probabilities: List[Optional[Dict[str, float]]] = [None] * n_rows
+        if include_probabilities:
+            labels = [str(label) for label in compiled.classes]
+            probabilities = [dict(zip(labels, row)) for row in proba.tolist()]
+        return predictions, confidences, probabilities
+    
+    def _predict_records(
+        self,
+        entry: ModelEntry,
+        dataset_info: DatasetInfo,
+        rows: List[Dict[str, Any]],
+        include_probabilities: bool = False
+    ) -> Tuple[List[Any], List[Optional[float]], List[Optional[Dict[str, float]]]]:
+        """
+        Score normalized records, preferring the compiled fast path.
+        
+        Records the compiled tables cannot represent exactly (missing columns,
+        unexpected value types) go through the sklearn pipeline instead.
+        """
+        if entry.compiled is not None:
+            with metrics.stage(entry.dataset_key, "transform"):
+                encoded = entry.compiled.encode(rows)
+            if encoded is not None:
+                with metrics.stage(entry.dataset_key, "model"):
+                    return self._predict_compiled(entry.compiled, encoded, include_probabilities)
+        
+        with metrics.stage(entry.dataset_key, "dataframe"):
+            df = pd.DataFrame(rows)
+        return self._predict_frame(entry.model, dataset_info, df, include_probabilities, entry.dataset_key)
+    
+    def _predict_rows(
+        self,
+        entry: ModelEntry,
+        dataset_info: DatasetInfo,
+        rows: List[Dict[str, Any]],
+        include_probabilities: bool = False
+    ) -> List[BatchOutcome]:
+        """
+        Score rows in a single frame, bisecting on failure to isolate bad rows.
+        
+        A healthy batch costs one pipeline call; each failing row only costs
+        O(log n) extra calls instead of failing the whole batch.
+        """
+        try:
+            predictions, confidences, probabilities = self._predict_records(
+                entry, dataset_info, rows, include_probabilities
+            )
+            return [(p, c, pr, None) for p, c, pr in zip(predictions, confidences, probabilities)]
+        except Exception as e:
+            if len(rows) == 1:
+                return [(None, None, None, str(e))]
+        
+        middle = len(rows) // 2
+        return (
+            self._predict_rows(entry, dataset_info, rows[:middle], include_probabilities)
+            + self._predict_rows(entry, dataset_info, rows[middle:], include_probabilities)
+        )
+    
     def predict(self, dataset_key: str, features: Dict[str, Any]) -> Tuple[Any, Optional[float]]:
         """
         Make a prediction using the specified model.
@@ -178,45 +782,65 @@ class ModelService:
         Returns:
             Tuple of (prediction, confidence)
         """
-        if dataset_key not in self._models:
-            raise ValueError(f"Model '{dataset_key}' not found. Available: {self.get_available_models()}")
+        prediction, confidence, _ = self.predict_with_probabilities(dataset_key, features, False)
+        return prediction, confidence
+    
+    def predict_with_probabilities(
+        self,
+        dataset_key: str,
+        features: Dict[str, Any],
+        include_probabilities: bool = False
+    ) -> Tuple[Any, Optional[float], Optional[Dict[str, float]]]:
+        """
+        Make a prediction and optionally return the class-probability vector.
         
-        model = self._models[dataset_key]
+        Args:
+            dataset_key: Key identifying the model to use
+            features: Dictionary of feature values
+            include_probabilities: Whether to build the class-probability mapping
+            
+        Returns:
+            Tuple of (prediction, confidence, probabilities). ``probabilities``
+            maps each class label to its probability; it is None for regression
+            and unless include_probabilities is set.
+        """
+        entry = self._get_entry(dataset_key)
         dataset_info = self._dataset_info[dataset_key]
         
         # Normalize features using model-specific logic
-        normalized_features = self._normalize_features(dataset_key, features)
-        
-        print(f"📊 Original features: {list(features.keys())}")
-        print(f"📊 Normalized features: {list(normalized_features.keys())}")
+        with metrics.stage(dataset_key, "normalize"):
+            normalized_features = self._normalize_features(dataset_key, features, entry.key_table)
         
-        # Convert features dict to DataFrame
-        df = pd.DataFrame([normalized_features])
+        log_payload(
+            logger,
+            "📊 Features normalizadas",
+            dataset=dataset_key,
+            original_keys=list(features),
+            normalized_keys=list(normalized_features)
+        )
         
-        # Make prediction
-        if isinstance(model, Pipeline):
-            prediction = model.predict(df)[0]
-            
-            # Convert numpy types to Python types for JSON serialization
-            if hasattr(prediction, 'item'):
-                # numpy scalar types have .item() method
-                prediction = prediction.item()
-            elif isinstance(prediction, np.generic):
-                # For other numpy types
-                prediction = prediction.tolist() if hasattr(prediction, 'tolist') else str(prediction)
+        # Make prediction (compiled entries never need the pickle on this path)
+        if entry.compiled is not None or isinstance(entry.model, Pipeline):
+            version = feature_hash = None
+            if self._prediction_cache is not None:
+                version = self._cacheable_version(dataset_key, entry)
+                if version is not None:
+                    feature_hash = PredictionCache.feature_hash(normalized_features, include_probabilities)
+                if feature_hash is not None:
+                    cached = self._prediction_cache.get(dataset_key, version, feature_hash)
+                    if cached is not None:
+                        return cached
             
-            # Get confidence for classification
-            confidence = None
-            if dataset_info.task == TaskType.CLASSIFICATION and hasattr(model, 'predict_proba'):
-                try:
-                    proba = model.predict_proba(df)[0]
-                    confidence = float(np.max(proba))
-                except Exception:
-                    pass
-            
-            return prediction, confidence
+            predictions, confidences, probabilities = self._predict_records(
+                entry, dataset_info, [normalized_features], include_probabilities
+            )
+            result = (predictions[0], confidences[0], probabilities[0])
+            if feature_hash is not None:
+                self._prediction_cache.put(dataset_key, version, feature_hash, result)
+            return result
         
-        elif isinstance(model, dict):  # Recommender system
+        model = entry.model
+        if isinstance(model, dict):  # Recommender system
             # Handle recommendation prediction
             user_id = features.get("user_id")
             movie_id = features.get("movie_id")
@@ -229,14 +853,309 @@ class ModelService:
             movie_bias = model["movie_means"].get(movie_id, global_mean) - global_mean
             prediction = global_mean + user_bias + movie_bias
             
-            return float(prediction), None
+            return float(prediction), None, None
         
         else:
             raise ValueError(f"Unknown model type: {type(model)}")
     
+    def predict_batch(
+        self,
+        dataset_key: str,
+        records: List[Dict[str, Any]],
+        include_probabilities: bool = False
+    ) -> List[BatchOutcome]:
+        """
+        Make predictions for many records with a single pipeline call.
+        
+        All records are normalized in one pass and scored as one DataFrame.
+        Records that cannot be normalized or scored get an error message
+        instead of failing the whole batch.
+        
+        Args:
+            dataset_key: Key identifying the model to use
+            records: List of feature dictionaries
+            include_probabilities: Whether to return class-probability vectors
+            
+        Returns:
+            List of (prediction, confidence, probabilities, error) tuples, one per record
+        """
+        entry = self._get_entry(dataset_key)
+        dataset_info = self._dataset_info[dataset_key]
+        
+        results: List[BatchOutcome] = [(None, None, None, None)] * len(records)
+        
+        if entry.compiled is None and not isinstance(entry.model, Pipeline):
+            # Non-pipeline models have no vectorized path; score record by record
+            for position, features in enumerate(records):
+                try:
+                    prediction, confidence, probabilities = self.predict_with_probabilities(
+                        dataset_key, features, include_probabilities
+                    )
+                    results[position] = (prediction, confidence, probabilities, None)
+                except Exception as e:
+                    results[position] = (None, None, None, str(e))
+            return results
+        
+        required = entry.feature_names
+        rows: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        with metrics.stage(dataset_key, "normalize"):
+            for position, features in enumerate(records):
+                try:
+                    normalized_features = self._normalize_features(dataset_key, features, entry.key_table)
+                except Exception as e:
+                    results[position] = (None, None, None, str(e))
+                    continue
+                
+                # A single-row frame would fail on missing columns, so reject the
+                # record here instead of letting the batch frame fill them with NaN
+                if required is not None:
+                    missing = set(required) - normalized_features.keys()
+                    if missing:
+                        results[position] = (None, None, None, f"columns are missing: {missing}")
+                        continue
+                
+                rows.append(normalized_features)
+                positions.append(position)
+        
+        if rows:
+            outcomes = self._predict_rows(entry, dataset_info, rows, include_probabilities)
+            for position, outcome in zip(positions, outcomes):
+                results[position] = outcome
+        
+        return results
+    
+    @classmethod
+    def _numeric_columns(cls, entry: ModelEntry) -> List[str]:
+        """Input columns the model imputes and scales as numbers."""
+        if entry.compiled is not None:
+            return cls._numeric_input_columns(None, entry.compiled) or []
+        return cls._numeric_input_columns(entry.model, None) or []
+    
+    @staticmethod
+    def _numeric_input_columns(model: Any, compiled: Optional[CompiledPipeline]) -> Optional[List[str]]:
+        """Numeric input columns of a model, or None if it has no column transformer to tell."""
+        if compiled is not None:
+            return [column for block in compiled.numeric for column in block.columns]
+        steps = getattr(model, "steps", None)
+        transformers = getattr(steps[0][1], "transformers_", None) if steps else None
+        if transformers is None:
+            return None
+        for name, _, columns in transformers:
+            if name == "num":
+                return list(columns)
+        return []
+    
+    def _score_compiled_frame(
+        self,
+        entry: ModelEntry,
+        frame: pd.DataFrame,
+        include_probabilities: bool = False
+    ) -> Optional[Tuple[List[Any], List[Optional[float]], List[Optional[Dict[str, float]]]]]:
+        """Encode and evaluate a frame in row blocks that fit ENCODE_BLOCK_BYTES, or None."""
+        compiled = entry.compiled
+        block_rows = max(1, ENCODE_BLOCK_BYTES // (8 * compiled.n_features_out))
+        predictions: List[Any] = []
+        confidences: List[Optional[float]] = []
+        probabilities: List[Optional[Dict[str, float]]] = []
+        for start in range(0, len(frame), block_rows):
+            with metrics.stage(entry.dataset_key, "transform"):
+                encoded = compiled.encode_frame(frame.iloc[start:start + block_rows])
+            if encoded is None:
+                return None
+            with metrics.stage(entry.dataset_key, "model"):
+                block = self._predict_compiled(compiled, encoded, include_probabilities)
+            predictions += block[0]
+            confidences += block[1]
+            probabilities += block[2]
+        return predictions, confidences, probabilities
+    
+    def score_frame(
+        self,
+        dataset_key: str,
+        df: pd.DataFrame,
+        include_probabilities: bool = False
+    ) -> pd.DataFrame:
+        """
+        Score a chunk of an uploaded table in one vectorized call.
+        
+        Column names go through the same rules as the training loaders
+        (``data_loading._normalize_columns``), numeric columns are parsed the
+        way ``_clean_numeric_value`` parses JSON strings, and the frame is
+        encoded column-wise for the compiled kernels. Chunks the compiled
+        tables cannot represent use the sklearn pipeline; if that fails too,
+        rows are bisected as in ``predict_batch`` so only bad rows get errors.
+        
+        Args:
+            dataset_key: Key identifying the model to use
+            df: Raw rows as read from the CSV
+            include_probabilities: Whether to add one ``probability_<class>`` column per class
+            
+        Returns:
+            Frame aligned with ``df`` with ``prediction``, ``confidence`` and ``error`` columns
+            
+        Raises:
+            ValueError: If the model cannot score tables or required columns are missing
+        """
+        entry = self._get_entry(dataset_key)
+        dataset_info = self._dataset_info[dataset_key]
+        if entry.compiled is None and not isinstance(entry.model, Pipeline):
+            raise ValueError(f"Model '{dataset_key}' does not support file scoring")
+        
+        with metrics.stage(dataset_key, "normalize"):
+            frame = _normalize_columns(df)
+            for column, value in _FEATURE_DEFAULTS.get(dataset_key, {}).items():
+                if column not in frame.columns:
+                    frame[column] = value
+            required = entry.feature_names or list(frame.columns)
+            missing = set(required) - set(frame.columns)
+            if missing:
+                raise ValueError(f"columns are missing: {missing}")
+            frame = frame[required]
+            for column in self._numeric_columns(entry):
+                dtype = frame[column].dtype
+                if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+                    frame[column] = _clean_numeric_strings(frame[column])
+        
+        result = pd.DataFrame(index=df.index, columns=["prediction", "confidence", "error"], dtype=object)
+        if frame.empty:
+            return result
+        
+        try:
+            scored = None
+            if entry.compiled is not None:
+                scored = self._score_compiled_frame(entry, frame, include_probabilities)
+            if scored is None:
+                scored = self._predict_frame(entry.model, dataset_info, frame, include_probabilities, dataset_key)
+            predictions, confidences, probabilities = scored
+            errors: List[Optional[str]] = [None] * len(frame)
+        except Exception:
+            rows = frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+            outcomes = self._predict_rows(entry, dataset_info, rows, include_probabilities)
+            predictions, confidences, probabilities, errors = (list(values) for values in zip(*outcomes))
+        
+        result["prediction"] = predictions
+        result["confidence"] = confidences
+        result["error"] = errors
+        if include_probabilities and any(probabilities):
+            per_class = pd.DataFrame.from_records(
+                [row or {} for row in probabilities], index=df.index
+            ).add_prefix("probability_")
+            result = pd.concat([result, per_class], axis=1)
+        return result
+    
+    def forecast(
+        self,
+        dataset_key: str,
+        features: Dict[str, Any],
+        horizon: int,
+        impute_missing: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Forecast a time series several steps ahead by feeding predictions back.
+        
+        The history of the series is copied from the online feature store into
+        its fixed-size ring buffer; every step writes the lag/rolling features
+        into one preallocated encoded row and evaluates all trees at once
+        through the compiled kernel (or a preallocated one-row frame through
+        the pipeline when the model is not compiled). Exogenous features are
+        held constant over the horizon, so a missing one is rejected rather
+        than silently replaced by its training median for every step.
+        
+        Args:
+            dataset_key: Key identifying a time-series model
+            features: Exogenous features (and series keys, if any)
+            horizon: Number of steps to forecast
+            impute_missing: Fill missing or empty exogenous features with the
+                model's imputation values instead of rejecting the request
+            
+        Returns:
+            Predictions per step, the last observed timestamp, the step spacing
+            and the exogenous features that were imputed
+            
+        Raises:
+            MissingFeaturesError: If exogenous features are missing and impute_missing is False
+            ValueError: If the model is not a time series or the features are invalid
+        """
+        entry = self._get_entry(dataset_key)
+        dataset_info = self._dataset_info[dataset_key]
+        if not feature_store.supports(dataset_info):
+            raise ValueError(f"Model '{dataset_key}' is not a time-series model")
+        
+        with metrics.stage(dataset_key, "normalize"):
+            normalized = self._normalize_features(dataset_key, features, entry.key_table)
+        group = {key: normalized.get(key) for key in dataset_info.group_keys or []}
+        buffer = feature_store.snapshot(dataset_key, dataset_info, group)
+        history_columns = [
+            name for name in dataset_info.time_series_features.feature_names
+            if entry.feature_names is None or name in entry.feature_names
+        ]
+        defaults = _FEATURE_DEFAULTS.get(dataset_key, {})
+        missing = [
+            name for name in entry.feature_names or []
+            if name not in history_columns and name not in defaults and _is_blank(normalized.get(name))
+        ]
+        if missing and not impute_missing:
+            raise MissingFeaturesError(missing)
+        for name in missing:
+            # NaN goes through the imputers of both the compiled tables and the pipeline
+            normalized[name] = math.nan
+        predictions = np.empty(horizon)
+        
+        compiled = entry.compiled
+        row = compiled.encode([normalized]) if compiled is not None else None
+        if row is not None:
+            slots = [compiled.numeric_slot(name) for name in history_columns]
+            for step in range(horizon):
+                history = buffer.features()
+                for name, (index, fill, mean, scale) in zip(history_columns, slots):
+                    value = history[name]
+                    row[0, index] = ((fill if math.isnan(value) else value) - mean) / scale
+                predictions[step] = compiled.predict(row)[0]
+                buffer.append(float(predictions[step]))
+        else:
+            model = entry.model
+            if not isinstance(model, Pipeline):
+                raise ValueError(f"Unknown model type: {type(model)}")
+            frame = pd.DataFrame([normalized], columns=entry.feature_names)
+            positions = [frame.columns.get_loc(name) for name in history_columns]
+            for position in positions:
+                frame.isetitem(position, frame.iloc[:, position].astype("float64"))
+            for step in range(horizon):
+                history = buffer.features()
+                for name, position in zip(history_columns, positions):
+                    frame.iat[0, position] = history[name]
+                predictions[step] = float(model.predict(frame)[0])
+                buffer.append(float(predictions[step]))
+        
+        return {
+            "predictions": predictions.tolist(),
+            "last_timestamp": buffer.last_timestamp,
+            "step": buffer.step,
+            "imputed": missing,
+        }
+    
     def get_models_count(self) -> int:
-        """Get the number of loaded models."""
-        return len(self._models)
+        """Get the number of available models (resident or loadable on demand)."""
+        return len(self._model_paths)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get residency and hit/miss/eviction counters of the model cache."""
+        with self._lock:
+            return {
+                "lazy": self._lazy,
+                "resident": len(self._models),
+                "resident_mb": round(sum(e.size_bytes for e in self._models.values()) / (1024 * 1024), 2),
+                "max_models": self._max_models,
+                "max_memory_mb": round(self._max_bytes / (1024 * 1024), 2),
+                **self._cache_stats,
+            }
+    
+    def get_prediction_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get size and per-model hit ratios of the prediction cache, None if disabled."""
+        if self._prediction_cache is None:
+            return None
+        return self._prediction_cache.stats()
 
 
 # Global singleton instance
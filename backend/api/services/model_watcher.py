@@ -0,0 +1,84 @@
+"""Background watcher that hot-reloads retrained model artifacts."""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from ..logging_config import get_logger
+from .model_service import ModelService, model_service
+
+logger = get_logger(__name__)
+
+# JARVIS_MODEL_WATCH_INTERVAL > 0 polls the artifacts of resident models every
+# N seconds and reloads the ones that changed (0 = disabled, reload through
+# POST /admin/models/{dataset_key}/reload instead).
+MODEL_WATCH_INTERVAL = float(os.getenv("JARVIS_MODEL_WATCH_INTERVAL", "0"))
+
+
+class ModelWatcher:
+    """
+    Poll model artifacts and reload the ones that changed on disk.
+
+    A change is only acted on once the same (mtime, size) is seen on two
+    consecutive polls, so a pickle that is still being written by the
+    training pipeline is never loaded half-way.
+    """
+
+    def __init__(self, service: ModelService, interval: float):
+        """
+        Args:
+            service: Model service whose resident models are watched
+            interval: Seconds between polls
+        """
+        self.service = service
+        self.interval = interval
+        self._pending: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check_once(self) -> List[str]:
+        """Run one poll and return the keys of the models that were reloaded."""
+        changed = self.service.get_changed_models()
+        reloaded = []
+        for dataset_key, disk_version in changed.items():
+            if disk_version is None or self._pending.get(dataset_key) != disk_version:
+                # Missing or still changing: wait for the next poll
+                self._pending[dataset_key] = disk_version
+                continue
+            del self._pending[dataset_key]
+            try:
+                self.service.reload_model(dataset_key)
+                reloaded.append(dataset_key)
+            except ValueError:
+                pass  # Already reported by the service; the old version keeps serving
+        for dataset_key in list(self._pending):
+            if dataset_key not in changed:
+                del self._pending[dataset_key]
+        return reloaded
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check_once()
+            except Exception as e:
+                logger.exception("⚠ Error revisando modelos: %s", e)
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="model-watcher", daemon=True)
+        self._thread.start()
+        logger.info("👀 Vigilando modelos cada %gs", self.interval)
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# Global instance, started by the API only when an interval is configured
+model_watcher = ModelWatcher(model_service, MODEL_WATCH_INTERVAL)
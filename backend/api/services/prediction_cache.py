@@ -0,0 +1,120 @@
+"""In-process cache of prediction results."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PredictionCache:
+    """
+    Bounded LRU cache with per-entry TTL for single-record predictions.
+
+    Entries are keyed by ``(dataset_key, model version, feature hash)`` so a
+    new artifact never serves results computed by the previous one, and
+    ``sync_version`` drops a model's entries as soon as its version changes.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float = 300.0):
+        """
+        Args:
+            max_entries: Maximum cached results across all models
+            ttl_seconds: Lifetime of a cached result, 0 for no expiry
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Tuple[str, Hashable, str], Tuple[float, Any]]" = OrderedDict()
+        self._versions: Dict[str, Hashable] = {}
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions = 0
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def feature_hash(features: Dict[str, Any], *extra: Any) -> Optional[str]:
+        """
+        Hash a feature dictionary independently of key order.
+
+        Returns None when the values cannot be serialized, meaning the
+        request should bypass the cache.
+        """
+        try:
+            canonical = json.dumps([features, extra], sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def sync_version(self, dataset_key: str, version: Hashable) -> None:
+        """Record the current artifact version, dropping entries of older ones."""
+        with self._lock:
+            previous = self._versions.get(dataset_key)
+            if previous == version:
+                return
+            self._versions[dataset_key] = version
+            if previous is None:
+                return
+            stale = [key for key in self._entries if key[0] == dataset_key]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += 1
+            logger.info("♻ Caché de predicciones invalidada para %s", dataset_key, extra={"entries": len(stale)})
+
+    def get(self, dataset_key: str, version: Hashable, feature_hash: str) -> Optional[Any]:
+        """Return the cached result, or None on a miss or expired entry."""
+        key = (dataset_key, version, feature_hash)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                stored_at, value = item
+                if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self._hits[dataset_key] = self._hits.get(dataset_key, 0) + 1
+                    return value
+            self._misses[dataset_key] = self._misses.get(dataset_key, 0) + 1
+            return None
+
+    def put(self, dataset_key: str, version: Hashable, feature_hash: str, value: Any) -> None:
+        """Store a result, evicting the least recently used entries over the bound."""
+        with self._lock:
+            key = (dataset_key, version, feature_hash)
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached result (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, eviction counters and per-model hit ratios."""
+        with self._lock:
+            per_model = {}
+            for dataset_key in sorted(self._hits.keys() | self._misses.keys()):
+                hits = self._hits.get(dataset_key, 0)
+                misses = self._misses.get(dataset_key, 0)
+                per_model[dataset_key] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                }
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "models": per_model,
+            }
@@ -10,6 +10,10 @@ from typing import Optional, Tuple
 from google.cloud import speech_v1 as speech
 from google.api_core.exceptions import GoogleAPIError
 
+from ..logging_config import get_logger, log_payload
+
+logger = get_logger(__name__)
+
 
 class SpeechToTextService:
     """Service for converting audio to text using Google Cloud Speech-to-Text."""
@@ -26,11 +30,10 @@ class SpeechToTextService:
         
         if credentials_path and os.path.exists(credentials_path):
             self._credentials_configured = True
-            print(f"✓ Google Cloud credentials encontradas: {credentials_path}")
+            logger.info("✓ Google Cloud credentials encontradas", extra={"credentials_path": credentials_path})
         else:
             self._credentials_configured = False
-            print("⚠ Google Cloud credentials NO configuradas")
-            print("  Configure la variable GOOGLE_APPLICATION_CREDENTIALS")
+            logger.warning("⚠ Google Cloud credentials NO configuradas. Configure la variable GOOGLE_APPLICATION_CREDENTIALS")
     
     def _get_client(self) -> speech.SpeechClient:
         """Get or create Speech-to-Text client."""
@@ -92,37 +95,39 @@ class SpeechToTextService:
         audio = speech.RecognitionAudio(content=audio_content)
         
         try:
-            print(f"🎤 Enviando a Google Speech API...")
-            print(f"   - Audio size: {len(audio_content)} bytes")
-            print(f"   - Language: {language_code}")
-            print(f"   - Sample rate: {sample_rate_hertz}")
-            print(f"   - Encoding: {encoding}")
+            logger.debug(
+                "🎤 Enviando a Google Speech API",
+                extra={
+                    "audio_bytes": len(audio_content),
+                    "language": language_code,
+                    "sample_rate": sample_rate_hertz,
+                    "encoding": str(encoding),
+                }
+            )
             
             # Perform recognition
             response = client.recognize(config=config, audio=audio)
             
-            print(f"📤 Respuesta recibida de Google")
-            print(f"   - Número de resultados: {len(response.results) if response.results else 0}")
-            
             # Extract best result
             if response.results:
                 result = response.results[0]
-                print(f"   - Resultado tiene {len(result.alternatives)} alternativas")
                 if result.alternatives:
                     alternative = result.alternatives[0]
                     transcript = alternative.transcript
                     confidence = alternative.confidence
-                    print(f"✅ Transcripción exitosa: '{transcript}' (confianza: {confidence})")
+                    logger.debug(
+                        "✅ Transcripción exitosa",
+                        extra={"results": len(response.results), "confidence": confidence}
+                    )
+                    log_payload(logger, "🎤 Transcripción", transcript=transcript)
                     return transcript, confidence
             
             # No speech detected
-            print("⚠️ No se detectó voz en el audio")
+            logger.debug("⚠️ No se detectó voz en el audio")
             return "", 0.0
             
         except GoogleAPIError as e:
-            print(f"❌ GoogleAPIError: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ GoogleAPIError")
             raise GoogleAPIError(f"Google Speech API error: {str(e)}") from e
     
     def transcribe_base64_audio(
@@ -141,12 +146,9 @@ class SpeechToTextService:
             Tuple of (transcribed_text, confidence_score)
         """
         # Decode base64 audio
-        print(f"📥 Decodificando base64 audio: {len(audio_base64)} caracteres")
         audio_content = base64.b64decode(audio_base64)
-        print(f"📥 Audio decodificado: {len(audio_content)} bytes")
         
         # Try WEBM_OPUS first (browser default)
-        print("🎯 Intentando con WEBM_OPUS encoding...")
         try:
             transcript, confidence = self.transcribe_audio(
                 audio_content=audio_content,
@@ -159,10 +161,9 @@ class SpeechToTextService:
             if transcript:  # Si obtenemos transcripción, retornar
                 return transcript, confidence
             
-            print("⚠️ WEBM_OPUS no detectó voz. Intentando con ENCODING_UNSPECIFIED...")
+            logger.debug("⚠️ WEBM_OPUS no detectó voz. Intentando con ENCODING_UNSPECIFIED...")
         except Exception as e:
-            print(f"⚠️ Error con WEBM_OPUS: {str(e)}")
-            print("🔄 Intentando con ENCODING_UNSPECIFIED...")
+            logger.warning("⚠️ Error con WEBM_OPUS, se intenta con ENCODING_UNSPECIFIED: %s", e)
         
         # Fallback: Let Google auto-detect the encoding
         try:
@@ -174,7 +175,7 @@ class SpeechToTextService:
                 use_enhanced=True
             )
         except Exception as e:
-            print(f"❌ Error con ENCODING_UNSPECIFIED: {str(e)}")
+            logger.error("❌ Error con ENCODING_UNSPECIFIED: %s", e)
             # Return empty if all attempts fail
             return "", 0.0
     
@@ -7,6 +7,10 @@ import io
 from pathlib import Path
 from typing import Optional, Tuple
 
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
 try:
     import cv2
     import numpy as np
@@ -15,7 +19,7 @@ try:
     CV2_AVAILABLE = True
 except ImportError:
     CV2_AVAILABLE = False
-    print("⚠ OpenCV no disponible. Captura de video no funcionará.")
+    logger.warning("⚠ OpenCV no disponible. Captura de video no funcionará.")
 
 
 class VideoCapture:
@@ -102,7 +106,7 @@ class VideoCapture:
             window_name: Name of the display window
         """
         if not self.capture:
-            print("Camera not started")
+            logger.warning("Camera not started")
             return
         
         print("Presiona 'q' para salir, 's' para tomar foto")
@@ -128,7 +132,7 @@ class VideoCapture:
                 output_dir.mkdir(exist_ok=True)
                 snapshot_path = output_dir / f"snapshot_{snapshot_count}.jpg"
                 cv2.imwrite(str(snapshot_path), frame)
-                print(f"Foto guardada: {snapshot_path}")
+                logger.info("Foto guardada: %s", snapshot_path)
                 snapshot_count += 1
         
         cv2.destroyAllWindows()
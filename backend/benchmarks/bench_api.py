@@ -0,0 +1,250 @@
+"""Benchmark: end-to-end latency and throughput of the prediction endpoints.
+
+For every dataset key the API serves, sends single predictions
+(``POST /predictions/{key}``) and batches (``POST /predictions/{key}/batch``)
+and reports p50/p95/p99 latency and throughput. Payloads are rows of the
+cleaned dataset sampled with a fixed seed (target dropped), so two runs on
+the same data send exactly the same requests.
+
+Two targets:
+    asgi: the app in-process through httpx's ASGI transport (no network,
+        measures routing, validation, inference and serialization)
+    uvicorn: a local uvicorn subprocess over HTTP (adds the server and
+        the socket round trip)
+
+Results are written to JSON together with the commit, so runs from
+different commits can be compared.
+
+Usage (from backend/):
+    python benchmarks/bench_api.py [--target asgi|uvicorn|both] [--datasets telco_churn wine_quality]
+        [--requests 200] [--batches 20] [--batch-size 100] [--concurrency 1] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import httpx
+import numpy as np
+
+from src.dataset_registry import get_dataset
+
+RESULTS_DIR = BACKEND_DIR / "benchmarks" / "results"
+
+
+def _payloads(dataset_key: str, n_records: int, seed: int) -> List[Dict[str, Any]]:
+    """Dataset rows sampled with replacement as JSON-ready feature dicts (target dropped)."""
+    info = get_dataset(dataset_key)
+    df = info.load_dataframe().drop(columns=[info.target])
+    sample = df.sample(n=n_records, replace=True, random_state=seed)
+    # to_json turns NaN into null and timestamps into ISO strings, as a client would send them
+    return json.loads(sample.to_json(orient="records", date_format="iso"))
+
+
+def _summarize(latencies: List[float], n_errors: int, elapsed: float, rows_per_request: int) -> Dict[str, Any]:
+    ok = len(latencies)
+    ms = np.asarray(latencies) * 1000
+    return {
+        "requests": ok + n_errors,
+        "errors": n_errors,
+        "rows_per_request": rows_per_request,
+        "p50_ms": float(np.percentile(ms, 50)) if ok else None,
+        "p95_ms": float(np.percentile(ms, 95)) if ok else None,
+        "p99_ms": float(np.percentile(ms, 99)) if ok else None,
+        "mean_ms": float(ms.mean()) if ok else None,
+        "max_ms": float(ms.max()) if ok else None,
+        "requests_per_s": ok / elapsed if elapsed > 0 else None,
+        "rows_per_s": ok * rows_per_request / elapsed if elapsed > 0 else None,
+    }
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    url: str,
+    bodies: List[Dict[str, Any]],
+    concurrency: int,
+    rows_per_request: int
+) -> Dict[str, Any]:
+    """Send every body once with ``concurrency`` clients pulling from a shared queue."""
+    latencies: List[float] = []
+    errors: List[int] = []
+    pending = iter(bodies)
+
+    async def worker():
+        for body in pending:
+            start = time.perf_counter()
+            response = await client.post(url, json=body)
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors.append(response.status_code)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    summary = _summarize(latencies, len(errors), elapsed, rows_per_request)
+    summary["error_statuses"] = sorted(set(errors))
+    return summary
+
+
+async def _run_target(client: httpx.AsyncClient, dataset_keys: List[str], args) -> List[Dict[str, Any]]:
+    results = []
+    for key in dataset_keys:
+        singles = _payloads(key, args.requests, args.seed)
+        batches = _payloads(key, args.batches * args.batch_size, args.seed + 1)
+        batch_bodies = [
+            {"records": batches[i:i + args.batch_size]} for i in range(0, len(batches), args.batch_size)
+        ]
+        single_bodies = [{"features": record} for record in singles]
+
+        # Warm up: load the model and fill one-off caches before measuring
+        for body in single_bodies[:args.warmup]:
+            await client.post(f"/predictions/{key}", json=body)
+        if batch_bodies:
+            await client.post(f"/predictions/{key}/batch", json=batch_bodies[0])
+
+        for mode, url, bodies, rows in (
+            ("single", f"/predictions/{key}", single_bodies, 1),
+            ("batch", f"/predictions/{key}/batch", batch_bodies, args.batch_size),
+        ):
+            summary = await _drive(client, url, bodies, args.concurrency, rows)
+            summary.update(dataset=key, mode=mode)
+            results.append(summary)
+            _print_row(summary)
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(port: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    process.kill()
+    raise RuntimeError("El servidor no arrancó a tiempo")
+
+
+async def _asgi(dataset_keys: Optional[List[str]], args) -> List[Dict[str, Any]]:
+    from api.main import app
+    from api.services.model_service import model_service
+
+    keys = dataset_keys or model_service.get_available_models()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
+        return await _run_target(client, keys, args)
+
+
+async def _uvicorn(dataset_keys: Optional[List[str]], args) -> List[Dict[str, Any]]:
+    port = _free_port()
+    server = _start_server(port)
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=None, limits=limits) as client:
+            if dataset_keys is None:
+                response = await client.get("/predictions/datasets")
+                dataset_keys = [dataset["key"] for dataset in response.json()]
+            return await _run_target(client, dataset_keys, args)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def _print_row(summary: Dict[str, Any]) -> None:
+    if summary["p50_ms"] is None:
+        print(f"   {summary['dataset']:<18}{summary['mode']:<8} ❌ {summary['errors']} errores "
+              f"{summary['error_statuses']}")
+        return
+    print(f"   {summary['dataset']:<18}{summary['mode']:<8}"
+          f"{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}{summary['p99_ms']:>9.2f}"
+          f"{summary['requests_per_s']:>10.1f}{summary['rows_per_s']:>12.0f}{summary['errors']:>6}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de latencia y throughput de la API de predicción")
+    parser.add_argument("--target", choices=["asgi", "uvicorn", "both"], default="asgi",
+                        help="App en proceso (ASGI), servidor uvicorn local o ambos")
+    parser.add_argument("--datasets", nargs="+", help="Modelos a medir (por defecto todos los disponibles)")
+    parser.add_argument("--requests", type=int, default=200, help="Predicciones individuales por modelo")
+    parser.add_argument("--batches", type=int, default=20, help="Lotes por modelo")
+    parser.add_argument("--batch-size", type=int, default=100, help="Registros por lote")
+    parser.add_argument("--concurrency", type=int, default=1, help="Clientes concurrentes")
+    parser.add_argument("--warmup", type=int, default=10, help="Peticiones de calentamiento por modelo")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla para generar los payloads")
+    parser.add_argument("--output", type=Path, help="Archivo JSON de resultados (por defecto benchmarks/results/)")
+    args = parser.parse_args()
+
+    targets = ["asgi", "uvicorn"] if args.target == "both" else [args.target]
+    results = []
+    for target in targets:
+        print("=" * 78)
+        print(f"🏎  {target}: {args.requests} individuales, {args.batches} lotes de {args.batch_size}, "
+              f"concurrencia {args.concurrency}")
+        print(f"   {'modelo':<18}{'modo':<8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>10}{'filas/s':>12}"
+              f"{'err':>6}")
+        runner = _asgi if target == "asgi" else _uvicorn
+        for summary in asyncio.run(runner(args.datasets, args)):
+            summary["target"] = target
+            results.append(summary)
+
+    commit = _git_commit()
+    report = {
+        "benchmark": "api",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "requests": args.requests,
+            "batches": args.batches,
+            "batch_size": args.batch_size,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"api_{commit or 'local'}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print("=" * 78)
+    print(f"💾 Resultados guardados en {output}")
+
+
+if __name__ == "__main__":
+    main()
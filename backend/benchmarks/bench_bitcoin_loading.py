@@ -0,0 +1,99 @@
+"""Benchmark: bitcoin CSV ingest, per-cell string cleaning vs. parse-time numbers.
+
+Builds a synthetic replica of ``data/raw/bitcoin_price_training.csv`` repeated
+``--scale`` times (100x by default), checks that ``load_bitcoin_prices``
+returns exactly the frame of the previous implementation, and times both.
+A second replica with "$"-prefixed prices exercises the string fallback.
+
+Usage (from backend/):
+    python benchmarks/bench_bitcoin_loading.py [--scale 100] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from src.data_loading import _drop_unnamed, _normalize_columns, load_bitcoin_prices
+from src.dataset_registry import get_dataset
+
+
+def legacy_load_bitcoin_prices(path: Path) -> pd.DataFrame:
+    """Previous implementation: every non-date cell goes through Python strings."""
+    df = pd.read_csv(path)
+    df = _drop_unnamed(df)
+    df = _normalize_columns(df)
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    numeric_cols = [col for col in df.columns if col != "date"]
+    for col in numeric_cols:
+        df[col] = (
+            df[col]
+            .astype(str)
+            .str.replace(",", "", regex=False)
+            .str.replace("$", "", regex=False)
+        )
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df.dropna(subset=["close"])
+    return df.reset_index(drop=True)
+
+
+def build_replica(source: Path, target: Path, scale: int, currency: bool = False, seed: int = 42) -> None:
+    """Write ``scale`` copies of the raw rows, optionally with "$" on some prices."""
+    raw = pd.read_csv(source, dtype=str, keep_default_na=False)
+    replica = pd.concat([raw] * scale, ignore_index=True)
+    if currency:
+        rng = np.random.default_rng(seed)
+        mask = rng.random(len(replica)) < 0.1
+        replica.loc[mask, "Close"] = "$" + replica.loc[mask, "Close"]
+    replica.to_csv(target, index=False)
+
+
+def _best_time(func, path: Path, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de carga del CSV de Bitcoin")
+    parser.add_argument("--scale", type=int, default=100, help="Veces que se replica el CSV original")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por medición (se toma la mejor)")
+    args = parser.parse_args()
+
+    source = get_dataset("bitcoin_price").path
+    print("=" * 70)
+    print(f"⏱  CARGA DE BITCOIN ({args.scale}x {source.name})")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = {"original": source}
+        for label, currency in (("réplica", False), ("réplica con $", True)):
+            path = Path(tmp) / f"{label.replace(' ', '_')}.csv"
+            build_replica(source, path, args.scale, currency=currency)
+            cases[label] = path
+
+        print(f"{'caso':<16}{'filas':>10}{'anterior':>12}{'nuevo':>12}{'speedup':>10}")
+        for label, path in cases.items():
+            expected = legacy_load_bitcoin_prices(path)
+            assert_frame_equal(load_bitcoin_prices(path), expected, check_exact=True)
+            before = _best_time(legacy_load_bitcoin_prices, path, args.repeat)
+            after = _best_time(load_bitcoin_prices, path, args.repeat)
+            print(f"{label:<16}{len(expected):>10}{before * 1000:>10.1f}ms{after * 1000:>10.1f}ms"
+                  f"{before / after:>9.1f}x")
+
+    print("\n✅ Salida idéntica a la implementación anterior")
+
+
+if __name__ == "__main__":
+    main()
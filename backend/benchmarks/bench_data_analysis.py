@@ -0,0 +1,113 @@
+"""Benchmark: dataset profiling, per-column passes vs. vectorized vs. sketches.
+
+Scales avocado and telco (rows sampled with replacement, fixed seed) and
+times the previous ``build_summary`` (``_summary_for_series`` per column,
+``Counter`` over a Python list for categoricals), the vectorized exact
+profiler and the approximate sketch mode. The exact profiler must return
+the same summary; for the sketches the worst quantile rank error and
+distinct-count error are reported.
+
+Usage (from backend/):
+    python benchmarks/bench_data_analysis.py [--scales 1 10 100] [--datasets avocado_prices telco_churn]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.data_analysis import _summary_for_series, build_summary
+from src.dataset_registry import get_dataset
+
+
+def legacy_summary(df):
+    """Previous build_summary body: one _summary_for_series call per column."""
+    categorical, numerical = [], []
+    for column in df.columns:
+        summary = _summary_for_series(df[column])
+        if pd.api.types.is_numeric_dtype(df[column]):
+            numerical.append(summary.to_dict())
+        else:
+            categorical.append(summary.to_dict())
+    return categorical, numerical
+
+
+def _same(a, b):
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(a[key], b[key]) for key in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) and np.isnan(a):
+        return isinstance(b, float) and np.isnan(b)
+    return a == b
+
+
+def _sketch_errors(df, exact, approximate):
+    """Worst normalized rank error of the quantiles and relative error of distinct counts."""
+    rank_error = distinct_error = 0.0
+    for column in approximate["numerical_columns"]:
+        values = np.sort(df[column["name"]].dropna().to_numpy(dtype=float))
+        for q, estimate in column["stats"]["quantiles"].items():
+            if len(values):
+                low = np.searchsorted(values, estimate, side="left") / len(values)
+                high = np.searchsorted(values, estimate, side="right") / len(values)
+                rank_error = max(rank_error, max(low - float(q), float(q) - high, 0.0))
+    for exact_column, column in zip(exact["categorical_columns"], approximate["categorical_columns"]):
+        unique = exact_column["stats"]["unique"]
+        if unique:
+            distinct_error = max(distinct_error, abs(column["stats"]["unique"] - unique) / unique)
+    return rank_error, distinct_error
+
+
+def _time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del perfilado de datasets")
+    parser.add_argument("--datasets", nargs="+", default=["avocado_prices", "telco_churn"], help="Datasets")
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 10, 100], help="Factores de escala")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones (se reporta la mejor)")
+    args = parser.parse_args()
+
+    print("=" * 92)
+    print("⏱  PERFILADO DE DATASETS (build_summary)")
+    print("=" * 92)
+    print(f"{'dataset':<18}{'filas':>11}{'anterior':>12}{'exacto':>11}{'speedup':>9}"
+          f"{'sketches':>11}{'speedup':>9}{'err rango':>11}")
+    for key in args.datasets:
+        info = get_dataset(key)
+        base = info.load_dataframe()
+        for scale in args.scales:
+            df = base if scale == 1 else base.sample(n=len(base) * scale, replace=True, random_state=42)
+            df = df.reset_index(drop=True)
+
+            exact = build_summary(df, info).to_dict()
+            categorical, numerical = legacy_summary(df)
+            assert _same(exact["categorical_columns"], categorical), f"{key}: categóricas distintas"
+            assert _same(exact["numerical_columns"], numerical), f"{key}: numéricas distintas"
+            approximate = build_summary(df, info, approximate=True).to_dict()
+            rank_error, distinct_error = _sketch_errors(df, exact, approximate)
+
+            before = _time(lambda: legacy_summary(df), 1 if scale >= 100 else args.repeat)
+            after = _time(lambda: build_summary(df, info), args.repeat)
+            sketched = _time(lambda: build_summary(df, info, approximate=True), args.repeat)
+            print(f"{key:<18}{len(df):>11,}{before * 1000:>10.0f}ms{after * 1000:>9.0f}ms{before / after:>8.1f}x"
+                  f"{sketched * 1000:>9.0f}ms{before / sketched:>8.1f}x{rank_error:>10.2%}"
+                  f"  (únicos ±{distinct_error:.1%})")
+
+    print("\n✅ El perfilado exacto coincide con el anterior en todas las columnas")
+
+
+if __name__ == "__main__":
+    main()
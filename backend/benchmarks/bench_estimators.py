@@ -0,0 +1,177 @@
+"""Benchmark: task-default estimators vs. HistGradientBoosting per dataset.
+
+For every regression and classification dataset, splits the cleaned rows
+80/20 (same seed as ``train_dataset``), scales the training split 1x and 10x
+by sampling rows with replacement, and fits the pipeline of each
+``EstimatorBackend`` from ``src.modeling``. The test rows are never
+resampled, so the metrics are on unseen rows at every scale. Measured:
+
+    fit         one ``Pipeline.fit`` on the (scaled) training split
+    predict     p50 of a one-row ``Pipeline.predict``, and of the compiled
+                kernel the API would use when ``compile_pipeline`` supports
+                the pipeline (task defaults only)
+    batch       rows per second predicting the whole test split at once
+    metrics     ``train_dataset``'s metrics on the test split
+
+The default backend is skipped when its dense one-hot matrix would not fit in
+``--train-memory-mb``. Compare two runs with ``benchmarks/compare.py``.
+
+Usage (from backend/):
+    python benchmarks/bench_estimators.py [--datasets avocado_prices telco_churn] [--scales 1 10]
+        [--predict-calls 200] [--output results.json]
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import pickle
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(BACKEND_DIR / "benchmarks"))
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+
+from bench_pipeline import RESULTS_DIR, _dense_width, _git_commit
+from src.dataset_registry import DatasetInfo, EstimatorBackend, TaskType, dataset_keys, get_dataset
+from src.model_compiler import compile_pipeline
+from src.modeling import _build_model, _evaluate_classification, _evaluate_regression, _split_xy
+
+TASKS = (TaskType.REGRESSION, TaskType.CLASSIFICATION)
+
+
+def _split(info: DatasetInfo, seed: int):
+    """The train/test split ``train_dataset`` makes for the task."""
+    X, y = _split_xy(info.load_dataframe(), info)
+    stratify = y if info.task == TaskType.CLASSIFICATION and y.nunique() > 1 else None
+    return train_test_split(X, y, test_size=0.2, random_state=seed, stratify=stratify)
+
+
+def _p50_ms(func, calls: int) -> float:
+    latencies = []
+    for index in range(calls):
+        start = time.perf_counter()
+        func(index)
+        latencies.append(time.perf_counter() - start)
+    return float(np.percentile(latencies, 50) * 1000)
+
+
+def run_case(info: DatasetInfo, backend: EstimatorBackend, X_train, y_train, X_test, y_test, args) -> Dict[str, Any]:
+    info = dataclasses.replace(info, estimator=backend)
+    if backend == EstimatorBackend.DEFAULT:
+        dense_mb = len(X_train) * _dense_width(X_train, info.target) * 8 / (1024 * 1024)
+        if dense_mb > args.train_memory_mb:
+            return {"skipped": f"matriz densa de {dense_mb:,.0f} MB"}
+
+    preprocessor, model = _build_model(X_train, info)
+    pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
+    start = time.perf_counter()
+    pipeline.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = pipeline.predict(X_test)
+    batch_seconds = time.perf_counter() - start
+    evaluate = _evaluate_classification if info.task == TaskType.CLASSIFICATION else _evaluate_regression
+
+    rows = [X_test.iloc[[index % len(X_test)]] for index in range(args.predict_calls)]
+    pipeline.predict(rows[0])  # warm up outside the timing
+    result = {
+        "fit_seconds": fit_seconds,
+        "predict_p50_ms": _p50_ms(lambda index: pipeline.predict(rows[index]), args.predict_calls),
+        "compiled_p50_ms": None,
+        "batch_rows_per_s": len(X_test) / batch_seconds,
+        "model_kb": len(pickle.dumps(pipeline)) / 1024,
+        "metrics": evaluate(y_test, y_pred),
+    }
+    compiled = compile_pipeline(pipeline)
+    if compiled is not None:
+        records = [json.loads(row.to_json(orient="records", date_format="iso"))[0] for row in rows]
+        if compiled.encode(records[:1]) is not None:
+            result["compiled_p50_ms"] = _p50_ms(
+                lambda index: compiled.predict(compiled.encode(records[index:index + 1])), args.predict_calls
+            )
+    return result
+
+
+def _print_row(row: Dict[str, Any]) -> None:
+    prefix = f"   {row['dataset']:<18}{row['backend']:<24}{row['scale']:>4}x{row['rows']:>10,}"
+    if "skipped" in row:
+        print(f"{prefix}   omitido: {row['skipped']}")
+        return
+    compiled = f"{row['compiled_p50_ms']:.3f}" if row["compiled_p50_ms"] is not None else "-"
+    metric = "r2" if "r2" in row["metrics"] else "f1"
+    print(f"{prefix}{row['fit_seconds']:>10.2f}s{row['predict_p50_ms']:>10.3f}{compiled:>10}"
+          f"{row['batch_rows_per_s']:>12,.0f}{row['model_kb']:>10,.0f}   {metric} {row['metrics'][metric]:.4f}")
+
+
+def main():
+    keys = [key for key in dataset_keys() if get_dataset(key).task in TASKS]
+    parser = argparse.ArgumentParser(description="Benchmark de estimadores: por defecto vs. HistGradientBoosting")
+    parser.add_argument("--datasets", nargs="+", choices=keys, help="Datasets (por defecto todos los tabulares)")
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 10], help="Escala del split de entrenamiento")
+    parser.add_argument("--backends", nargs="+", choices=[backend.value for backend in EstimatorBackend],
+                        default=[backend.value for backend in EstimatorBackend], help="Estimadores a comparar")
+    parser.add_argument("--predict-calls", type=int, default=200, help="Predicciones de una fila por modelo")
+    parser.add_argument("--train-memory-mb", type=float, default=1024,
+                        help="Omite el estimador por defecto si la matriz one-hot densa supera este tamaño")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla del split y del muestreo")
+    parser.add_argument("--output", type=Path, help="Archivo JSON de resultados (por defecto benchmarks/results/)")
+    args = parser.parse_args()
+
+    print("=" * 118)
+    print(f"🌲 ESTIMADORES: escalas {args.scales}")
+    print("=" * 118)
+    print(f"   {'dataset':<18}{'estimador':<24}{'escala':>5}{'filas':>10}{'fit':>11}{'p50 ms':>10}{'comp ms':>10}"
+          f"{'filas/s':>12}{'KB':>10}   métrica")
+    results: List[Dict[str, Any]] = []
+    for key in args.datasets or keys:
+        info = get_dataset(key)
+        X_train, X_test, y_train, y_test = _split(info, args.seed)
+        for scale in args.scales:
+            if scale == 1:
+                X_scaled, y_scaled = X_train, y_train
+            else:
+                sample = X_train.sample(n=len(X_train) * scale, replace=True, random_state=args.seed).index
+                X_scaled, y_scaled = X_train.loc[sample].reset_index(drop=True), y_train.loc[sample].reset_index(drop=True)
+            for backend in args.backends:
+                row = {"dataset": key, "backend": backend, "scale": scale, "rows": len(X_scaled)}
+                row.update(run_case(info, EstimatorBackend(backend), X_scaled, y_scaled, X_test, y_test, args))
+                results.append(row)
+                _print_row(row)
+
+    commit = _git_commit()
+    report = {
+        "benchmark": "estimators",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "scales": args.scales,
+            "backends": args.backends,
+            "predict_calls": args.predict_calls,
+            "train_memory_mb": args.train_memory_mb,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"estimators_{commit or 'local'}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print("=" * 118)
+    print(f"💾 Resultados guardados en {output}")
+
+
+if __name__ == "__main__":
+    main()
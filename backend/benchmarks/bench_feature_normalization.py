@@ -0,0 +1,124 @@
+"""Microbenchmark: feature-name normalization before/after memoization.
+
+Compares the original per-request regex normalization against the precompiled,
+memoized path used by ModelService (key table lookup + lru_cache fallback),
+checking first that both produce exactly the same features.
+
+Usage (from backend/):
+    python benchmarks/bench_feature_normalization.py [--iterations N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.services.model_service import ModelService, _normalize_key, build_key_table
+
+
+def legacy_to_snake_case(text):
+    """Original implementation: regexes compiled (cache-looked-up) on every call."""
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+
+
+def legacy_normalize(features):
+    """Original key normalization loop from ModelService._normalize_features."""
+    normalized = {}
+    for key, value in features.items():
+        if key == "pH":
+            normalized_key = "p_h"
+        elif key.startswith("4"):
+            normalized_key = f"col_{key}"
+        elif ' ' in key:
+            normalized_key = key.lower().replace(' ', '_')
+        else:
+            normalized_key = legacy_to_snake_case(key)
+        if isinstance(value, str):
+            try:
+                value = float(value.replace(',', ''))
+            except ValueError:
+                pass
+        normalized[normalized_key] = value
+    return normalized
+
+
+# Representative payloads (telco PascalCase, bitcoin "Title Case", wine pH, avocado PLU codes)
+PAYLOADS = {
+    "telco_churn": {
+        "Gender": "Female", "SeniorCitizen": 0, "Partner": "Yes", "Dependents": "No",
+        "Tenure": 12, "PhoneService": "Yes", "MultipleLines": "No",
+        "InternetService": "Fiber optic", "OnlineSecurity": "No", "OnlineBackup": "Yes",
+        "DeviceProtection": "No", "TechSupport": "No", "StreamingTV": "Yes",
+        "StreamingMovies": "No", "Contract": "Month-to-month", "PaperlessBilling": "Yes",
+        "PaymentMethod": "Electronic check", "MonthlyCharges": 70.35, "TotalCharges": "1,397.47",
+    },
+    "bitcoin": {
+        "Open": "43,000.5", "High": "44,100", "Low": "42,800", "Volume": "28,000,000,000",
+        "Market Cap": "860,575,000,000",
+    },
+    "winequality": {
+        "fixed acidity": 7.4, "volatile acidity": 0.7, "citric acid": 0.0, "residual sugar": 1.9,
+        "chlorides": 0.076, "free sulfur dioxide": 11.0, "total sulfur dioxide": 34.0,
+        "density": 0.9978, "pH": 3.51, "sulphates": 0.56, "alcohol": 9.4,
+    },
+    "avocado": {
+        "AveragePrice": 1.33, "Total Volume": 64236.62, "4046": 1036.74, "4225": 54454.85,
+        "4770": 48.16, "Total Bags": 8696.87, "type": "conventional", "year": 2015,
+        "region": "Albany",
+    },
+}
+
+
+def _time(func, payload, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(payload)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de normalización de nombres de features")
+    parser.add_argument("--iterations", type=int, default=20000, help="Repeticiones por payload")
+    args = parser.parse_args()
+
+    service = ModelService.__new__(ModelService)  # no model loading needed
+    # Without dataset info the online feature store is not consulted, so only
+    # the key and value normalization is timed
+    service._dataset_info = {}
+
+    print("=" * 70)
+    print("⏱  NORMALIZACIÓN DE FEATURES (µs por request)")
+    print("=" * 70)
+    print(f"{'payload':<14}{'original':>12}{'memo':>12}{'memo+tabla':>14}{'speedup':>10}")
+
+    for name, payload in PAYLOADS.items():
+        expected = legacy_normalize(payload)
+        table = build_key_table(list(expected))
+
+        memo = lambda features: service._normalize_features(name, features)
+        tabled = lambda features: service._normalize_features(name, features, table)
+
+        # _normalize_features may append model defaults; compare the shared keys only
+        for func in (memo, tabled):
+            result = func(payload)
+            mismatch = {k for k in expected if result.get(k) != expected[k]}
+            if mismatch:
+                print(f"❌ {name}: salida distinta en {sorted(mismatch)}")
+                return 1
+        assert all(_normalize_key(k) == column for k, (column, _) in table.items())
+
+        before = _time(legacy_normalize, payload, args.iterations)
+        after_memo = _time(memo, payload, args.iterations)
+        after_table = _time(tabled, payload, args.iterations)
+        print(f"{name:<14}{before:>12.2f}{after_memo:>12.2f}{after_table:>14.2f}{before / after_table:>9.1f}x")
+
+    print(f"\n✅ Salidas idénticas. Caché de claves: {_normalize_key.cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
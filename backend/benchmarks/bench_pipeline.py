@@ -0,0 +1,189 @@
+"""Benchmark suite: loaders, profiling, training and prediction per dataset.
+
+For every registered dataset and scale (1x, 10x and 100x by default) writes a
+synthetic raw CSV (rows of the original file sampled with replacement and a
+fixed seed, original spelling kept) and times in isolation:
+
+    load     the dataset's loader from ``data_loading`` on the scaled CSV
+    summary  ``build_summary`` on the loaded frame
+    train    ``train_dataset`` on the loaded frame, written to a temp dir
+    predict  ``ModelService.predict`` per single record (trained models in
+             reports/, scale 1 only since it does not depend on data size)
+
+Training is skipped when the dense one-hot matrix of a task-default estimator
+would not fit in ``--train-memory-mb`` (telco's ``customer_id`` alone has 7k
+categories).
+Results are written to JSON; compare two runs with ``benchmarks/compare.py``.
+
+Usage (from backend/):
+    python benchmarks/bench_pipeline.py [--datasets avocado_prices telco_churn] [--scales 1 10 100]
+        [--cases load summary train predict] [--repeat 3] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import numpy as np
+import pandas as pd
+
+from src.data_analysis import build_summary
+from src.dataset_registry import DatasetInfo, EstimatorBackend, dataset_keys, get_dataset
+from src.modeling import train_dataset
+
+RESULTS_DIR = BACKEND_DIR / "benchmarks" / "results"
+CASES = ("load", "summary", "train", "predict")
+
+
+def write_scaled_csv(info: DatasetInfo, target: Path, scale: int, seed: int = 42) -> int:
+    """Raw rows sampled with replacement, ``scale`` times the original row count."""
+    raw = pd.read_csv(info.path, dtype=str, keep_default_na=False)
+    replica = raw if scale == 1 else raw.sample(n=len(raw) * scale, replace=True, random_state=seed)
+    replica.to_csv(target, index=False)
+    return len(replica)
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _dense_width(df: pd.DataFrame, target: str) -> int:
+    """Columns after one-hot encoding, as built by ``_regression_pipeline``."""
+    features = df.drop(columns=[target], errors="ignore")
+    categorical = features.select_dtypes(exclude=[np.number])
+    return features.shape[1] - categorical.shape[1] + int(categorical.nunique().sum())
+
+
+def _predict_case(key: str, info: DatasetInfo, calls: int, repeat: int, seed: int) -> Optional[Dict[str, Any]]:
+    from api.services.model_service import model_service
+
+    if key not in model_service.get_available_models():
+        return None
+    df = info.load_dataframe().drop(columns=[info.target])
+    sample = df.sample(n=calls, replace=True, random_state=seed)
+    records = json.loads(sample.to_json(orient="records", date_format="iso"))
+    model_service.predict(key, records[0])  # load and compile outside the timing
+
+    def run():
+        for record in records:
+            model_service.predict(key, record)
+
+    return {"seconds": _best_time(run, repeat) / calls, "calls": calls}
+
+
+def run_dataset(key: str, info: DatasetInfo, args, workdir: Path) -> List[Dict[str, Any]]:
+    results = []
+
+    def record(case: str, scale: int, rows: int, **values):
+        row = {"case": case, "dataset": key, "scale": scale, "rows": rows, **values}
+        results.append(row)
+        if "skipped" in row:
+            print(f"   {case:<8}{key:<18}{scale:>5}x{rows:>10,}   omitido: {row['skipped']}")
+        else:
+            print(f"   {case:<8}{key:<18}{scale:>5}x{rows:>10,}{row['seconds'] * 1000:>12.1f} ms")
+
+    loader = info.loader or pd.read_csv
+    for scale in args.scales:
+        if not {"load", "summary", "train"} & set(args.cases):
+            break
+        csv_path = workdir / f"{key}_{scale}x.csv"
+        rows = write_scaled_csv(info, csv_path, scale, args.seed)
+        df = loader(csv_path)
+
+        if "load" in args.cases:
+            record("load", scale, rows, seconds=_best_time(lambda: loader(csv_path), args.repeat))
+        if "summary" in args.cases:
+            record("summary", scale, len(df), seconds=_best_time(lambda: build_summary(df, info), args.repeat))
+        if "train" in args.cases:
+            dense_mb = len(df) * _dense_width(df, info.target) * 8 / (1024 * 1024)
+            # HistGradientBoosting encodes categories as one ordinal column each
+            if info.estimator == EstimatorBackend.DEFAULT and dense_mb > args.train_memory_mb:
+                record("train", scale, len(df), skipped=f"matriz densa de {dense_mb:,.0f} MB")
+            else:
+                report_dir = workdir / "reports"
+                report_dir.mkdir(exist_ok=True)
+                seconds = _best_time(lambda: train_dataset(info, df=df, report_dir=report_dir), 1)
+                record("train", scale, len(df), seconds=seconds)
+        csv_path.unlink()
+
+    if "predict" in args.cases:
+        values = _predict_case(key, info, args.predict_calls, args.repeat, args.seed)
+        if values is not None:
+            record("predict", 1, values["calls"], seconds=values["seconds"])
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de carga, perfilado, entrenamiento y predicción")
+    parser.add_argument("--datasets", nargs="+", choices=dataset_keys(), help="Datasets (por defecto todos)")
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 10, 100], help="Factores de escala")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES), help="Etapas a medir")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones (se reporta la mejor; train corre una vez)")
+    parser.add_argument("--predict-calls", type=int, default=200, help="Predicciones individuales por modelo")
+    parser.add_argument("--train-memory-mb", type=float, default=1024,
+                        help="Omite el entrenamiento si la matriz one-hot densa supera este tamaño")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de los datos sintéticos")
+    parser.add_argument("--output", type=Path, help="Archivo JSON de resultados (por defecto benchmarks/results/)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"⏱  PIPELINE: escalas {args.scales}, etapas {args.cases}")
+    print("=" * 60)
+    print(f"   {'etapa':<8}{'dataset':<18}{'escala':>6}{'filas':>10}{'tiempo':>15}")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for key in args.datasets or dataset_keys():
+            results += run_dataset(key, get_dataset(key), args, Path(tmp))
+
+    commit = _git_commit()
+    report = {
+        "benchmark": "pipeline",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "scales": args.scales,
+            "cases": args.cases,
+            "repeat": args.repeat,
+            "predict_calls": args.predict_calls,
+            "train_memory_mb": args.train_memory_mb,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"pipeline_{commit or 'local'}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print("=" * 60)
+    print(f"💾 Resultados guardados en {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark: bulk scoring of a large CSV through POST /predictions/{key}/score-file.
+
+Writes a synthetic telco CSV (real rows sampled with replacement, original
+column spelling), starts the API with uvicorn in a subprocess and streams the
+file through the endpoint with httpx, reading the NDJSON response line by
+line. The server's resident memory is sampled while the request runs, so the
+reported peak shows whether memory stays bounded by the chunk size instead of
+the file size.
+
+Usage (from backend/):
+    python benchmarks/bench_score_file.py [--rows 1000000] [--chunk-size 10000] [--format ndjson]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import httpx
+import pandas as pd
+import psutil
+
+from src.dataset_registry import get_dataset
+
+
+def _write_synthetic_csv(path: Path, n_rows: int, seed: int = 42, block: int = 100_000) -> None:
+    """Telco rows sampled with replacement, written block by block."""
+    info = get_dataset("telco_churn")
+    raw = pd.read_csv(info.path).drop(columns=["Churn"])
+    written = 0
+    while written < n_rows:
+        size = min(block, n_rows - written)
+        sample = raw.sample(n=size, replace=True, random_state=seed + written)
+        sample.to_csv(path, mode="a", index=False, header=written == 0)
+        written += size
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(port: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    process.kill()
+    raise RuntimeError("El servidor no arrancó a tiempo")
+
+
+def _sample_rss(pid: int, stop: threading.Event, samples: list) -> None:
+    process = psutil.Process(pid)
+    while not stop.is_set():
+        samples.append(process.memory_info().rss)
+        time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de puntuación de archivos CSV por bloques")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Filas del CSV sintético")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Filas por bloque en el servidor")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson", help="Formato de salida")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "telco_synthetic.csv"
+        start = time.perf_counter()
+        _write_synthetic_csv(csv_path, args.rows)
+        size_mb = os.path.getsize(csv_path) / (1024 * 1024)
+        print(f"📄 CSV sintético: {args.rows:,} filas, {size_mb:.0f} MB ({time.perf_counter() - start:.1f} s)")
+
+        port = _free_port()
+        server = _start_server(port)
+        try:
+            # Warm up: load the model before measuring
+            warmup = pd.read_csv(csv_path, nrows=10).to_csv(index=False)
+            httpx.post(
+                f"http://127.0.0.1:{port}/predictions/telco_churn/score-file",
+                files={"file": ("warmup.csv", warmup, "text/csv")},
+                timeout=60,
+            ).raise_for_status()
+            baseline_mb = psutil.Process(server.pid).memory_info().rss / (1024 * 1024)
+
+            samples: list = []
+            stop = threading.Event()
+            sampler = threading.Thread(target=_sample_rss, args=(server.pid, stop, samples), daemon=True)
+            sampler.start()
+
+            n_lines = n_errors = 0
+            first_row_s = None
+            start = time.perf_counter()
+            with open(csv_path, "rb") as handle:
+                with httpx.stream(
+                    "POST",
+                    f"http://127.0.0.1:{port}/predictions/telco_churn/score-file",
+                    params={"format": args.format, "chunk_size": args.chunk_size},
+                    files={"file": ("telco_synthetic.csv", handle, "text/csv")},
+                    timeout=None,
+                ) as response:
+                    response.raise_for_status()
+                    upload_s = time.perf_counter() - start
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        if first_row_s is None:
+                            first_row_s = time.perf_counter() - start
+                        n_lines += 1
+                        if args.format == "ndjson" and '"error":null' not in line:
+                            n_errors += 1
+            elapsed = time.perf_counter() - start
+            stop.set()
+            sampler.join()
+        finally:
+            server.terminate()
+            server.wait()
+
+    n_rows = n_lines - 1 if args.format == "csv" else n_lines
+    peak_mb = max(samples) / (1024 * 1024) if samples else float("nan")
+    print("=" * 70)
+    print(f"🏁 {n_rows:,} filas puntuadas en {elapsed:.1f} s ({n_rows / elapsed:,.0f} filas/s)")
+    print(f"   Subida del archivo: {upload_s:.1f} s, primera fila: {first_row_s:.1f} s")
+    print(f"   Filas con error: {n_errors}")
+    print(f"   RSS del servidor: base {baseline_mb:.0f} MB, pico {peak_mb:.0f} MB "
+          f"(+{peak_mb - baseline_mb:.0f} MB con bloques de {args.chunk_size:,} filas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark: peak memory of streaming profiling vs. loading the whole file.
+
+Writes scaled raw CSVs (as ``bench_pipeline.py``) and profiles each one in a
+fresh subprocess, so the reported peak RSS belongs to that run alone:
+
+    memoria     loader + ``build_summary(approximate=True)`` on the full frame
+    streaming   ``build_streaming_summary`` reading ``--chunksize`` rows at a time
+
+The streaming peak should stay flat as the file grows. The streamed summary
+is checked against the in-memory one: row and missing counts, min and max
+must match exactly; the worst quantile rank error is reported.
+
+Usage (from backend/):
+    python benchmarks/bench_streaming_summary.py [--datasets avocado_prices telco_churn]
+        [--scales 1 10 100] [--chunksize 100000]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(BACKEND_DIR / "benchmarks"))
+
+import numpy as np
+
+from bench_pipeline import write_scaled_csv
+from src.data_loading import CHUNK_ROWS
+from src.dataset_registry import get_dataset
+
+# Runs in the subprocess: profile one file and print the summary with the peak RSS
+_PROFILE_SCRIPT = """
+import json, resource, sys, time
+from pathlib import Path
+sys.path.insert(0, {backend!r})
+from src.data_analysis import build_streaming_summary, build_summary
+from src.dataset_registry import get_dataset
+
+info = get_dataset({key!r})
+start = time.perf_counter()
+if {streaming!r}:
+    summary = build_streaming_summary(info, path={path!r}, chunksize={chunksize!r})
+else:
+    loader = info.loader
+    summary = build_summary(loader({path!r}), info, approximate=True)
+seconds = time.perf_counter() - start
+status = Path("/proc/self/status")
+if status.exists():  # VmHWM starts over at exec; ru_maxrss keeps the forking parent's peak
+    peak_kb = next(int(line.split()[1]) for line in status.read_text().splitlines() if line.startswith("VmHWM"))
+else:
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+peak_mb = peak_kb / 1024
+print(json.dumps({{"seconds": seconds, "peak_mb": peak_mb, "summary": summary.to_dict()}}))
+"""
+
+
+def _profile(key: str, path: Path, streaming: bool, chunksize: int) -> dict:
+    script = _PROFILE_SCRIPT.format(
+        backend=str(BACKEND_DIR), key=key, path=str(path), streaming=streaming, chunksize=chunksize
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def _check(loaded: dict, streamed: dict, path: Path, key: str) -> float:
+    """Assert the exact fields match and return the worst quantile rank error."""
+    assert loaded["n_rows"] == streamed["n_rows"], f"{key}: filas distintas"
+    for kind in ("categorical_columns", "numerical_columns"):
+        for a, b in zip(loaded[kind], streamed[kind], strict=True):
+            assert (a["name"], a["n_missing"]) == (b["name"], b["n_missing"]), f"{key}.{a['name']}: faltantes"
+            for stat in ("min", "max"):
+                if stat in a["stats"]:
+                    assert np.isclose(a["stats"][stat], b["stats"][stat], equal_nan=True), f"{key}.{a['name']}: {stat}"
+
+    info = get_dataset(key)
+    df = info.loader(path)
+    rank_error = 0.0
+    for column in streamed["numerical_columns"]:
+        values = np.sort(df[column["name"]].dropna().to_numpy(dtype=float))
+        for q, estimate in column["stats"]["quantiles"].items():
+            if len(values):
+                low = np.searchsorted(values, estimate, side="left") / len(values)
+                high = np.searchsorted(values, estimate, side="right") / len(values)
+                rank_error = max(rank_error, low - float(q), float(q) - high)
+    return rank_error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memoria del perfilado en streaming")
+    parser.add_argument("--datasets", nargs="+", default=["avocado_prices", "telco_churn"], help="Datasets")
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 10, 100], help="Factores de escala")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="Filas por bloque en streaming")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de los datos sintéticos")
+    args = parser.parse_args()
+
+    print("=" * 90)
+    print(f"💾 PERFILADO EN STREAMING (bloques de {args.chunksize:,} filas)")
+    print("=" * 90)
+    print(f"{'dataset':<18}{'filas':>11}{'CSV MB':>9}{'memoria':>11}{'pico MB':>9}"
+          f"{'streaming':>11}{'pico MB':>9}{'err rango':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for key in args.datasets:
+            info = get_dataset(key)
+            for scale in args.scales:
+                path = Path(tmp) / f"{key}_{scale}x.csv"
+                rows = write_scaled_csv(info, path, scale, args.seed)
+                loaded = _profile(key, path, streaming=False, chunksize=args.chunksize)
+                streamed = _profile(key, path, streaming=True, chunksize=args.chunksize)
+                rank_error = _check(loaded["summary"], streamed["summary"], path, key)
+                print(f"{key:<18}{rows:>11,}{path.stat().st_size / 2**20:>9.1f}"
+                      f"{loaded['seconds']:>10.2f}s{loaded['peak_mb']:>9.0f}"
+                      f"{streamed['seconds']:>10.2f}s{streamed['peak_mb']:>9.0f}{rank_error:>10.2%}")
+                path.unlink()
+
+    print("\n✅ Conteos, faltantes, mínimos y máximos coinciden con el perfilado en memoria")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Regression gate: compare a benchmark run against a stored baseline.
+
+Works on the JSON written by ``bench_pipeline.py`` (compares ``seconds``),
+``bench_api.py`` (compares ``p50_ms`` and ``p95_ms``) and ``bench_estimators.py``
+(compares ``fit_seconds`` and ``predict_p50_ms``). A case regresses when
+it is more than ``--threshold`` slower than the baseline *and* the absolute
+difference exceeds ``--min-delta-ms``, so a few milliseconds of noise on tiny cases
+does not fail the gate. Exits with status 1 if any case regressed.
+
+Usage (from backend/):
+    python benchmarks/bench_pipeline.py --output benchmarks/results/baseline.json   # once, on main
+    python benchmarks/bench_pipeline.py --output benchmarks/results/current.json    # on the branch
+    python benchmarks/compare.py benchmarks/results/baseline.json benchmarks/results/current.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Fields identifying a case, and compared metrics with their factor to seconds
+IDENTITY = {
+    "pipeline": ("case", "dataset", "scale"),
+    "api": ("target", "dataset", "mode"),
+    "estimators": ("backend", "dataset", "scale"),
+}
+METRICS = {
+    "pipeline": {"seconds": 1.0},
+    "api": {"p50_ms": 1e-3, "p95_ms": 1e-3},
+    "estimators": {"fit_seconds": 1.0, "predict_p50_ms": 1e-3},
+}
+
+
+def _load(path: Path) -> Dict[str, Any]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    if report.get("benchmark") not in IDENTITY:
+        raise ValueError(f"{path} is not a pipeline, API or estimators benchmark report")
+    return report
+
+
+def _index(report: Dict[str, Any]) -> Dict[Tuple, Dict[str, Any]]:
+    fields = IDENTITY[report["benchmark"]]
+    return {tuple(row.get(field) for field in fields): row for row in report["results"]}
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    min_delta_ms: float
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Pair the cases of both runs and classify each metric.
+
+    Returns:
+        (rows, regressions): every compared metric with its relative change,
+        and the subset that regressed
+    """
+    if baseline["benchmark"] != current["benchmark"]:
+        raise ValueError(f"Cannot compare a {baseline['benchmark']} run with a {current['benchmark']} run")
+    metrics = METRICS[current["benchmark"]]
+    before = _index(baseline)
+    rows, regressions = [], []
+    for key, row in _index(current).items():
+        old = before.get(key)
+        if old is None:
+            continue
+        for metric, to_seconds in metrics.items():
+            if old.get(metric) is None or row.get(metric) is None:
+                continue  # skipped or failed in one of the runs
+            delta_ms = (row[metric] - old[metric]) * to_seconds * 1000
+            change = row[metric] / old[metric] - 1 if old[metric] > 0 else 0.0
+            entry = {"case": key, "metric": metric, "baseline": old[metric], "current": row[metric], "change": change}
+            rows.append(entry)
+            if change > threshold and delta_ms > min_delta_ms:
+                regressions.append(entry)
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara una corrida de benchmark con la línea base")
+    parser.add_argument("baseline", type=Path, help="JSON de la línea base")
+    parser.add_argument("current", type=Path, help="JSON de la corrida a evaluar")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Aumento relativo que cuenta como regresión (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0,
+                        help="Diferencia absoluta mínima para contar como regresión")
+    args = parser.parse_args()
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    rows, regressions = compare(baseline, current, args.threshold, args.min_delta_ms)
+
+    print("=" * 86)
+    print(f"📊 {current['benchmark']}: {baseline.get('commit')} → {current.get('commit')} "
+          f"(umbral {args.threshold:.0%}, mínimo {args.min_delta_ms} ms)")
+    print("=" * 86)
+    flagged = {id(entry) for entry in regressions}
+    for entry in rows:
+        marker = "❌" if id(entry) in flagged else ("✅" if entry["change"] < -args.threshold else "  ")
+        case = " ".join(str(part) for part in entry["case"])
+        print(f"{marker} {case:<40}{entry['metric']:<9}{entry['baseline']:>12.4g}{entry['current']:>12.4g}"
+              f"{entry['change']:>+10.1%}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regresiones de {len(rows)} métricas comparadas")
+        sys.exit(1)
+    print(f"\n✅ Sin regresiones en {len(rows)} métricas comparadas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Load test: blocking inference inline vs. in the bounded executor.
+
+Runs the FastAPI app in-process (httpx + ASGI transport). Several clients send
+batch predictions while a probe measures event-loop lag (how late a short
+sleep wakes up): with inference inline every batch stalls the loop, so any
+other request (health checks, cheap predictions) waits behind it. Throughput
+gains need more than one core, since workers run in parallel only where
+NumPy/scikit-learn release the GIL.
+
+Usage (from backend/):
+    python benchmarks/load_test_inference.py [--clients 8] [--requests 10] [--batch-size 1000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+import numpy as np
+
+from api.main import app
+from api.services.inference_executor import model_executor
+from src.dataset_registry import get_dataset
+
+
+def _telco_records(n_records: int, seed: int = 42):
+    """Sample telco rows as API payloads (target column dropped)."""
+    info = get_dataset("telco_churn")
+    df = info.load_dataframe().drop(columns=[info.target])
+    sample = df.sample(n=n_records, replace=True, random_state=seed)
+    sample = sample.astype(object).where(sample.notna(), None)
+    return sample.to_dict(orient="records")
+
+
+def _percentile(values, q):
+    return float(np.percentile(values, q)) * 1000 if values else float("nan")
+
+
+async def _scenario(records, clients, requests_per_client, probe_interval):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
+        done = asyncio.Event()
+        loop_lag = []
+        statuses = []
+
+        async def worker():
+            for _ in range(requests_per_client):
+                response = await client.post("/predictions/telco_churn/batch", json={"records": records})
+                statuses.append(response.status_code)
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(probe_interval)
+                loop_lag.append(time.perf_counter() - start - probe_interval)
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    ok = statuses.count(200)
+    return {
+        "elapsed_s": elapsed,
+        "batches_per_s": ok / elapsed,
+        "rows_per_s": ok * len(records) / elapsed,
+        "rejected_503": statuses.count(503),
+        "lag_p50_ms": _percentile(loop_lag, 50),
+        "lag_p95_ms": _percentile(loop_lag, 95),
+        "lag_max_ms": max(loop_lag) * 1000 if loop_lag else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del executor de inferencia")
+    parser.add_argument("--clients", type=int, default=8, help="Clientes concurrentes")
+    parser.add_argument("--requests", type=int, default=10, help="Lotes por cliente")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Registros por lote")
+    parser.add_argument("--probe-interval", type=float, default=0.005, help="Intervalo del sondeo del event loop (s)")
+    args = parser.parse_args()
+
+    records = _telco_records(args.batch_size)
+    # Warm up the model and the compiled path
+    asyncio.run(_scenario(records[:10], 1, 1, args.probe_interval))
+
+    results = {}
+    for label, enabled in (("inline", False), ("executor", True)):
+        model_executor.enabled = enabled
+        results[label] = asyncio.run(
+            _scenario(records, args.clients, args.requests, args.probe_interval)
+        )
+
+    print("=" * 70)
+    print(f"🏋 {args.clients} clientes × {args.requests} lotes de {args.batch_size} registros")
+    print("=" * 70)
+    print(f"{'modo':<10}{'lotes/s':>10}{'filas/s':>12}{'503':>6}"
+          f"{'lag p50':>12}{'lag p95':>12}{'lag máx':>12}")
+    for label, r in results.items():
+        print(f"{label:<10}{r['batches_per_s']:>10.1f}{r['rows_per_s']:>12.0f}{r['rejected_503']:>6}"
+              f"{r['lag_p50_ms']:>10.1f}ms{r['lag_p95_ms']:>10.1f}ms{r['lag_max_ms']:>10.1f}ms")
+
+    # Saturation: a tiny queue must shed load with 503 instead of queueing
+    model_executor.max_queue, saved_queue = 0, model_executor.max_queue
+    burst = asyncio.run(_scenario(records, model_executor.max_workers * 4, 1, args.probe_interval))
+    model_executor.max_queue = saved_queue
+    print(f"\n🚦 Ráfaga con cola 0: {burst['rejected_503']} respuestas 503 de "
+          f"{model_executor.max_workers * 4} peticiones")
+    print(f"📈 Executor: {model_executor.stats()}")
+
+
+if __name__ == "__main__":
+    main()
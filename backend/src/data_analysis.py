@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import argparse
+import copy
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
 
+import numpy as np
 import pandas as pd
 
-from .dataset_registry import DatasetInfo, TaskType
+from .data_loading import CHUNK_ROWS, csv_partitions
+from .dataset_registry import DatasetInfo, TaskType, get_dataset
+from .sketches import DistinctSketch, HeavyHitters, Moments, QuantileSketch, hash_values
 
 REPORT_DIR = Path(__file__).resolve().parent.parent / "reports"
 REPORT_DIR.mkdir(exist_ok=True)
 
+QUANTILES = (0.25, 0.5, 0.75)
+# Rows fed to the sketches at a time in approximate mode
+SKETCH_BLOCK_ROWS = 500_000
+
 
 @dataclass
 class ColumnSummary:
@@ -89,14 +101,336 @@ def _summary_for_series(series: pd.Series) -> ColumnSummary:
     )
 
 
-def build_summary(df: pd.DataFrame, dataset_info: DatasetInfo) -> DatasetSummary:
+def _first_valid(series: pd.Series) -> Any:
+    """First non-missing value, scanning a growing prefix instead of the whole column."""
+    start, step = 0, 1024
+    while start < len(series):
+        valid = series.iloc[start:start + step].notna().to_numpy()
+        if valid.any():
+            return series.iloc[start + int(valid.argmax())]
+        start, step = start + step, step * 2
+    return None
+
+
+def _numeric_stats(block: pd.DataFrame) -> Dict[str, Dict[str, object]]:
+    """Statistics of every column of a numeric block, one reduction per statistic."""
+    mean, std = block.mean(), block.std(ddof=0)
+    minimum, maximum = block.min(), block.max()
+    quantiles = block.quantile(list(QUANTILES))
+    return {
+        column: {
+            "mean": float(mean[column]),
+            "std": float(std[column]),
+            "min": float(minimum[column]),
+            "max": float(maximum[column]),
+            "quantiles": {str(q): float(quantiles.at[q, column]) for q in QUANTILES},
+        }
+        for column in block.columns
+    }
+
+
+def _exact_summaries(df: pd.DataFrame) -> Dict[str, ColumnSummary]:
+    """
+    Same result as ``_summary_for_series`` on every column, vectorized.
+
+    Numeric columns are reduced together (counts, moments and the three
+    quantiles in one ``quantile`` call); categorical columns use one
+    ``value_counts`` for the distinct count, the missing count and the mode.
+    Boolean and nullable extension columns keep the per-series path.
+    """
+    numeric = [
+        column for column, dtype in df.dtypes.items()
+        if isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+    ]
+    stats = _numeric_stats(df[numeric]) if numeric else {}
+    valid_counts = df[numeric].count() if numeric else {}
+
+    summaries = {}
+    for column in df.columns:
+        series = df[column]
+        if column in stats:
+            n_valid = int(valid_counts[column])
+            column_stats = stats[column]
+        elif pd.api.types.is_numeric_dtype(series):
+            summaries[column] = _summary_for_series(series)
+            continue
+        else:
+            value_counts = series.value_counts(sort=False)
+            n_valid = int(value_counts.sum())
+            column_stats = {"unique": len(value_counts), "most_common": None}
+            if n_valid:
+                # idxmax keeps the first of tied values in order of appearance, like Counter
+                top_value = value_counts.idxmax()
+                column_stats["most_common"] = {"value": str(top_value), "count": int(value_counts[top_value])}
+        summaries[column] = ColumnSummary(
+            name=column,
+            dtype=str(series.dtype),
+            n_missing=len(series) - n_valid,
+            example=str(_first_valid(series)) if n_valid else None,
+            stats=column_stats,
+        )
+    return summaries
+
+
+class ColumnProfile:
+    """
+    Mergeable sketch-based profile of one column.
+
+    Counts, min, max, mean and std are exact; quantiles, the distinct count
+    and the most common value come from the sketches in ``sketches``.
+    """
+
+    def __init__(self, name: str, dtype: str, numeric: bool):
+        self.name = name
+        self.dtype = dtype
+        self.n_rows = 0
+        self.n_missing = 0
+        self.example: Any = None
+        self._reset_sketches(numeric)
+
+    def _reset_sketches(self, numeric: bool) -> None:
+        self.numeric = numeric
+        if numeric:
+            self.moments = Moments()
+            self.quantiles = QuantileSketch()
+        else:
+            self.distinct = DistinctSketch()
+            self.heavy_hitters = HeavyHitters()
+
+    @property
+    def n_valid(self) -> int:
+        return self.n_rows - self.n_missing
+
+    @classmethod
+    def for_series(cls, series: pd.Series) -> "ColumnProfile":
+        numeric = pd.api.types.is_numeric_dtype(series)
+        return cls(series.name, str(series.dtype), numeric)
+
+    def update(self, series: pd.Series) -> None:
+        self.n_rows += len(series)
+        if self.numeric:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = ~np.isnan(values)
+            n_valid = int(valid.sum())
+            if self.example is None and n_valid:
+                self.example = series.iloc[int(valid.argmax())]
+            self.moments.update(values[valid])
+            self.quantiles.update(values[valid])
+        else:
+            # Distinct values are hashed once per batch, not once per row
+            value_counts = series.value_counts(sort=False)
+            n_valid = int(value_counts.sum())
+            if self.example is None and n_valid:
+                self.example = _first_valid(series)
+            self.distinct.update(hash_values(value_counts.index.to_numpy()))
+            self.heavy_hitters.update(value_counts)
+        self.n_missing += len(series) - n_valid
+
+    def merge(self, other: "ColumnProfile") -> None:
+        """
+        Fold in the profile of rows that come after this profile's rows.
+
+        A chunk can parse a text column as float64 when all its values are
+        missing; such a side has no values and takes the other side's kind.
+
+        Raises:
+            ValueError: If both sides have values, one numeric and one text
+        """
+        if other.numeric != self.numeric:
+            if other.n_valid and self.n_valid:
+                raise ValueError(
+                    f"Column '{self.name}' has numbers in some rows and text in others; "
+                    "coerce it in the dataset loader"
+                )
+            if other.n_valid:
+                self._reset_sketches(other.numeric)
+            else:
+                other = copy.copy(other)
+                other._reset_sketches(self.numeric)
+        self.dtype = _common_dtype(self.dtype, other.dtype)
+        self.n_rows += other.n_rows
+        self.n_missing += other.n_missing
+        if self.example is None:
+            self.example = other.example
+        if self.numeric:
+            self.moments.merge(other.moments)
+            self.quantiles.merge(other.quantiles)
+        else:
+            self.distinct.merge(other.distinct)
+            self.heavy_hitters.merge(other.heavy_hitters)
+
+    def to_summary(self) -> ColumnSummary:
+        if self.numeric:
+            moments = self.moments
+            empty = moments.count == 0
+            stats: Dict[str, object] = {
+                "mean": float("nan") if empty else moments.mean,
+                "std": moments.std,
+                "min": float("nan") if empty else moments.min,
+                "max": float("nan") if empty else moments.max,
+                "quantiles": dict(zip((str(q) for q in QUANTILES), self.quantiles.quantiles(QUANTILES))),
+            }
+        else:
+            most_common = self.heavy_hitters.most_common()
+            stats = {
+                "unique": self.distinct.estimate(),
+                "most_common": None if most_common is None
+                else {"value": str(most_common[0]), "count": int(most_common[1])},
+            }
+        return ColumnSummary(
+            name=self.name,
+            dtype=self.dtype,
+            n_missing=self.n_missing,
+            example=None if self.example is None else str(self._cast(self.example)),
+            stats=stats,
+        )
+
+    def _cast(self, value: Any) -> Any:
+        """A value as it reads in the merged column (an int chunk may have merged into float64)."""
+        try:
+            dtype = np.dtype(self.dtype)
+        except TypeError:
+            return value
+        return dtype.type(value) if dtype.kind in "iuf" else value
+
+
+def _common_dtype(left: str, right: str) -> str:
+    """dtype pandas would give a column whose parts have these dtypes."""
+    if left == right:
+        return left
+    try:
+        dtypes = np.dtype(left), np.dtype(right)
+    except TypeError:
+        return "object"
+    if all(dtype.kind in "iuf" for dtype in dtypes):
+        return str(np.result_type(*dtypes))
+    return "object"
+
+
+def profile_frame(df: pd.DataFrame, block_rows: int = SKETCH_BLOCK_ROWS) -> Dict[str, ColumnProfile]:
+    """Sketch profiles of every column, fed ``block_rows`` rows at a time."""
+    profiles = {column: ColumnProfile.for_series(df[column]) for column in df.columns}
+    for start in range(0, len(df), block_rows):
+        block = df.iloc[start:start + block_rows]
+        for column, profile in profiles.items():
+            profile.update(block[column])
+    return profiles
+
+
+def merge_profiles(parts: Iterable[Dict[str, ColumnProfile]]) -> Dict[str, ColumnProfile]:
+    """
+    Merge the profiles of consecutive parts of a dataset, in row order.
+
+    The merge is associative: parts can be merged in any grouping (per chunk,
+    per partition, per worker) as long as their order is kept, which only
+    decides the example value. Counts, min and max come out exact and the
+    mean up to float rounding; quantiles and distinct counts keep the
+    sketches' error bounds.
+    """
+    profiles: Dict[str, ColumnProfile] = {}
+    for part in parts:
+        for column, profile in part.items():
+            if column in profiles:
+                profiles[column].merge(profile)
+            else:
+                profiles[column] = profile
+    return profiles
+
+
+def profile_chunks(chunks: Iterable[pd.DataFrame]) -> Dict[str, ColumnProfile]:
+    """
+    Sketch profiles of a stream of cleaned chunks, holding one chunk at a time.
+
+    Each chunk is profiled on its own and merged in order, so a column may
+    change dtype from chunk to chunk (int64 -> float64 when values go missing).
+    """
+    return merge_profiles(profile_frame(chunk, block_rows=max(len(chunk), 1)) for chunk in chunks)
+
+
+def _profile_partition(
+    dataset_info: DatasetInfo,
+    path: Path,
+    byte_range: Tuple[int, int],
+    chunksize: int,
+) -> Dict[str, ColumnProfile]:
+    return profile_chunks(dataset_info.iter_chunks(chunksize, path, byte_range))
+
+
+def _summary_from_profiles(profiles: Dict[str, ColumnProfile], dataset_info: DatasetInfo) -> DatasetSummary:
+    categorical, numerical = [], []
+    for profile in profiles.values():
+        (numerical if profile.numeric else categorical).append(profile.to_summary())
+    return DatasetSummary(
+        dataset=dataset_info.name,
+        description=dataset_info.description,
+        task=dataset_info.task,
+        target=dataset_info.target,
+        n_rows=next(iter(profiles.values())).n_rows if profiles else 0,
+        n_columns=len(profiles),
+        categorical_columns=categorical,
+        numerical_columns=numerical,
+    )
+
+
+def build_streaming_summary(
+    dataset_info: DatasetInfo,
+    path: Path | None = None,
+    chunksize: int = CHUNK_ROWS,
+    workers: int = 1,
+) -> DatasetSummary:
+    """
+    Profile a raw CSV without loading it, in constant memory per process.
+
+    The file is read ``chunksize`` rows at a time and cleaned with the
+    dataset's loader rules; statistics are those of ``approximate=True``.
+    With ``workers > 1`` the file is split into one byte range per worker,
+    each range is profiled in a process pool and the profiles are merged.
+
+    Args:
+        dataset_info: Registry entry whose loader rules clean the rows
+        path: CSV with the dataset's raw layout (default: the bundled file)
+        chunksize: Rows per chunk
+        workers: Processes profiling partitions of the file in parallel
+    """
+    path = path or dataset_info.path
+    if workers <= 1:
+        return _summary_from_profiles(profile_chunks(dataset_info.iter_chunks(chunksize, path)), dataset_info)
+
+    partitions = csv_partitions(path, workers)
+    with ProcessPoolExecutor(max_workers=min(workers, len(partitions))) as executor:
+        # map yields in partition order, so the merge keeps row order
+        parts = executor.map(
+            _profile_partition,
+            repeat(dataset_info),
+            repeat(path),
+            partitions,
+            repeat(chunksize),
+        )
+        profiles = merge_profiles(parts)
+    return _summary_from_profiles(profiles, dataset_info)
+
+
+def build_summary(df: pd.DataFrame, dataset_info: DatasetInfo, approximate: bool = False) -> DatasetSummary:
+    """
+    Profile a loaded dataset.
+
+    Args:
+        df: Cleaned dataframe
+        dataset_info: Registry entry of the dataset
+        approximate: Take quantiles, distinct counts and the most common value
+            from mergeable sketches (bounded memory per column) instead of
+            exact sorts and hash tables; counts, min, max, mean and std stay exact
+    """
+    if approximate:
+        summaries = {column: profile.to_summary() for column, profile in profile_frame(df).items()}
+    else:
+        summaries = _exact_summaries(df)
     categorical, numerical = [], []
     for column in df.columns:
-        summary = _summary_for_series(df[column])
         if pd.api.types.is_numeric_dtype(df[column]):
-            numerical.append(summary)
+            numerical.append(summaries[column])
         else:
-            categorical.append(summary)
+            categorical.append(summaries[column])
     return DatasetSummary(
         dataset=dataset_info.name,
         description=dataset_info.description,
@@ -117,7 +451,36 @@ def save_summary(summary: DatasetSummary, filename: str | None = None) -> Path:
     return path
 
 
-def summarize_dataset(dataset_info: DatasetInfo) -> Path:
-    df = dataset_info.load_dataframe()
-    summary = build_summary(df, dataset_info)
+def summarize_dataset(
+    dataset_info: DatasetInfo,
+    df: pd.DataFrame | None = None,
+    approximate: bool = False,
+    streaming: bool = False,
+) -> Path:
+    if streaming and df is None:
+        summary = build_streaming_summary(dataset_info)
+    else:
+        if df is None:
+            df = dataset_info.load_dataframe()
+        summary = build_summary(df, dataset_info, approximate=approximate)
     return save_summary(summary, filename=f"{dataset_info.path.stem}_summary.json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Perfil de un dataset en streaming (memoria constante)")
+    parser.add_argument("dataset", help="Clave del dataset cuyas reglas de limpieza se aplican")
+    parser.add_argument("--path", type=Path, default=None, help="CSV a perfilar (por defecto el del dataset)")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="Filas por bloque")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Procesos que perfilan particiones del archivo en paralelo")
+    parser.add_argument("--output", default=None, help="Nombre del JSON dentro de reports/")
+    args = parser.parse_args()
+
+    dataset_info = get_dataset(args.dataset)
+    summary = build_streaming_summary(dataset_info, path=args.path, chunksize=args.chunksize, workers=args.workers)
+    path = save_summary(summary, filename=args.output or f"{(args.path or dataset_info.path).stem}_summary.json")
+    print(f"Resumen guardado en {path} ({summary.n_rows:,} filas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import re
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
 import pandas as pd
 
+# Rows per chunk when a raw file is read incrementally
+CHUNK_ROWS = 100_000
+
 
 def _read_csv(path: Path) -> pd.DataFrame:
     return pd.read_csv(path)
@@ -44,8 +51,11 @@ def _drop_unnamed(df: pd.DataFrame) -> pd.DataFrame:
     return df.loc[:, mask]
 
 
-def load_avocado(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+# Cleaning steps work row by row, so the same function cleans a whole file
+# (load_*) or each chunk of it (read_chunks).
+
+
+def _clean_avocado(df: pd.DataFrame) -> pd.DataFrame:
     df = _drop_unnamed(df)
     df = _normalize_columns(df)
     if "date" in df.columns:
@@ -53,39 +63,63 @@ def load_avocado(path: Path) -> pd.DataFrame:
     return df.dropna(subset=["average_price"])
 
 
-def load_bitcoin_prices(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def load_avocado(path: Path) -> pd.DataFrame:
+    return _clean_avocado(_read_csv(path))
+
+
+def _clean_numeric_strings(series: pd.Series) -> pd.Series:
+    cleaned = (
+        series
+        .astype(str)
+        .str.replace(",", "", regex=False)
+        .str.replace("$", "", regex=False)
+    )
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+# Thousands separators and "-" placeholders are handled by the C parser, so
+# columns arrive numeric; only columns with other tokens (e.g. "$") still
+# need string cleaning.
+_BITCOIN_READ_OPTIONS: Dict[str, Any] = {"thousands": ",", "na_values": ["-"]}
+
+
+def _clean_bitcoin_prices(df: pd.DataFrame) -> pd.DataFrame:
     df = _drop_unnamed(df)
     df = _normalize_columns(df)
     if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        # Explicit format: inferred from a chunk starting in May it would be "%B"
+        df["date"] = pd.to_datetime(df["date"], format="%b %d, %Y", errors="coerce")
     numeric_cols = [col for col in df.columns if col != "date"]
     for col in numeric_cols:
-        df[col] = (
-            df[col]
-            .astype(str)
-            .str.replace(",", "", regex=False)
-            .str.replace("$", "", regex=False)
-        )
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df = df.dropna(subset=["close"])
+        if not pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_bool_dtype(df[col]):
+            df[col] = _clean_numeric_strings(df[col])
+    return df.dropna(subset=["close"])
+
+
+def load_bitcoin_prices(path: Path) -> pd.DataFrame:
+    df = _clean_bitcoin_prices(pd.read_csv(path, **_BITCOIN_READ_OPTIONS))
     return df.reset_index(drop=True)
 
 
-def load_bodyfat(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def _clean_bodyfat(df: pd.DataFrame) -> pd.DataFrame:
     df = _normalize_columns(df)
     return df.dropna(subset=["body_fat"])
 
 
-def load_car_prices(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def load_bodyfat(path: Path) -> pd.DataFrame:
+    return _clean_bodyfat(_read_csv(path))
+
+
+def _clean_car_prices(df: pd.DataFrame) -> pd.DataFrame:
     df = _normalize_columns(df)
     return df.dropna(subset=["selling_price"])
 
 
-def load_telco_churn(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def load_car_prices(path: Path) -> pd.DataFrame:
+    return _clean_car_prices(_read_csv(path))
+
+
+def _clean_telco_churn(df: pd.DataFrame) -> pd.DataFrame:
     df = _normalize_columns(df)
     df = df.drop(columns=["customerid"], errors="ignore")
     if "total_charges" in df.columns:
@@ -93,14 +127,20 @@ def load_telco_churn(path: Path) -> pd.DataFrame:
     return df.dropna(subset=["churn"])
 
 
-def load_wine_quality(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def load_telco_churn(path: Path) -> pd.DataFrame:
+    return _clean_telco_churn(_read_csv(path))
+
+
+def _clean_wine_quality(df: pd.DataFrame) -> pd.DataFrame:
     df = _normalize_columns(df)
     return df.dropna(subset=["quality"])
 
 
-def load_stroke_data(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def load_wine_quality(path: Path) -> pd.DataFrame:
+    return _clean_wine_quality(_read_csv(path))
+
+
+def _clean_stroke_data(df: pd.DataFrame) -> pd.DataFrame:
     df = _normalize_columns(df)
     df = df.drop(columns=["id"], errors="ignore")
     if "bmi" in df.columns:
@@ -108,8 +148,11 @@ def load_stroke_data(path: Path) -> pd.DataFrame:
     return df.dropna(subset=["stroke"])
 
 
-def load_hepatitis_c(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def load_stroke_data(path: Path) -> pd.DataFrame:
+    return _clean_stroke_data(_read_csv(path))
+
+
+def _clean_hepatitis_c(df: pd.DataFrame) -> pd.DataFrame:
     df = _drop_unnamed(df)
     df = _normalize_columns(df)
     if "category" in df.columns:
@@ -120,14 +163,116 @@ def load_hepatitis_c(path: Path) -> pd.DataFrame:
     return df.dropna(subset=["category"])
 
 
-def load_cirrhosis(path: Path) -> pd.DataFrame:
-    df = _read_csv(path)
+def load_hepatitis_c(path: Path) -> pd.DataFrame:
+    return _clean_hepatitis_c(_read_csv(path))
+
+
+def _clean_cirrhosis(df: pd.DataFrame) -> pd.DataFrame:
     df = _normalize_columns(df)
     df = df.drop(columns=["id"], errors="ignore")
     return df.dropna(subset=["status"])
 
 
+def load_cirrhosis(path: Path) -> pd.DataFrame:
+    return _clean_cirrhosis(_read_csv(path))
+
+
+Cleaner = Callable[[pd.DataFrame], pd.DataFrame]
+
+# read_csv options and cleaning step behind each loader
+_CHUNK_RULES: Dict[Callable[[Path], pd.DataFrame], Tuple[Dict[str, Any], Cleaner]] = {
+    load_avocado: ({}, _clean_avocado),
+    load_bitcoin_prices: (_BITCOIN_READ_OPTIONS, _clean_bitcoin_prices),
+    load_bodyfat: ({}, _clean_bodyfat),
+    load_car_prices: ({}, _clean_car_prices),
+    load_telco_churn: ({}, _clean_telco_churn),
+    load_wine_quality: ({}, _clean_wine_quality),
+    load_stroke_data: ({}, _clean_stroke_data),
+    load_hepatitis_c: ({}, _clean_hepatitis_c),
+    load_cirrhosis: ({}, _clean_cirrhosis),
+}
+
+
+class _ByteRange(io.RawIOBase):
+    """The header line of a CSV followed by the bytes ``[start, end)`` of its body."""
+
+    def __init__(self, path: Path, start: int, end: int):
+        self._handle = open(path, "rb")
+        self._pending = self._handle.readline()
+        self._handle.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._pending and self._remaining > 0:
+            self._pending = self._handle.read(min(len(buffer), self._remaining))
+            self._remaining = self._remaining - len(self._pending) if self._pending else 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        self._handle.close()
+        super().close()
+
+
+def csv_partitions(path: Path, n_partitions: int) -> List[Tuple[int, int]]:
+    """
+    Split the rows of a CSV into about ``n_partitions`` byte ranges of similar size.
+
+    Ranges start and end at line breaks, so the file must not have line
+    breaks inside quoted fields. Returns fewer ranges for small files.
+    """
+    size = Path(path).stat().st_size
+    with open(path, "rb") as handle:
+        handle.readline()
+        bounds = [handle.tell()]
+        body = size - bounds[0]
+        for part in range(1, n_partitions):
+            # Reading from the byte before the target lands on the next line start
+            handle.seek(bounds[0] + body * part // n_partitions - 1)
+            handle.readline()
+            if bounds[-1] < handle.tell() < size:
+                bounds.append(handle.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def read_chunks(
+    path: Path,
+    loader: Callable[[Path], pd.DataFrame] | None = None,
+    chunksize: int = CHUNK_ROWS,
+    byte_range: Tuple[int, int] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a raw CSV ``chunksize`` rows at a time, cleaned like ``loader(path)``.
+
+    Only one chunk is in memory at a time. The rows are the same as the
+    loader's, but a column's inferred dtype can differ between chunks (e.g.
+    int64 in one, float64 in a chunk with missing values). ``byte_range``
+    (from ``csv_partitions``) restricts the read to one partition's rows.
+    """
+    if loader is None:
+        read_options, clean = {}, None
+    else:
+        try:
+            read_options, clean = _CHUNK_RULES[loader]
+        except KeyError as exc:
+            raise ValueError(f"Loader {loader.__name__} cannot read in chunks") from exc
+    with contextlib.ExitStack() as stack:
+        source = path
+        if byte_range is not None:
+            source = stack.enter_context(io.BufferedReader(_ByteRange(path, *byte_range)))
+        reader = stack.enter_context(pd.read_csv(source, chunksize=chunksize, **read_options))
+        for chunk in reader:
+            yield clean(chunk) if clean is not None else chunk
+
+
 __all__ = [
+    "csv_partitions",
     "load_avocado",
     "load_bitcoin_prices",
     "load_bodyfat",
@@ -137,4 +282,5 @@ __all__ = [
     "load_stroke_data",
     "load_telco_churn",
     "load_wine_quality",
+    "read_chunks",
 ]
@@ -0,0 +1,134 @@
+"""Cache of cleaned datasets under ``data/processed``.
+
+Loaders re-parse the raw CSV and redo the column normalization and type
+coercions on every call. The cleaned frame is stored once per raw file and
+reused while it is fresh: an entry is keyed by the SHA-256 of the raw file,
+the loader's name and the source of the module that defines it, so editing
+either the CSV or the cleaning code rebuilds it transparently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict
+
+import pandas as pd
+
+PROCESSED_DIR = Path(__file__).resolve().parent.parent / "data" / "processed"
+
+# Set JARVIS_DATASET_CACHE=0 to always parse the raw CSV
+CACHE_ENABLED = os.getenv("JARVIS_DATASET_CACHE", "1") != "0"
+
+Loader = Callable[[Path], pd.DataFrame]
+
+_FORMAT_VERSION = 1
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def loader_fingerprint(loader: Loader) -> str:
+    """Identify a loader by its qualified name and the source of its module."""
+    name = f"{getattr(loader, '__module__', '')}.{getattr(loader, '__qualname__', repr(loader))}"
+    try:
+        source = inspect.getsource(inspect.getmodule(loader))
+    except (OSError, TypeError):
+        source = ""
+    return hashlib.sha256(f"{name}\n{source}".encode("utf-8")).hexdigest()
+
+
+def _paths(raw_path: Path, cache_dir: Path) -> tuple[Path, Path]:
+    return cache_dir / f"{raw_path.stem}.pkl", cache_dir / f"{raw_path.stem}.json"
+
+
+def _read_manifest(path: Path) -> Dict[str, object] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _raw_sha256(raw_path: Path, manifest: Dict[str, object] | None) -> str:
+    """Hash of the raw file, reusing the stored one while size and mtime match."""
+    stat = raw_path.stat()
+    if (
+        manifest is not None
+        and manifest.get("raw_size") == stat.st_size
+        and manifest.get("raw_mtime_ns") == stat.st_mtime_ns
+    ):
+        return str(manifest["raw_sha256"])
+    return _file_sha256(raw_path)
+
+
+def _atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    # Parallel training processes may rebuild the same entry at once
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    os.close(fd)
+    try:
+        write(Path(tmp_name))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_cached(raw_path: Path, loader: Loader, cache_dir: Path = PROCESSED_DIR) -> pd.DataFrame:
+    """Return ``loader(raw_path)``, served from the cache when it is fresh."""
+    data_path, manifest_path = _paths(raw_path, cache_dir)
+    manifest = _read_manifest(manifest_path)
+    key = {
+        "format": _FORMAT_VERSION,
+        "raw_sha256": _raw_sha256(raw_path, manifest),
+        "loader": loader_fingerprint(loader),
+        "pandas": pd.__version__,
+    }
+
+    if manifest is not None and all(manifest.get(name) == value for name, value in key.items()):
+        try:
+            return pd.read_pickle(data_path)
+        except Exception:
+            pass  # Missing or corrupt entry: rebuild below
+
+    df = loader(raw_path)
+    stat = raw_path.stat()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write(data_path, lambda tmp: pd.to_pickle(df, tmp))
+        new_manifest = {
+            **key,
+            "raw_file": raw_path.name,
+            "raw_size": stat.st_size,
+            "raw_mtime_ns": stat.st_mtime_ns,
+            "shape": list(df.shape),
+        }
+        _atomic_write(
+            manifest_path,
+            lambda tmp: tmp.write_text(json.dumps(new_manifest, indent=2), encoding="utf-8"),
+        )
+    except OSError as exc:
+        print(f"⚠ No se pudo guardar la caché de {raw_path.name}: {exc}")
+    return df
+
+
+def clear_cache(cache_dir: Path = PROCESSED_DIR) -> int:
+    """Delete every cached dataset and return how many entries were removed."""
+    removed = 0
+    if cache_dir.is_dir():
+        for path in cache_dir.glob("*.pkl"):
+            path.unlink()
+            path.with_suffix(".json").unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+__all__ = ["CACHE_ENABLED", "PROCESSED_DIR", "clear_cache", "load_cached", "loader_fingerprint"]
@@ -5,11 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 
 import pandas as pd
 
 from . import data_loading
+from .dataset_cache import CACHE_ENABLED, load_cached
+from .time_series_features import DEFAULT_FEATURES, TimeSeriesFeatureConfig
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "raw"
 
@@ -22,6 +24,16 @@ class TaskType(str, Enum):
     TIME_SERIES = "time_series"
 
 
+class EstimatorBackend(str, Enum):
+    """Family of estimators ``train_dataset`` fits for a dataset."""
+
+    # Task default: GradientBoosting (regression), LogisticRegression
+    # (classification), RandomForest (time series), on one-hot features
+    DEFAULT = "default"
+    # HistGradientBoosting on ordinal codes with native categorical splits
+    HIST_GRADIENT_BOOSTING = "hist_gradient_boosting"
+
+
 Loader = Callable[[Path], pd.DataFrame]
 
 
@@ -38,15 +50,27 @@ class DatasetInfo:
     time_column: str | None = None
     group_keys: List[str] | None = None
     loader: Loader | None = None
+    time_series_features: TimeSeriesFeatureConfig = DEFAULT_FEATURES
+    estimator: EstimatorBackend = EstimatorBackend.DEFAULT
 
     @property
     def path(self) -> Path:
         return DATA_DIR / self.filename
 
-    def load_dataframe(self) -> pd.DataFrame:
-        if self.loader is not None:
-            return self.loader(self.path)
-        return pd.read_csv(self.path)
+    def load_dataframe(self, use_cache: bool | None = None) -> pd.DataFrame:
+        loader = self.loader if self.loader is not None else pd.read_csv
+        if CACHE_ENABLED if use_cache is None else use_cache:
+            return load_cached(self.path, loader)
+        return loader(self.path)
+
+    def iter_chunks(
+        self,
+        chunksize: int = data_loading.CHUNK_ROWS,
+        path: Path | None = None,
+        byte_range: Tuple[int, int] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Cleaned rows of the raw CSV (or ``path``, same layout) a chunk at a time."""
+        return data_loading.read_chunks(path or self.path, self.loader, chunksize, byte_range)
 
 
 _DATASETS: Dict[str, DatasetInfo] = {
@@ -135,3 +159,7 @@ def get_dataset(key: str) -> DatasetInfo:
 
 def iter_datasets() -> Iterable[DatasetInfo]:
     return _DATASETS.values()
+
+
+def dataset_keys() -> List[str]:
+    return list(_DATASETS)
@@ -0,0 +1,739 @@
+"""Compile fitted sklearn pipelines into flat NumPy inference kernels.
+
+The persisted models are ``Pipeline(ColumnTransformer -> estimator)`` objects.
+For small requests sklearn's input validation and DataFrame column routing cost
+far more than the arithmetic, so this module extracts the fitted parameters
+(imputer fill values, scaler mean/scale, one-hot lookup tables, linear
+coefficients or flattened tree arrays) once and evaluates requests with plain
+array operations.
+
+Only the building blocks produced by :mod:`src.modeling` are supported;
+``compile_pipeline`` returns ``None`` for anything else so callers can keep
+using the original pipeline.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import shutil
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import (
+    ExtraTreesRegressor,
+    GradientBoostingRegressor,
+    RandomForestRegressor,
+)
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from .time_series_features import FEATURE_VERSION_ATTRIBUTE
+
+_NUMERIC_TYPES = (int, float)
+_UNSEEN_CATEGORY = "__unseen_category__"
+
+
+@dataclass
+class NumericBlock:
+    """Median/mean imputation followed by standard scaling."""
+
+    columns: List[str]
+    fill: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+    offset: int
+
+
+@dataclass
+class CategoricalBlock:
+    """Most-frequent imputation followed by one-hot encoding."""
+
+    columns: List[str]
+    # Imputed category per column; None when unknown (bundles written before it was stored)
+    fill: List[Any]
+    # Per column: category value -> absolute output index
+    lookup: List[Dict[Any, int]]
+    categories: List[List[Any]]
+    offset: int
+
+    @cached_property
+    def indexers(self) -> List[tuple[pd.Index, np.ndarray]]:
+        """Per column: hash index of the categories and their output indices."""
+        return [
+            (pd.Index(categories, dtype=object), np.array([table[c] for c in categories], dtype=np.intp))
+            for categories, table in zip(self.categories, self.lookup)
+        ]
+
+
+@dataclass
+class LinearClassifier:
+    """Logistic regression evaluated as ``X @ coef.T + intercept``."""
+
+    coef: np.ndarray
+    intercept: np.ndarray
+    classes: np.ndarray
+    multinomial: bool
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        scores = X @ self.coef.T + self.intercept
+        if scores.shape[1] == 1:
+            positive = 1.0 / (1.0 + np.exp(-scores[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        if self.multinomial:
+            scores = scores - scores.max(axis=1, keepdims=True)
+            exp = np.exp(scores)
+            return exp / exp.sum(axis=1, keepdims=True)
+        proba = 1.0 / (1.0 + np.exp(-scores))
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+
+@dataclass
+class TreeEnsemble:
+    """All trees of an ensemble flattened into shared node arrays.
+
+    Leaves point to themselves with an infinite threshold, so every row can be
+    pushed through every tree simultaneously for ``depth`` steps without
+    tracking which traversals already finished.
+    """
+
+    left: np.ndarray
+    right: np.ndarray
+    feature: np.ndarray
+    threshold: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    depth: int
+    # prediction = base + scale * aggregate(leaf values)
+    base: float
+    scale: float
+    average: bool
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        # sklearn trees compare float32 inputs against float64 thresholds
+        X = X.astype(np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.roots.size))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        leaves = self.value[nodes]
+        total = leaves.mean(axis=1) if self.average else leaves.sum(axis=1)
+        return self.base + self.scale * total
+
+
+@dataclass
+class CompiledPipeline:
+    """Flat representation of a fitted preprocessing + estimator pipeline."""
+
+    feature_names: List[str]
+    numeric: List[NumericBlock]
+    categorical: List[CategoricalBlock]
+    n_features_out: int
+    estimator: Any
+    # Time-series feature version the pipeline was trained with, if stamped
+    feature_version: Optional[int] = None
+    is_classifier: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.is_classifier = isinstance(self.estimator, LinearClassifier)
+
+    @property
+    def classes(self) -> Optional[np.ndarray]:
+        return self.estimator.classes if self.is_classifier else None
+
+    def encode(self, records: Sequence[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Transform records into the estimator input matrix.
+
+        Returns ``None`` when a record needs the full pipeline: a missing
+        column, or a value whose type the compiled tables cannot reproduce
+        exactly (the pipeline then produces the canonical result or error).
+        """
+        n_rows = len(records)
+        X = np.zeros((n_rows, self.n_features_out))
+
+        for block in self.numeric:
+            values = np.empty((n_rows, len(block.columns)))
+            for i, record in enumerate(records):
+                for j, column in enumerate(block.columns):
+                    value = record.get(column, _MISSING)
+                    if value is None:
+                        values[i, j] = math.nan
+                    elif type(value) in _NUMERIC_TYPES:
+                        values[i, j] = value
+                    else:
+                        return None
+            values = np.where(np.isnan(values), block.fill, values)
+            end = block.offset + len(block.columns)
+            X[:, block.offset:end] = (values - block.mean) / block.scale
+
+        for block in self.categorical:
+            for i, record in enumerate(records):
+                for j, column in enumerate(block.columns):
+                    value = record.get(column, _MISSING)
+                    if type(value) is not str:
+                        return None
+                    index = block.lookup[j].get(value)
+                    if index is not None:
+                        X[i, index] = 1.0
+
+        return X
+
+    def encode_frame(self, df: pd.DataFrame) -> Optional[np.ndarray]:
+        """Vectorized :meth:`encode` for a whole DataFrame.
+
+        Numeric columns must already have a numeric dtype and categorical
+        columns may only hold strings or missing values (imputed with the
+        fitted most-frequent value). Returns ``None`` otherwise, or if a
+        column is missing, so the caller can use the full pipeline.
+        """
+        if any(column not in df.columns for column in self.feature_names):
+            return None
+        X = np.zeros((len(df), self.n_features_out))
+
+        for block in self.numeric:
+            for column in block.columns:
+                dtype = df[column].dtype
+                if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+                    return None
+            values = df[block.columns].to_numpy(dtype=np.float64)
+            values = np.where(np.isnan(values), block.fill, values)
+            end = block.offset + len(block.columns)
+            X[:, block.offset:end] = (values - block.mean) / block.scale
+
+        for block in self.categorical:
+            for j, (column, (categories, targets)) in enumerate(zip(block.columns, block.indexers)):
+                series = df[column]
+                if pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+                    return None
+                values = series.to_numpy(dtype=object, copy=True)
+                missing = pd.isna(values)
+                if block.fill[j] is None and missing.any():
+                    return None
+                values[missing] = block.fill[j]
+                position = categories.get_indexer(values)
+                known = np.flatnonzero(position >= 0)
+                X[known, targets[position[known]]] = 1.0
+
+        return X
+
+    def numeric_slot(self, column: str) -> tuple[int, float, float, float]:
+        """Output index, fill value, mean and scale of a numeric input column.
+
+        Lets callers update one encoded value in place (``(value - mean) /
+        scale``, with ``fill`` for missing values) without re-encoding a record.
+        """
+        for block in self.numeric:
+            if column in block.columns:
+                j = block.columns.index(column)
+                return block.offset + j, float(block.fill[j]), float(block.mean[j]), float(block.scale[j])
+        raise KeyError(f"'{column}' is not a numeric input column")
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.estimator.predict(X)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        if not self.is_classifier:
+            raise AttributeError("Compiled regressor has no predict_proba")
+        return self.estimator.predict_proba(X)
+
+    def sample_records(self, n_records: int = 32, seed: int = 42) -> List[Dict[str, Any]]:
+        """Synthetic inputs around the fitted fill values, for parity checks."""
+        rng = np.random.default_rng(seed)
+        records = []
+        for i in range(n_records):
+            record: Dict[str, Any] = {}
+            for block in self.numeric:
+                noise = rng.normal(0.0, 1.0, len(block.columns)) * block.scale
+                for column, fill, delta in zip(block.columns, block.fill, noise):
+                    record[column] = float(fill + delta)
+            for block in self.categorical:
+                for column, categories in zip(block.columns, block.categories):
+                    usable = [c for c in categories if isinstance(c, str)]
+                    record[column] = usable[i % len(usable)] if usable else _UNSEEN_CATEGORY
+            records.append(record)
+        if records:
+            # Exercise imputation and unknown categories as well
+            for block in self.numeric:
+                records[0][block.columns[0]] = None
+            for block in self.categorical:
+                records[-1][block.columns[0]] = _UNSEEN_CATEGORY
+        return records
+
+
+class _Missing:
+    pass
+
+
+_MISSING = _Missing()
+
+
+def _compile_numeric(pipeline: Pipeline, columns: List[str], offset: int) -> Optional[NumericBlock]:
+    steps = [step for _, step in pipeline.steps]
+    if len(steps) != 2:
+        return None
+    imputer, scaler = steps
+    if not isinstance(imputer, SimpleImputer) or not isinstance(scaler, StandardScaler):
+        return None
+    if imputer.add_indicator or imputer.strategy not in ("median", "mean", "constant"):
+        return None
+    fill = np.asarray(imputer.statistics_, dtype=float)
+    # Columns whose statistic is NaN are dropped by the imputer
+    if fill.shape[0] != len(columns) or np.isnan(fill).any():
+        return None
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(len(columns))
+    scale = scaler.scale_ if scaler.with_std else np.ones(len(columns))
+    return NumericBlock(
+        columns=list(columns),
+        fill=fill,
+        mean=np.asarray(mean, dtype=float),
+        scale=np.asarray(scale, dtype=float),
+        offset=offset,
+    )
+
+
+def _compile_categorical(
+    pipeline: Pipeline, columns: List[str], offset: int
+) -> Optional[CategoricalBlock]:
+    steps = [step for _, step in pipeline.steps]
+    if len(steps) != 2:
+        return None
+    imputer, encoder = steps
+    if not isinstance(imputer, SimpleImputer) or not isinstance(encoder, OneHotEncoder):
+        return None
+    if imputer.add_indicator or imputer.strategy not in ("most_frequent", "constant"):
+        return None
+    if encoder.drop is not None or encoder.handle_unknown != "ignore":
+        return None
+    if getattr(encoder, "_infrequent_enabled", False):
+        return None
+    if len(encoder.categories_) != len(columns):
+        return None
+
+    lookup: List[Dict[Any, int]] = []
+    position = offset
+    for categories in encoder.categories_:
+        table = {}
+        for category in categories:
+            table[category] = position
+            position += 1
+        lookup.append(table)
+    return CategoricalBlock(
+        columns=list(columns),
+        fill=list(imputer.statistics_),
+        lookup=lookup,
+        categories=[list(categories) for categories in encoder.categories_],
+        offset=offset,
+    )
+
+
+def _flatten_trees(trees: Sequence[Any]) -> Dict[str, Any]:
+    left, right, feature, threshold, value, roots = [], [], [], [], [], []
+    offset, depth = 0, 0
+    for tree in trees:
+        structure = tree.tree_
+        if structure.n_outputs != 1:
+            raise ValueError("Multi-output trees are not supported")
+        n_nodes = structure.node_count
+        ids = np.arange(n_nodes) + offset
+        is_leaf = structure.children_left == -1
+        left.append(np.where(is_leaf, ids, structure.children_left + offset))
+        right.append(np.where(is_leaf, ids, structure.children_right + offset))
+        feature.append(np.where(is_leaf, 0, structure.feature))
+        threshold.append(np.where(is_leaf, np.inf, structure.threshold))
+        value.append(structure.value[:, 0, 0])
+        roots.append(offset)
+        depth = max(depth, structure.max_depth)
+        offset += n_nodes
+    return {
+        "left": np.concatenate(left).astype(np.intp),
+        "right": np.concatenate(right).astype(np.intp),
+        "feature": np.concatenate(feature).astype(np.intp),
+        "threshold": np.concatenate(threshold).astype(np.float64),
+        "value": np.concatenate(value).astype(np.float64),
+        "roots": np.asarray(roots, dtype=np.intp),
+        "depth": depth,
+    }
+
+
+def _compile_estimator(estimator: Any) -> Optional[Any]:
+    if isinstance(estimator, LogisticRegression):
+        multi_class = getattr(estimator, "multi_class", "auto")
+        ovr = multi_class == "ovr" or (
+            multi_class in ("auto", "deprecated") and estimator.solver == "liblinear"
+        )
+        return LinearClassifier(
+            coef=np.asarray(estimator.coef_, dtype=float),
+            intercept=np.asarray(estimator.intercept_, dtype=float),
+            classes=estimator.classes_,
+            multinomial=not ovr,
+        )
+
+    if isinstance(estimator, GradientBoostingRegressor):
+        init = estimator.init_
+        if init == "zero":
+            base = 0.0
+        elif hasattr(init, "constant_"):
+            base = float(np.ravel(init.constant_)[0])
+        else:
+            return None
+        return TreeEnsemble(
+            **_flatten_trees(estimator.estimators_[:, 0]),
+            base=base,
+            scale=float(estimator.learning_rate),
+            average=False,
+        )
+
+    if isinstance(estimator, (RandomForestRegressor, ExtraTreesRegressor)):
+        if estimator.n_outputs_ != 1:
+            return None
+        return TreeEnsemble(
+            **_flatten_trees(estimator.estimators_),
+            base=0.0,
+            scale=1.0,
+            average=True,
+        )
+
+    return None
+
+
+def compile_pipeline(pipeline: Any) -> Optional[CompiledPipeline]:
+    """Compile ``Pipeline(ColumnTransformer -> estimator)`` or return None."""
+    if not isinstance(pipeline, Pipeline) or len(pipeline.steps) != 2:
+        return None
+    preprocessor, estimator = (step for _, step in pipeline.steps)
+    if not isinstance(preprocessor, ColumnTransformer):
+        return None
+    feature_names = getattr(pipeline, "feature_names_in_", None)
+    if feature_names is None:
+        return None
+
+    numeric: List[NumericBlock] = []
+    categorical: List[CategoricalBlock] = []
+    offset = 0
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop":
+            continue
+        if not isinstance(transformer, Pipeline) or name not in ("num", "cat"):
+            return None
+        columns = list(columns)
+        if name == "num":
+            block = _compile_numeric(transformer, columns, offset)
+            if block is None:
+                return None
+            numeric.append(block)
+            offset += len(columns)
+        else:
+            block = _compile_categorical(transformer, columns, offset)
+            if block is None:
+                return None
+            categorical.append(block)
+            offset += sum(len(table) for table in block.lookup)
+
+    try:
+        compiled_estimator = _compile_estimator(estimator)
+    except (AttributeError, ValueError):
+        return None
+    if compiled_estimator is None:
+        return None
+    n_features_in = getattr(estimator, "n_features_in_", offset)
+    if n_features_in != offset:
+        return None
+
+    return CompiledPipeline(
+        feature_names=list(feature_names),
+        numeric=numeric,
+        categorical=categorical,
+        n_features_out=offset,
+        estimator=compiled_estimator,
+        feature_version=getattr(pipeline, FEATURE_VERSION_ATTRIBUTE, None),
+    )
+
+
+def check_parity(
+    compiled: CompiledPipeline,
+    pipeline: Pipeline,
+    records: Sequence[Dict[str, Any]] | None = None,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> bool:
+    """
+    Compare compiled and sklearn outputs on the same inputs.
+
+    Checks ``encode`` on the records and ``encode_frame`` on the same rows
+    with blank cells (NaN, as ``read_csv`` leaves them) in numeric and
+    categorical columns. ``encode_frame`` declining a frame is not a mismatch.
+    """
+    records = list(records) if records is not None else compiled.sample_records()
+    X = compiled.encode(records)
+    if X is None:
+        return False
+    frame = pd.DataFrame(records, columns=compiled.feature_names)
+    if not _outputs_match(compiled, pipeline, X, frame, rtol, atol):
+        return False
+
+    blank = frame.copy()
+    for block in compiled.numeric:
+        blank.iloc[1::3, blank.columns.get_loc(block.columns[-1])] = np.nan
+    for block in compiled.categorical:
+        for column in block.columns:
+            blank[column] = blank[column].astype(object)
+            blank.iloc[0::2, blank.columns.get_loc(column)] = np.nan
+    X = compiled.encode_frame(blank)
+    return X is None or _outputs_match(compiled, pipeline, X, blank, rtol, atol)
+
+
+def _outputs_match(
+    compiled: CompiledPipeline,
+    pipeline: Pipeline,
+    X: np.ndarray,
+    frame: pd.DataFrame,
+    rtol: float,
+    atol: float,
+) -> bool:
+    if compiled.is_classifier:
+        expected = pipeline.predict_proba(frame)
+        actual = compiled.predict_proba(X)
+        if not np.allclose(actual, expected, rtol=rtol, atol=atol):
+            return False
+        return bool(np.array_equal(compiled.predict(X), pipeline.predict(frame)))
+    return bool(np.allclose(compiled.predict(X), pipeline.predict(frame), rtol=rtol, atol=atol))
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped bundles
+#
+# A bundle is a directory next to the pickle (``x_model.pkl`` ->
+# ``x_model.mmap/``) holding every numeric array of a CompiledPipeline as an
+# ``.npy`` file plus a JSON manifest for column names and lookup tables. Worker
+# processes open the arrays with ``mmap_mode="r"``, so tree node tables and
+# coefficients live once in the page cache instead of once per worker. (A
+# joblib/pickle round-trip cannot do this: sklearn trees copy their node arrays
+# into private buffers when unpickled.)
+# ---------------------------------------------------------------------------
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_SUFFIX = ".mmap"
+_MANIFEST = "manifest.json"
+
+
+def bundle_path_for(pickle_path: Path) -> Path:
+    return pickle_path.with_suffix(BUNDLE_SUFFIX)
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _json_categories(block: CategoricalBlock) -> List[List[List[Any]]]:
+    # Only string categories can ever match a request value (see ``encode``)
+    return [
+        [[category, index] for category, index in table.items() if isinstance(category, str)]
+        for table in block.lookup
+    ]
+
+
+def save_bundle(compiled: CompiledPipeline, directory: Path, source: Path | None = None) -> Path:
+    """Write ``compiled`` as a memory-mappable bundle directory."""
+    directory = Path(directory)
+    staging = directory.with_name(directory.name + ".tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    arrays: Dict[str, np.ndarray] = {}
+    manifest: Dict[str, Any] = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "feature_names": compiled.feature_names,
+        "n_features_out": compiled.n_features_out,
+        "feature_version": compiled.feature_version,
+        "numeric": [],
+        "categorical": [],
+    }
+    if source is not None:
+        manifest["source"] = {"file": Path(source).name, "sha256": file_digest(Path(source))}
+
+    for i, block in enumerate(compiled.numeric):
+        manifest["numeric"].append({"columns": block.columns, "offset": block.offset})
+        arrays[f"numeric_{i}_fill"] = block.fill
+        arrays[f"numeric_{i}_mean"] = block.mean
+        arrays[f"numeric_{i}_scale"] = block.scale
+    for block in compiled.categorical:
+        manifest["categorical"].append({
+            "columns": block.columns,
+            "offset": block.offset,
+            "lookup": _json_categories(block),
+            # A non-string fill can never match the string lookup, so it is left unknown
+            "fill": [value if isinstance(value, str) else None for value in block.fill],
+        })
+
+    estimator = compiled.estimator
+    if isinstance(estimator, LinearClassifier):
+        classes = estimator.classes
+        manifest["estimator"] = {
+            "kind": "linear",
+            "multinomial": estimator.multinomial,
+            "classes": classes.tolist(),
+            "classes_dtype": "object" if classes.dtype.kind == "O" else classes.dtype.str,
+        }
+        arrays["coef"] = estimator.coef
+        arrays["intercept"] = estimator.intercept
+    else:
+        manifest["estimator"] = {
+            "kind": "trees",
+            "depth": estimator.depth,
+            "base": estimator.base,
+            "scale": estimator.scale,
+            "average": estimator.average,
+        }
+        for name in ("left", "right", "feature", "threshold", "value", "roots"):
+            arrays[name] = getattr(estimator, name)
+
+    for name, array in arrays.items():
+        np.save(staging / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+    with open(staging / _MANIFEST, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, ensure_ascii=False, indent=2)
+
+    if directory.exists():
+        shutil.rmtree(directory)
+    staging.rename(directory)
+    return directory
+
+
+def load_bundle(directory: Path, mmap_mode: str | None = "r") -> CompiledPipeline:
+    """Open a bundle written by :func:`save_bundle`."""
+    directory = Path(directory)
+    with open(directory / _MANIFEST, encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    if manifest.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format: {manifest.get('format_version')}")
+
+    def array(name: str) -> np.ndarray:
+        # asarray drops the np.memmap subclass but keeps the shared mapping
+        return np.asarray(np.load(directory / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False))
+
+    numeric = [
+        NumericBlock(
+            columns=spec["columns"],
+            fill=array(f"numeric_{i}_fill"),
+            mean=array(f"numeric_{i}_mean"),
+            scale=array(f"numeric_{i}_scale"),
+            offset=spec["offset"],
+        )
+        for i, spec in enumerate(manifest["numeric"])
+    ]
+    categorical = []
+    for spec in manifest["categorical"]:
+        lookup = [{category: index for category, index in pairs} for pairs in spec["lookup"]]
+        categorical.append(CategoricalBlock(
+            columns=spec["columns"],
+            fill=spec.get("fill") or [None] * len(spec["columns"]),
+            lookup=lookup,
+            categories=[list(table) for table in lookup],
+            offset=spec["offset"],
+        ))
+
+    spec = manifest["estimator"]
+    if spec["kind"] == "linear":
+        dtype = object if spec["classes_dtype"] == "object" else np.dtype(spec["classes_dtype"])
+        estimator: Any = LinearClassifier(
+            coef=array("coef"),
+            intercept=array("intercept"),
+            classes=np.array(spec["classes"], dtype=dtype),
+            multinomial=spec["multinomial"],
+        )
+    else:
+        estimator = TreeEnsemble(
+            left=array("left"),
+            right=array("right"),
+            feature=array("feature"),
+            threshold=array("threshold"),
+            value=array("value"),
+            roots=array("roots"),
+            depth=spec["depth"],
+            base=spec["base"],
+            scale=spec["scale"],
+            average=spec["average"],
+        )
+
+    return CompiledPipeline(
+        feature_names=manifest["feature_names"],
+        numeric=numeric,
+        categorical=categorical,
+        n_features_out=manifest["n_features_out"],
+        estimator=estimator,
+        feature_version=manifest.get("feature_version"),
+    )
+
+
+def bundle_matches(directory: Path, pickle_path: Path) -> bool:
+    """True if the bundle was built from the current contents of ``pickle_path``."""
+    try:
+        with open(Path(directory) / _MANIFEST, encoding="utf-8") as handle:
+            source = json.load(handle).get("source") or {}
+    except (OSError, ValueError):
+        return False
+    return source.get("sha256") == file_digest(pickle_path)
+
+
+def write_bundle(pipeline: Any, pickle_path: Path) -> Optional[Path]:
+    """Compile, verify and bundle the pipeline persisted at ``pickle_path``.
+
+    Returns the bundle directory, or None when the pipeline cannot be compiled
+    or the compiled form does not reproduce sklearn's predictions.
+    """
+    compiled = compile_pipeline(pipeline)
+    if compiled is None or not check_parity(compiled, pipeline):
+        return None
+    directory = save_bundle(compiled, bundle_path_for(pickle_path), source=pickle_path)
+    # The bundle drops what JSON and .npy cannot hold; verify what workers will load
+    if not check_parity(load_bundle(directory, mmap_mode=None), pipeline):
+        shutil.rmtree(directory)
+        return None
+    return directory
+
+
+def main() -> None:
+    """Build bundles for existing pickles: ``python -m src.model_compiler [paths]``."""
+    import argparse
+
+    from .modeling import REPORT_DIR
+
+    parser = argparse.ArgumentParser(description="Genera bundles mmap para modelos existentes")
+    parser.add_argument("paths", nargs="*", type=Path, help="Archivos *_model.pkl (por defecto todos)")
+    args = parser.parse_args()
+    for path in args.paths or sorted(REPORT_DIR.glob("*_model.pkl")):
+        bundle = write_bundle(pd.read_pickle(path), path)
+        print(f"{path.name}: {bundle if bundle else 'sin bundle (no compilable)'}")
+
+
+__all__ = [
+    "BUNDLE_SUFFIX",
+    "CompiledPipeline",
+    "bundle_matches",
+    "bundle_path_for",
+    "check_parity",
+    "compile_pipeline",
+    "load_bundle",
+    "save_bundle",
+    "write_bundle",
+]
+
+
+if __name__ == "__main__":
+    main()
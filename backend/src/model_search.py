@@ -0,0 +1,344 @@
+"""Hyperparameter search for the estimators trained by :mod:`src.modeling`.
+
+``search_estimator`` tunes the estimator of a ``Pipeline(preprocessor ->
+estimator)`` on the training split with cross-validation:
+
+    random   ``n_candidates`` settings sampled from the estimator's space,
+             each scored on every fold
+    halving  successive halving: all candidates are scored on a small share
+             of each training fold, the best ``1 / factor`` (plus the
+             defaults) move on to a ``factor`` times larger share, until one
+             round uses full folds
+
+The preprocessor is fit once per fold and its output is cached, so a
+candidate only fits the estimator. Fold fits run in parallel with joblib.
+The search stops dispatching work once ``time_budget`` seconds have passed
+and keeps the best candidate scored so far. The estimator's defaults are
+the first candidate of every round, so the result is never worse on the
+cross-validation of the furthest round reached than training without search.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.stats import loguniform, randint, uniform
+from sklearn.base import BaseEstimator, clone
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+    RandomForestRegressor,
+)
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import KFold, ParameterSampler, StratifiedKFold, TimeSeriesSplit
+
+from .dataset_registry import TaskType
+
+STRATEGIES = ("random", "halving")
+# Rows per fold in the first halving round never drop below this
+MIN_HALVING_ROWS = 100
+
+# Distributions sampled by ParameterSampler, per estimator class
+SEARCH_SPACES: Dict[type, Dict[str, Any]] = {
+    GradientBoostingRegressor: {
+        "n_estimators": randint(50, 400),
+        "learning_rate": loguniform(0.01, 0.3),
+        "max_depth": randint(2, 6),
+        "subsample": uniform(0.6, 0.4),
+        "min_samples_leaf": randint(1, 20),
+    },
+    LogisticRegression: {
+        "C": loguniform(1e-3, 1e2),
+        "class_weight": [None, "balanced"],
+    },
+    RandomForestRegressor: {
+        "n_estimators": randint(50, 300),
+        "max_depth": [None, 5, 10, 20],
+        "min_samples_leaf": randint(1, 10),
+        "max_features": [1.0, "sqrt", 0.5],
+    },
+}
+SEARCH_SPACES[HistGradientBoostingRegressor] = SEARCH_SPACES[HistGradientBoostingClassifier] = {
+    "learning_rate": loguniform(0.02, 0.3),
+    "max_iter": randint(100, 500),
+    "max_leaf_nodes": randint(15, 63),
+    "min_samples_leaf": randint(5, 50),
+    "l2_regularization": loguniform(1e-4, 1.0),
+}
+
+
+@dataclass
+class SearchConfig:
+    """How ``train_dataset`` searches hyperparameters."""
+
+    strategy: str = "random"
+    n_candidates: int = 20
+    cv: int = 3
+    # Parallel fold fits (joblib semantics: -1 = all cores)
+    n_jobs: int = -1
+    # Seconds after which no more candidates are dispatched; fits already
+    # running finish, and the baseline is always scored (None = no limit)
+    time_budget: float | None = None
+    # Halving: share of candidates kept, and growth of the rows per round
+    factor: int = 3
+    random_state: int = 42
+
+    def __post_init__(self):
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f"Unknown search strategy '{self.strategy}', expected one of {STRATEGIES}")
+        if self.cv < 2:
+            raise ValueError("Search needs at least 2 cross-validation folds")
+
+
+@dataclass
+class CandidateResult:
+    params: Dict[str, Any]
+    round: int
+    train_rows: int | None
+    scores: List[float]
+    fit_seconds: float
+    error: str | None = None
+
+    @property
+    def mean_score(self) -> float:
+        return float(np.mean(self.scores)) if self.scores and self.error is None else math.nan
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["params"] = {key: _to_builtin(value) for key, value in self.params.items()}
+        data["mean_score"] = self.mean_score
+        data["std_score"] = float(np.std(self.scores)) if self.scores and self.error is None else math.nan
+        return data
+
+
+@dataclass
+class SearchResult:
+    estimator: str
+    strategy: str
+    metric: str
+    greater_is_better: bool
+    best_params: Dict[str, Any]
+    best_score: float
+    seconds: float
+    time_budget: float | None
+    budget_exhausted: bool
+    candidates: List[CandidateResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "estimator": self.estimator,
+            "strategy": self.strategy,
+            "metric": self.metric,
+            "greater_is_better": self.greater_is_better,
+            "best_params": {key: _to_builtin(value) for key, value in self.best_params.items()},
+            "best_score": self.best_score,
+            "seconds": self.seconds,
+            "time_budget": self.time_budget,
+            "budget_exhausted": self.budget_exhausted,
+            "n_candidates": len({_params_key(candidate.params) for candidate in self.candidates}),
+            "candidates": [candidate.to_dict() for candidate in self.candidates],
+        }
+
+
+@dataclass
+class _Fold:
+    X_train: np.ndarray
+    y_train: np.ndarray
+    X_valid: np.ndarray
+    y_valid: np.ndarray
+    # Training rows in the order halving takes them (most recent first for time series)
+    order: np.ndarray
+
+
+def _to_builtin(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple:
+    return tuple(sorted((key, repr(_to_builtin(value))) for key, value in params.items()))
+
+
+def _splitter(task: TaskType, config: SearchConfig, y: pd.Series):
+    if task == TaskType.TIME_SERIES:
+        return TimeSeriesSplit(n_splits=config.cv)
+    if task == TaskType.CLASSIFICATION and y.value_counts().min() >= config.cv:
+        return StratifiedKFold(n_splits=config.cv, shuffle=True, random_state=config.random_state)
+    return KFold(n_splits=config.cv, shuffle=True, random_state=config.random_state)
+
+
+def _cache_folds(
+    preprocessor: BaseEstimator,
+    X: pd.DataFrame,
+    y: pd.Series,
+    task: TaskType,
+    config: SearchConfig,
+) -> List[_Fold]:
+    """Fit the preprocessor once per fold and keep both transformed sides."""
+    rng = np.random.default_rng(config.random_state)
+    folds = []
+    for train_index, valid_index in _splitter(task, config, y).split(X, y):
+        fitted = clone(preprocessor).fit(X.iloc[train_index], y.iloc[train_index])
+        if task == TaskType.TIME_SERIES:
+            order = np.arange(len(train_index))[::-1]
+        else:
+            order = rng.permutation(len(train_index))
+        folds.append(
+            _Fold(
+                X_train=np.asarray(fitted.transform(X.iloc[train_index])),
+                y_train=y.iloc[train_index].to_numpy(),
+                X_valid=np.asarray(fitted.transform(X.iloc[valid_index])),
+                y_valid=y.iloc[valid_index].to_numpy(),
+                order=order,
+            )
+        )
+    return folds
+
+
+def _fit_and_score(
+    estimator: BaseEstimator,
+    params: Dict[str, Any],
+    fold: _Fold,
+    train_rows: int | None,
+    evaluate: Callable[[pd.Series, np.ndarray], Dict[str, float]],
+    metric: str,
+) -> Tuple[float | None, float, str | None]:
+    start = time.perf_counter()
+    X_train, y_train = fold.X_train, fold.y_train
+    if train_rows is not None:
+        rows = np.sort(fold.order[:train_rows])
+        X_train, y_train = X_train[rows], y_train[rows]
+    try:
+        model = clone(estimator).set_params(**params)
+        model.fit(X_train, y_train)
+        score = evaluate(pd.Series(fold.y_valid), model.predict(fold.X_valid))[metric]
+    except Exception as exc:  # a bad candidate must not end the search
+        return None, time.perf_counter() - start, f"{type(exc).__name__}: {exc}"
+    return float(score), time.perf_counter() - start, None
+
+
+def search_estimator(
+    preprocessor: BaseEstimator,
+    estimator: BaseEstimator,
+    X: pd.DataFrame,
+    y: pd.Series,
+    task: TaskType,
+    evaluate: Callable[[pd.Series, np.ndarray], Dict[str, float]],
+    metric: str,
+    greater_is_better: bool,
+    config: SearchConfig,
+) -> SearchResult:
+    """
+    Cross-validate hyperparameters of ``estimator`` on ``X``/``y``.
+
+    Args:
+        preprocessor: Unfitted transformer placed before the estimator
+        estimator: Estimator whose parameters are searched (its current
+            parameters are the baseline candidate)
+        X: Training features
+        y: Training target
+        task: Decides the folds (time-ordered for time series, stratified
+            for classification)
+        evaluate: Metrics function used by ``train_dataset`` for the task
+        metric: Key of ``evaluate``'s output to optimize
+        greater_is_better: Whether ``metric`` is maximized
+        config: Strategy, candidates, folds, parallelism and budget
+
+    Returns:
+        SearchResult with the best parameters and every scored candidate
+    """
+    space = SEARCH_SPACES.get(type(estimator))
+    if space is None:
+        raise ValueError(f"No search space for {type(estimator).__name__}")
+    start = time.perf_counter()
+    deadline = start + config.time_budget if config.time_budget is not None else math.inf
+
+    folds = _cache_folds(preprocessor, X, y, task, config)
+    sampled = list(ParameterSampler(space, n_iter=max(config.n_candidates - 1, 0), random_state=config.random_state))
+    candidates: List[Dict[str, Any]] = [{}] + sampled
+
+    worker = clone(estimator)
+    n_jobs = effective_n_jobs(config.n_jobs)
+    if n_jobs > 1 and "n_jobs" in worker.get_params():
+        worker.set_params(n_jobs=1)  # parallelism comes from the folds
+
+    # Rows of each training fold per round; None is the whole fold
+    rows_per_round: List[int | None] = [None]
+    if config.strategy == "halving" and len(candidates) > 1:
+        min_rows = min(len(fold.order) for fold in folds)
+        n_rounds = 1 + int(math.log(len(candidates), config.factor))
+        rows_per_round = [
+            max(min_rows // config.factor ** (n_rounds - 1 - round_), min(min_rows, MIN_HALVING_ROWS))
+            for round_ in range(n_rounds - 1)
+        ] + [None]
+    n_rounds = len(rows_per_round)
+
+    results: List[CandidateResult] = []
+    budget_exhausted = False
+    sign = 1.0 if greater_is_better else -1.0
+    # Candidates per dispatch: enough fold fits to keep every worker busy
+    batch_size = max(1, n_jobs // len(folds))
+    with Parallel(n_jobs=config.n_jobs) as parallel:
+        for round_, train_rows in enumerate(rows_per_round):
+            round_results: List[CandidateResult] = []
+            for first in range(0, len(candidates), batch_size):
+                if time.perf_counter() >= deadline and (results or round_results):
+                    budget_exhausted = True
+                    break
+                batch = candidates[first:first + batch_size]
+                outputs = parallel(
+                    delayed(_fit_and_score)(worker, params, fold, train_rows, evaluate, metric)
+                    for params in batch
+                    for fold in folds
+                )
+                for position, params in enumerate(batch):
+                    fold_outputs = outputs[position * len(folds):(position + 1) * len(folds)]
+                    errors = [error for _, _, error in fold_outputs if error is not None]
+                    round_results.append(
+                        CandidateResult(
+                            params=params,
+                            round=round_,
+                            train_rows=train_rows,
+                            scores=[score for score, _, _ in fold_outputs if score is not None],
+                            fit_seconds=float(sum(seconds for _, seconds, _ in fold_outputs)),
+                            error=errors[0] if errors else None,
+                        )
+                    )
+            results += round_results
+            scored = [result for result in round_results if not math.isnan(result.mean_score)]
+            if budget_exhausted or round_ + 1 == n_rounds or not scored:
+                break
+            scored.sort(key=lambda result: sign * result.mean_score, reverse=True)
+            keep = max(1, math.ceil(len(scored) / config.factor))
+            candidates = [result.params for result in scored[:keep] if result.params]
+            # A subsampled round can rank the defaults low; keep them (first, so
+            # the budget cannot skip them) to compare against them on full folds
+            if any(not result.params for result in scored):
+                candidates.insert(0, {})
+
+    # Best of the furthest round reached: scores of earlier rounds used fewer rows
+    scored = [result for result in results if not math.isnan(result.mean_score)]
+    if scored:
+        last_round = max(result.round for result in scored)
+        best = max((result for result in scored if result.round == last_round), key=lambda r: sign * r.mean_score)
+        best_params, best_score = best.params, best.mean_score
+    else:
+        best_params, best_score = {}, math.nan
+    return SearchResult(
+        estimator=type(estimator).__name__,
+        strategy=config.strategy,
+        metric=metric,
+        greater_is_better=greater_is_better,
+        best_params=best_params,
+        best_score=best_score,
+        seconds=time.perf_counter() - start,
+        time_budget=config.time_budget,
+        budget_exhausted=budget_exhausted,
+        candidates=results,
+    )
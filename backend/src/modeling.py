@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
+from sklearn.base import BaseEstimator, clone
 from sklearn.compose import ColumnTransformer
-from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+    RandomForestRegressor,
+)
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import (
     accuracy_score,
@@ -21,14 +28,20 @@ from sklearn.metrics import (
 )
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
 from sklearn.impute import SimpleImputer
 
-from .dataset_registry import DatasetInfo, TaskType
+from .dataset_registry import DatasetInfo, EstimatorBackend, TaskType
+from .model_compiler import write_bundle
+from .model_search import SearchConfig, SearchResult, search_estimator
+from .time_series_features import FEATURE_VERSION, FEATURE_VERSION_ATTRIBUTE, add_time_series_features
 
 REPORT_DIR = Path(__file__).resolve().parent.parent / "reports"
 REPORT_DIR.mkdir(exist_ok=True)
 
+# HistGradientBoosting bins categories; codes must stay below its 255 bins
+HIST_MAX_CATEGORIES = 255
+
 
 @dataclass
 class ModelResult:
@@ -36,6 +49,7 @@ class ModelResult:
     task: TaskType
     metrics: Dict[str, float]
     model_path: Path | None = None
+    search_report_path: Path | None = None
 
     def to_dict(self) -> Dict[str, object]:
         data: Dict[str, object] = {
@@ -45,6 +59,8 @@ class ModelResult:
         }
         if self.model_path is not None:
             data["model_path"] = str(self.model_path)
+        if self.search_report_path is not None:
+            data["search_report_path"] = str(self.search_report_path)
         return data
 
 
@@ -86,6 +102,59 @@ def _regression_pipeline(X: pd.DataFrame) -> ColumnTransformer:
     return ColumnTransformer(transformers)
 
 
+def _histogram_pipeline(X: pd.DataFrame) -> Tuple[ColumnTransformer, List[bool]]:
+    """
+    Preprocessor for HistGradientBoosting and its categorical feature mask.
+
+    Numbers pass through with their missing values, which the estimator
+    routes natively. Categories become one ordinal code column each (unknown
+    and missing values -> NaN) instead of a dense one-hot block; past
+    ``HIST_MAX_CATEGORIES`` levels the rarest share one code.
+    """
+    numeric_features = X.select_dtypes(include=[np.number]).columns.tolist()
+    categorical_features = X.select_dtypes(exclude=[np.number]).columns.tolist()
+
+    transformers = []
+    if numeric_features:
+        transformers.append(("num", "passthrough", numeric_features))
+    if categorical_features:
+        encoder = OrdinalEncoder(
+            handle_unknown="use_encoded_value",
+            unknown_value=np.nan,
+            encoded_missing_value=np.nan,
+            max_categories=HIST_MAX_CATEGORIES,
+        )
+        transformers.append(("cat", encoder, categorical_features))
+    if not transformers:
+        raise ValueError("No features available for modelling")
+    categorical_mask = [False] * len(numeric_features) + [True] * len(categorical_features)
+    return ColumnTransformer(transformers), categorical_mask
+
+
+def _build_model(
+    X: pd.DataFrame, dataset_info: DatasetInfo, n_jobs: int = -1
+) -> Tuple[ColumnTransformer, BaseEstimator]:
+    """Preprocessor and unfitted estimator for the dataset's task and estimator backend.
+
+    ``n_jobs`` is passed to estimators that fit in parallel (RandomForest).
+    """
+    if dataset_info.estimator == EstimatorBackend.HIST_GRADIENT_BOOSTING:
+        preprocessor, categorical_mask = _histogram_pipeline(X)
+        if dataset_info.task == TaskType.CLASSIFICATION:
+            return preprocessor, HistGradientBoostingClassifier(
+                categorical_features=categorical_mask, random_state=42
+            )
+        return preprocessor, HistGradientBoostingRegressor(categorical_features=categorical_mask, random_state=42)
+
+    preprocessor = _regression_pipeline(X)
+    if dataset_info.task == TaskType.REGRESSION:
+        return preprocessor, GradientBoostingRegressor(random_state=42)
+    if dataset_info.task == TaskType.CLASSIFICATION:
+        return preprocessor, LogisticRegression(max_iter=500)
+    # Use RandomForestRegressor instead of GradientBoosting for better stability
+    return preprocessor, RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=n_jobs)
+
+
 def _evaluate_regression(y_true: pd.Series, y_pred: np.ndarray) -> Dict[str, float]:
     rmse = float(np.sqrt(mean_squared_error(y_true, y_pred)))
     mae = float(mean_absolute_error(y_true, y_pred))
@@ -121,6 +190,14 @@ def _evaluate_time_series(y_true: pd.Series, y_pred: np.ndarray) -> Dict[str, fl
     return {"rmse": rmse, "mae": mae, "mape": mape}
 
 
+# Function, metric and direction each task optimizes during a hyperparameter search
+_SEARCH_METRICS = {
+    TaskType.REGRESSION: (_evaluate_regression, "rmse", False),
+    TaskType.CLASSIFICATION: (_evaluate_classification, "f1", True),
+    TaskType.TIME_SERIES: (_evaluate_time_series, "rmse", False),
+}
+
+
 def _prepare_time_series_features(df: pd.DataFrame, dataset_info: DatasetInfo) -> Tuple[pd.DataFrame, pd.Series]:
     if dataset_info.time_column is None:
         raise ValueError("Time series dataset requires a time column")
@@ -134,14 +211,10 @@ def _prepare_time_series_features(df: pd.DataFrame, dataset_info: DatasetInfo) -
     sort_columns = group_keys + [dataset_info.time_column]
     df = df.sort_values(sort_columns)
 
-    grouped = df.groupby(group_keys, group_keys=False) if group_keys else [(None, df)]
-    for _, group_df in grouped:
-        idx = group_df.index
-        df.loc[idx, "lag_1"] = group_df[dataset_info.target].shift(1)
-        df.loc[idx, "lag_7"] = group_df[dataset_info.target].shift(7)
-        df.loc[idx, "rolling_mean_7"] = group_df[dataset_info.target].rolling(window=7, min_periods=1).mean()
+    config = dataset_info.time_series_features
+    df = add_time_series_features(df, dataset_info.target, group_keys, config)
 
-    df = df.dropna(subset=["lag_1", "lag_7"])
+    df = df.dropna(subset=config.lag_columns)
     feature_cols = [col for col in df.columns if col != dataset_info.target]
     if dataset_info.time_column in feature_cols:
         feature_cols.remove(dataset_info.time_column)
@@ -155,31 +228,104 @@ def _prepare_recommendation(df: pd.DataFrame, dataset_info: DatasetInfo) -> Tupl
     return df[["user_id", "movie_id"]], df[dataset_info.target]
 
 
-def train_dataset(dataset_info: DatasetInfo) -> ModelResult:
-    df = dataset_info.load_dataframe()
+def _tune_model(
+    model: BaseEstimator,
+    preprocessor: ColumnTransformer,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    dataset_info: DatasetInfo,
+    search: SearchConfig | None,
+) -> Tuple[BaseEstimator, SearchResult | None]:
+    """The model with the best parameters found on the training split (unchanged without search)."""
+    if search is None:
+        return model, None
+    evaluate, metric, greater_is_better = _SEARCH_METRICS[dataset_info.task]
+    result = search_estimator(
+        preprocessor, model, X_train, y_train, dataset_info.task, evaluate, metric, greater_is_better, search
+    )
+    return clone(model).set_params(**result.best_params), result
+
+
+def _save_search_report(
+    result: SearchResult | None,
+    metrics: Dict[str, float],
+    dataset_info: DatasetInfo,
+    report_dir: Path,
+) -> Path | None:
+    if result is None:
+        return None
+    path = report_dir / f"{dataset_info.path.stem}_search.json"
+    report = {"dataset": dataset_info.name, **result.to_dict(), "test_metrics": metrics}
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+    return path
+
+
+def _save_pipeline(
+    pipeline: Pipeline,
+    dataset_info: DatasetInfo,
+    write_mmap_bundle: bool,
+    report_dir: Path = REPORT_DIR,
+) -> Path:
+    path = report_dir / f"{dataset_info.path.stem}_model.pkl"
+    pd.to_pickle(pipeline, path)
+    if write_mmap_bundle:
+        # Memory-mappable copy shared by API workers; the pickle stays the fallback
+        write_bundle(pipeline, path)
+    return path
+
+
+def train_dataset(
+    dataset_info: DatasetInfo,
+    write_mmap_bundle: bool = True,
+    df: pd.DataFrame | None = None,
+    report_dir: Path | None = None,
+    search: SearchConfig | None = None,
+    n_jobs: int = -1,
+) -> ModelResult:
+    """
+    Train, evaluate on a held-out split and persist the dataset's model.
+
+    Args:
+        dataset_info: Registry entry of the dataset
+        write_mmap_bundle: Also write the memory-mappable inference bundle
+        df: Cleaned dataframe (loaded from the registry if omitted)
+        report_dir: Where the model and reports are written (default: reports/)
+        search: Cross-validate hyperparameters on the training split first;
+            the search report is written next to the model (recommendation
+            has no estimator to tune and ignores it)
+        n_jobs: Cores for estimators that fit in parallel (-1 = all); lower it
+            when several datasets train at once
+    """
+    report_dir = report_dir or REPORT_DIR
+    if df is None:
+        df = dataset_info.load_dataframe()
 
     if dataset_info.task == TaskType.REGRESSION:
         X, y = _split_xy(df, dataset_info)
-        preprocessor = _regression_pipeline(X)
-        model = GradientBoostingRegressor(random_state=42)
+        preprocessor, model = _build_model(X, dataset_info, n_jobs)
         X_train, X_test, y_train, y_test = train_test_split(
             X,
             y,
             test_size=0.2,
             random_state=42,
         )
+        model, search_result = _tune_model(model, preprocessor, X_train, y_train, dataset_info, search)
         pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
         pipeline.fit(X_train, y_train)
         y_pred = pipeline.predict(X_test)
         metrics = _evaluate_regression(y_test, y_pred)
-        path = REPORT_DIR / f"{dataset_info.path.stem}_model.pkl"
-        pd.to_pickle(pipeline, path)
-        return ModelResult(dataset=dataset_info.name, task=dataset_info.task, metrics=metrics, model_path=path)
+        path = _save_pipeline(pipeline, dataset_info, write_mmap_bundle, report_dir)
+        return ModelResult(
+            dataset=dataset_info.name,
+            task=dataset_info.task,
+            metrics=metrics,
+            model_path=path,
+            search_report_path=_save_search_report(search_result, metrics, dataset_info, report_dir),
+        )
 
     if dataset_info.task == TaskType.CLASSIFICATION:
         X, y = _split_xy(df, dataset_info)
-        preprocessor = _regression_pipeline(X)
-        model = LogisticRegression(max_iter=500)
+        preprocessor, model = _build_model(X, dataset_info, n_jobs)
         stratify = y if y.nunique() > 1 else None
         X_train, X_test, y_train, y_test = train_test_split(
             X,
@@ -188,29 +334,40 @@ def train_dataset(dataset_info: DatasetInfo) -> ModelResult:
             random_state=42,
             stratify=stratify,
         )
+        model, search_result = _tune_model(model, preprocessor, X_train, y_train, dataset_info, search)
         pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
         pipeline.fit(X_train, y_train)
         y_pred = pipeline.predict(X_test)
         metrics = _evaluate_classification(y_test, y_pred)
-        path = REPORT_DIR / f"{dataset_info.path.stem}_model.pkl"
-        pd.to_pickle(pipeline, path)
-        return ModelResult(dataset=dataset_info.name, task=dataset_info.task, metrics=metrics, model_path=path)
+        path = _save_pipeline(pipeline, dataset_info, write_mmap_bundle, report_dir)
+        return ModelResult(
+            dataset=dataset_info.name,
+            task=dataset_info.task,
+            metrics=metrics,
+            model_path=path,
+            search_report_path=_save_search_report(search_result, metrics, dataset_info, report_dir),
+        )
 
     if dataset_info.task == TaskType.TIME_SERIES:
         X, y = _prepare_time_series_features(df, dataset_info)
-        preprocessor = _regression_pipeline(X)
-        # Use RandomForestRegressor instead of GradientBoosting for better stability
-        model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
+        preprocessor, model = _build_model(X, dataset_info, n_jobs)
         split_index = int(len(X) * 0.8)
         X_train, X_test = X.iloc[:split_index], X.iloc[split_index:]
         y_train, y_test = y.iloc[:split_index], y.iloc[split_index:]
+        model, search_result = _tune_model(model, preprocessor, X_train, y_train, dataset_info, search)
         pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
         pipeline.fit(X_train, y_train)
         y_pred = pipeline.predict(X_test)
         metrics = _evaluate_time_series(y_test, y_pred)
-        path = REPORT_DIR / f"{dataset_info.path.stem}_model.pkl"
-        pd.to_pickle(pipeline, path)
-        return ModelResult(dataset=dataset_info.name, task=dataset_info.task, metrics=metrics, model_path=path)
+        setattr(pipeline, FEATURE_VERSION_ATTRIBUTE, FEATURE_VERSION)
+        path = _save_pipeline(pipeline, dataset_info, write_mmap_bundle, report_dir)
+        return ModelResult(
+            dataset=dataset_info.name,
+            task=dataset_info.task,
+            metrics=metrics,
+            model_path=path,
+            search_report_path=_save_search_report(search_result, metrics, dataset_info, report_dir),
+        )
 
     if dataset_info.task == TaskType.RECOMMENDATION:
         features, ratings = _prepare_recommendation(df, dataset_info)
@@ -237,7 +394,7 @@ def train_dataset(dataset_info: DatasetInfo) -> ModelResult:
             "user_means": user_means,
             "movie_means": movie_means,
         }
-        path = REPORT_DIR / f"{dataset_info.path.stem}_recommender.pkl"
+        path = report_dir / f"{dataset_info.path.stem}_recommender.pkl"
         pd.to_pickle(bias_model, path)
         return ModelResult(dataset=dataset_info.name, task=dataset_info.task, metrics=metrics, model_path=path)
 
@@ -3,26 +3,143 @@
 from __future__ import annotations
 
 import argparse
-from typing import Iterable
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterable, List
 
 from .dataset_registry import DatasetInfo, get_dataset, iter_datasets
 from .data_analysis import summarize_dataset
+from .model_search import STRATEGIES, SearchConfig
 from .modeling import save_model_result, train_dataset
 
 
-def _run_dataset(dataset: DatasetInfo) -> None:
-    summary_path = summarize_dataset(dataset)
-    result = train_dataset(dataset)
+@dataclass
+class DatasetRun:
+    dataset: str
+    seconds: float
+    peak_memory_mb: float | None
+    summary_path: Path | None = None
+    metrics_path: Path | None = None
+    search_report_path: Path | None = None
+    error: str | None = None
+
+
+def _peak_memory_mb() -> float | None:
+    """High-water mark of this process' resident memory, if the platform exposes it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _cores_per_job(jobs: int) -> int:
+    """Cores each of ``jobs`` concurrent dataset processes can use without oversubscribing."""
+    return max(1, (os.cpu_count() or 1) // jobs)
+
+
+def _run_dataset(dataset: DatasetInfo, search: SearchConfig | None = None, n_jobs: int = -1) -> DatasetRun:
+    start = time.perf_counter()
+    # Load and clean the CSV once; summary and training share the frame
+    df = dataset.load_dataframe()
+    summary_path = summarize_dataset(dataset, df=df)
+    result = train_dataset(dataset, df=df, search=search, n_jobs=n_jobs)
     metrics_path = save_model_result(result)
     print(f"Resumen guardado en {summary_path}")
     print(f"Métricas guardadas en {metrics_path}")
+    if result.search_report_path is not None:
+        print(f"Reporte de búsqueda guardado en {result.search_report_path}")
+    return DatasetRun(
+        dataset=dataset.name,
+        seconds=time.perf_counter() - start,
+        peak_memory_mb=_peak_memory_mb(),
+        summary_path=summary_path,
+        metrics_path=metrics_path,
+        search_report_path=result.search_report_path,
+    )
+
+
+def _run_dataset_job(dataset: DatasetInfo, search: SearchConfig | None = None, n_jobs: int = -1) -> DatasetRun:
+    print(f"Procesando: {dataset.name}", flush=True)
+    return _run_dataset(dataset, search, n_jobs)
+
+
+def _failed_run(dataset: DatasetInfo, start: float, exc: Exception) -> DatasetRun:
+    print(f"✗ Error procesando {dataset.name}: {exc}")
+    return DatasetRun(
+        dataset=dataset.name,
+        seconds=time.perf_counter() - start,
+        peak_memory_mb=None,
+        error=str(exc),
+    )
+
+
+def _run_parallel(datasets: List[DatasetInfo], jobs: int, search: SearchConfig | None = None) -> List[DatasetRun]:
+    # One fresh process per dataset, so each reported peak belongs to that dataset only.
+    # Each gets an equal share of the cores for its estimator and search
+    # workers instead of every process starting an all-core pool.
+    n_jobs = _cores_per_job(jobs)
+    if search is not None and search.n_jobs < 0:
+        search = replace(search, n_jobs=n_jobs)
+    runs: List[DatasetRun] = []
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as executor:
+        start_times = {}
+        futures = {}
+        for dataset in datasets:
+            future = executor.submit(_run_dataset_job, dataset, search, n_jobs)
+            futures[future] = dataset
+            start_times[future] = time.perf_counter()
+        for future in as_completed(futures):
+            dataset = futures[future]
+            try:
+                runs.append(future.result())
+            except Exception as exc:
+                runs.append(_failed_run(dataset, start_times[future], exc))
+    order = {dataset.name: position for position, dataset in enumerate(datasets)}
+    return sorted(runs, key=lambda dataset_run: order[dataset_run.dataset])
+
+
+def print_report(runs: List[DatasetRun], total_seconds: float, jobs: int) -> None:
+    print("=" * 80)
+    print(f"Reporte de ejecución ({jobs} proceso{'s' if jobs > 1 else ''}, {total_seconds:.1f} s en total)")
+    print("=" * 80)
+    memory_label = "Memoria pico (MB)" if jobs > 1 else "Memoria pico acumulada (MB)"
+    print(f"{'Dataset':<40}{'Tiempo (s)':>12}{memory_label:>30}")
+    for dataset_run in runs:
+        memory = f"{dataset_run.peak_memory_mb:.0f}" if dataset_run.peak_memory_mb is not None else "n/d"
+        status = f"  ✗ {dataset_run.error}" if dataset_run.error else ""
+        print(f"{dataset_run.dataset:<40}{dataset_run.seconds:>12.1f}{memory:>30}{status}")
 
 
-def run(datasets: Iterable[DatasetInfo]) -> None:
-    for dataset in datasets:
-        print("=" * 80)
-        print(f"Procesando: {dataset.name}")
-        _run_dataset(dataset)
+def run(datasets: Iterable[DatasetInfo], jobs: int = 1, search: SearchConfig | None = None) -> List[DatasetRun]:
+    datasets = list(datasets)
+    start = time.perf_counter()
+    if jobs > 1 and len(datasets) > 1:
+        runs = _run_parallel(datasets, min(jobs, len(datasets)), search)
+    else:
+        jobs = 1
+        runs = []
+        for dataset in datasets:
+            print("=" * 80)
+            print(f"Procesando: {dataset.name}")
+            dataset_start = time.perf_counter()
+            try:
+                runs.append(_run_dataset(dataset, search))
+            except Exception as exc:
+                # Same as --jobs: record the failure and go on with the next dataset
+                runs.append(_failed_run(dataset, dataset_start, exc))
+    print_report(runs, time.perf_counter() - start, jobs)
+    return runs
 
 
 def build_argument_parser() -> argparse.ArgumentParser:
@@ -33,17 +150,74 @@ def build_argument_parser() -> argparse.ArgumentParser:
         default=None,
         help="Clave del dataset a ejecutar. Si se omite se procesan todos.",
     )
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Número de datasets a entrenar en paralelo (un proceso por dataset).",
+    )
+    parser.add_argument(
+        "--search",
+        dest="search",
+        choices=STRATEGIES,
+        default=None,
+        help="Busca hiperparámetros con validación cruzada antes de entrenar (aleatoria o por halving).",
+    )
+    parser.add_argument(
+        "--search-candidates",
+        dest="search_candidates",
+        type=int,
+        default=20,
+        help="Combinaciones de hiperparámetros a evaluar (incluye la configuración por defecto).",
+    )
+    parser.add_argument(
+        "--search-cv",
+        dest="search_cv",
+        type=int,
+        default=3,
+        help="Folds de validación cruzada de la búsqueda.",
+    )
+    parser.add_argument(
+        "--search-jobs",
+        dest="search_jobs",
+        type=int,
+        default=None,
+        help="Procesos que ajustan folds en paralelo (-1 = todos los núcleos). Por defecto todos, "
+        "o los núcleos repartidos entre los procesos de --jobs.",
+    )
+    parser.add_argument(
+        "--search-budget",
+        dest="search_budget",
+        type=float,
+        default=None,
+        help="Segundos máximos de búsqueda por dataset; se queda con el mejor candidato evaluado.",
+    )
     return parser
 
 
 def main() -> None:
     parser = build_argument_parser()
     args = parser.parse_args()
+    if args.jobs > 1 and args.search_jobs is not None and args.search_jobs < 0:
+        parser.error("--search-jobs negativo con --jobs > 1 lanza todos los núcleos en cada proceso; "
+                     "indique un número positivo u omítalo para repartirlos")
+    search = None
+    if args.search:
+        search = SearchConfig(
+            strategy=args.search,
+            n_candidates=args.search_candidates,
+            cv=args.search_cv,
+            n_jobs=args.search_jobs if args.search_jobs is not None else -1,
+            time_budget=args.search_budget,
+        )
     if args.dataset:
         dataset = get_dataset(args.dataset)
-        run([dataset])
+        runs = run([dataset], jobs=args.jobs, search=search)
     else:
-        run(iter_datasets())
+        runs = run(iter_datasets(), jobs=args.jobs, search=search)
+    if any(dataset_run.error for dataset_run in runs):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+"""Vectorized lag/rolling/EWM feature generation for time-series datasets."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import pandas as pd
+
+ROLLING_STATS = ("mean", "std", "min", "max")
+
+# Bumped whenever a feature's definition changes. Models are stamped with it
+# (FEATURE_VERSION_ATTRIBUTE) and the API refuses to serve a model whose
+# inputs no longer match what the online feature store computes.
+#   1: rolling and EWM windows included the current target
+#   2: they end at the previous row, like the lags
+FEATURE_VERSION = 2
+FEATURE_VERSION_ATTRIBUTE = "time_series_feature_version_"
+
+
+@dataclass(frozen=True)
+class TimeSeriesFeatureConfig:
+    """Which features to derive from the target history of each series.
+
+    The defaults reproduce the original feature set: ``lag_1``, ``lag_7`` and
+    ``rolling_mean_7``. Rolling windows and EWMs end at the previous row, like
+    the lags, since the current target is what the model predicts; they start
+    producing values after ``min_periods`` past observations.
+    """
+
+    lags: Tuple[int, ...] = (1, 7)
+    rolling_windows: Tuple[int, ...] = (7,)
+    rolling_stats: Tuple[str, ...] = ("mean",)
+    ewm_spans: Tuple[int, ...] = ()
+    min_periods: int = 1
+
+    def __post_init__(self) -> None:
+        unknown = set(self.rolling_stats) - set(ROLLING_STATS)
+        if unknown:
+            raise ValueError(f"Unsupported rolling statistics: {sorted(unknown)}")
+        if any(lag < 1 for lag in self.lags):
+            raise ValueError("Lags must be positive")
+
+    @property
+    def lag_columns(self) -> List[str]:
+        return [f"lag_{lag}" for lag in self.lags]
+
+    @property
+    def feature_names(self) -> List[str]:
+        names = self.lag_columns
+        names += [f"rolling_{stat}_{window}" for window in self.rolling_windows for stat in self.rolling_stats]
+        names += [f"ewm_mean_{span}" for span in self.ewm_spans]
+        return names
+
+    @property
+    def history_length(self) -> int:
+        """Past observations needed to compute every feature of the next step."""
+        return max([*self.lags, *self.rolling_windows, 1])
+
+
+DEFAULT_FEATURES = TimeSeriesFeatureConfig()
+
+
+def _drop_group_levels(result: pd.Series, n_keys: int) -> pd.Series:
+    # groupby().rolling()/ewm() prepend the group keys to the original index
+    return result.droplevel(list(range(n_keys))) if n_keys else result
+
+
+def add_time_series_features(
+    df: pd.DataFrame,
+    target: str,
+    group_keys: Sequence[str] | None = None,
+    config: TimeSeriesFeatureConfig = DEFAULT_FEATURES,
+) -> pd.DataFrame:
+    """Append history features of ``target`` to a frame sorted by group and time.
+
+    Every feature is computed with one grouped operation over the whole
+    frame, so the cost does not grow with the number of series. Rows whose
+    group keys are missing get NaN features, as with ``groupby``'s defaults.
+    """
+    group_keys = list(group_keys or [])
+    # Compute on a positional index so results align even if df's index repeats
+    frame = df.reset_index(drop=True)
+    if group_keys:
+        series = frame.groupby(group_keys, sort=False)[target]
+        past = series.shift(1).groupby([frame[key] for key in group_keys], sort=False)
+    else:
+        series = frame[target]
+        past = series.shift(1)
+
+    features = {}
+    for lag, column in zip(config.lags, config.lag_columns):
+        features[column] = series.shift(lag)
+    for window in config.rolling_windows:
+        rolling = past.rolling(window=window, min_periods=config.min_periods)
+        for stat in config.rolling_stats:
+            result = getattr(rolling, stat)()
+            features[f"rolling_{stat}_{window}"] = _drop_group_levels(result, len(group_keys))
+    for span in config.ewm_spans:
+        result = past.ewm(span=span, min_periods=config.min_periods).mean()
+        features[f"ewm_mean_{span}"] = _drop_group_levels(result, len(group_keys))
+
+    df = df.copy()
+    for column, values in features.items():
+        df[column] = values.reindex(frame.index).to_numpy(dtype="float64")
+    return df
+
+
+__all__ = [
+    "DEFAULT_FEATURES",
+    "FEATURE_VERSION",
+    "FEATURE_VERSION_ATTRIBUTE",
+    "ROLLING_STATS",
+    "TimeSeriesFeatureConfig",
+    "add_time_series_features",
+]
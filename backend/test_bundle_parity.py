@@ -0,0 +1,100 @@
+"""
+Verifica score_frame con los bundles mapeados en memoria contra pipeline.predict
+"""
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from api.services.model_service import ModelService
+from src.dataset_registry import TaskType
+from src.model_compiler import bundle_path_for
+from src.modeling import _prepare_time_series_features, _split_xy
+
+N_ROWS = 300
+SEED = 42
+
+
+def blank_rows(entry, info):
+    """Real rows with blanks in numeric columns, categorical columns and both at once."""
+    df = info.load_dataframe()
+    if info.task == TaskType.TIME_SERIES:
+        X, _ = _prepare_time_series_features(df, info)
+    else:
+        X, _ = _split_xy(df, info)
+    frame = X[entry.feature_names].sample(n=min(N_ROWS, len(X)), random_state=SEED).reset_index(drop=True)
+    for block in entry.compiled.numeric:
+        for j, column in enumerate(block.columns):
+            frame.loc[frame.index[j % 3::3], column] = np.nan
+    for block in entry.compiled.categorical:
+        for j, column in enumerate(block.columns):
+            frame[column] = frame[column].astype(object)
+            frame.loc[frame.index[(j + 1) % 3::3], column] = np.nan
+    return frame
+
+
+def compare(service, key):
+    entry = service._get_entry(key)
+    info = service._dataset_info[key]
+    if entry.compiled is None or not bundle_path_for(entry.path).is_dir():
+        return None, "sin bundle"
+    with open(entry.path, "rb") as f:
+        pipeline = pickle.load(f)
+
+    frame = blank_rows(entry, info)
+    compiled_path = entry.compiled.encode_frame(frame) is not None
+    scored = service.score_frame(key, frame)
+    problems = []
+    errors = scored["error"].notna().sum()
+    if errors:
+        problems.append(f"{errors} filas con error: {scored['error'].dropna().iloc[0]}")
+    expected = pipeline.predict(frame)
+    actual = scored["prediction"].to_numpy()
+    if info.task == TaskType.CLASSIFICATION:
+        differ = int((actual != expected).sum())
+        if differ:
+            problems.append(f"{differ} predicciones distintas")
+        confidence = pipeline.predict_proba(frame).max(axis=1)
+        if not np.allclose(scored["confidence"].to_numpy(dtype=float), confidence, rtol=1e-6, atol=1e-9):
+            problems.append("confianzas distintas")
+    elif not np.allclose(actual.astype(float), expected, rtol=1e-6, atol=1e-9):
+        worst = np.max(np.abs(actual.astype(float) - expected))
+        problems.append(f"predicciones distintas (máx. diferencia {worst:.6g})")
+    return problems, "compilado" if compiled_path else "sklearn"
+
+
+def main():
+    print("=" * 60)
+    print(f"🧮 BUNDLES MMAP vs PIPELINE ({N_ROWS} filas con celdas vacías)")
+    print("=" * 60)
+    service = ModelService(lazy=True, prediction_cache_size=0)
+    failures = checked = 0
+    for key in sorted(service._model_paths):
+        problems, path = compare(service, key)
+        if problems is None:
+            print(f"⏭️  {key:<32} {path}")
+            continue
+        checked += 1
+        status = "✅" if not problems else "❌"
+        print(f"{status} {key:<32} {path}")
+        for problem in problems:
+            print(f"      - {problem}")
+        failures += bool(problems)
+
+    print("=" * 60)
+    if not checked:
+        print("❌ No hay bundles; ejecuta python -m src.model_compiler")
+        sys.exit(1)
+    if failures:
+        print(f"❌ {failures} de {checked} modelos no coinciden")
+        sys.exit(1)
+    print(f"✅ {checked} modelos coinciden con sklearn con valores faltantes")
+
+
+if __name__ == "__main__":
+    main()
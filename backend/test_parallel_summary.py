@@ -0,0 +1,105 @@
+"""
+Verifica el perfilado en paralelo contra el perfilado exacto en una pasada
+"""
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from src.data_analysis import build_summary, build_streaming_summary, merge_profiles, profile_chunks
+from src.data_loading import csv_partitions
+from src.dataset_registry import iter_datasets
+
+WORKERS = 4
+MAX_RANK_ERROR = 0.02
+MAX_DISTINCT_ERROR = 0.02
+
+
+def rank_error(values, q, estimate):
+    low = np.searchsorted(values, estimate, side="left") / len(values)
+    high = np.searchsorted(values, estimate, side="right") / len(values)
+    return max(low - q, q - high, 0.0)
+
+
+def compare(info):
+    df = info.load_dataframe()
+    exact = build_summary(df, info).to_dict()
+    parallel = build_streaming_summary(info, chunksize=500, workers=WORKERS).to_dict()
+    problems = []
+
+    if (exact["n_rows"], exact["n_columns"]) != (parallel["n_rows"], parallel["n_columns"]):
+        problems.append(f"filas/columnas {exact['n_rows']}x{exact['n_columns']} vs "
+                        f"{parallel['n_rows']}x{parallel['n_columns']}")
+    worst_rank = worst_distinct = 0.0
+    for kind in ("categorical_columns", "numerical_columns"):
+        for a, b in zip(exact[kind], parallel[kind]):
+            name = a["name"]
+            for field in ("name", "dtype", "n_missing", "example"):
+                if a[field] != b[field]:
+                    problems.append(f"{name}.{field}: {a[field]} vs {b[field]}")
+            if kind == "numerical_columns":
+                for stat in ("min", "max"):
+                    if not (a["stats"][stat] == b["stats"][stat]
+                            or (math.isnan(a["stats"][stat]) and math.isnan(b["stats"][stat]))):
+                        problems.append(f"{name}.{stat}: {a['stats'][stat]} vs {b['stats'][stat]}")
+                if not math.isclose(a["stats"]["mean"], b["stats"]["mean"], rel_tol=1e-9, abs_tol=1e-9) \
+                        and not math.isnan(a["stats"]["mean"]):
+                    problems.append(f"{name}.mean: {a['stats']['mean']} vs {b['stats']['mean']}")
+                values = np.sort(df[name].dropna().to_numpy(dtype=float))
+                for q, estimate in b["stats"]["quantiles"].items():
+                    if len(values):
+                        worst_rank = max(worst_rank, rank_error(values, float(q), estimate))
+            else:
+                unique = a["stats"]["unique"]
+                if unique:
+                    worst_distinct = max(worst_distinct, abs(b["stats"]["unique"] - unique) / unique)
+    if worst_rank > MAX_RANK_ERROR:
+        problems.append(f"error de rango {worst_rank:.2%}")
+    if worst_distinct > MAX_DISTINCT_ERROR:
+        problems.append(f"error en únicos {worst_distinct:.2%}")
+    return problems, worst_rank, worst_distinct
+
+
+def check_grouping(info):
+    """Merging partitions left to right or in pairs gives the same counts."""
+    partitions = [profile_chunks(info.iter_chunks(500, byte_range=r)) for r in csv_partitions(info.path, 8)]
+    flat = merge_profiles(partitions)
+    partitions = [profile_chunks(info.iter_chunks(500, byte_range=r)) for r in csv_partitions(info.path, 8)]
+    pairs = [merge_profiles(partitions[i:i + 2]) for i in range(0, len(partitions), 2)]
+    grouped = merge_profiles(pairs)
+    return all(
+        (flat[c].n_rows, flat[c].n_missing, flat[c].example) == (grouped[c].n_rows, grouped[c].n_missing,
+                                                                   grouped[c].example)
+        for c in flat
+    )
+
+
+def main():
+    print("=" * 60)
+    print(f"🔀 PERFILADO EN PARALELO ({WORKERS} procesos) vs UNA PASADA")
+    print("=" * 60)
+    failures = 0
+    for info in iter_datasets():
+        problems, worst_rank, worst_distinct = compare(info)
+        if not check_grouping(info):
+            problems.append("la agrupación del merge cambia los conteos")
+        status = "✅" if not problems else "❌"
+        print(f"{status} {info.path.stem:<32} rango ±{worst_rank:.2%}  únicos ±{worst_distinct:.2%}")
+        for problem in problems:
+            print(f"      - {problem}")
+        failures += bool(problems)
+
+    print("=" * 60)
+    if failures:
+        print(f"❌ {failures} datasets no coinciden")
+        sys.exit(1)
+    print("✅ Conteos, mínimos, máximos y medias exactos; cuantiles y únicos dentro del error")
+
+
+if __name__ == "__main__":
+    main()
@@ -110,10 +110,59 @@ def test_prediction_wine_quality():
     print()
 
 
+def test_batch_prediction_telco_churn():
+    """Probar predicción por lotes de Churn Telco."""
+    print("=" * 60)
+    print("TEST 5: Predicción por Lotes de Churn Telco")
+    print("=" * 60)
+    
+    customer = {
+        "gender": "Female",
+        "senior_citizen": 0,
+        "partner": "Yes",
+        "dependents": "No",
+        "tenure": 12,
+        "phone_service": "Yes",
+        "multiple_lines": "No",
+        "internet_service": "Fiber optic",
+        "online_security": "No",
+        "online_backup": "No",
+        "device_protection": "No",
+        "tech_support": "No",
+        "streaming_tv": "No",
+        "streaming_movies": "No",
+        "contract": "Month-to-month",
+        "paperless_billing": "Yes",
+        "payment_method": "Electronic check",
+        "monthly_charges": 70.5,
+        "total_charges": 846.0
+    }
+    
+    # El último registro está incompleto: debe fallar sin tumbar el lote
+    records = [dict(customer, tenure=tenure) for tenure in (1, 12, 48)]
+    records.append({"gender": "Male"})
+    
+    response = requests.post(
+        f"{BASE_URL}/predictions/telco_churn/batch",
+        json={"records": records}
+    )
+    
+    print(f"Status: {response.status_code}")
+    result = response.json()
+    print(f"Registros: {result['n_records']}  Errores: {result['n_errors']}")
+    for item in result["results"]:
+        print(f"  [{item['index']}] {item['prediction']} ({item['confidence']}) {item['error'] or ''}")
+    assert response.status_code == 200
+    assert result["n_records"] == len(records)
+    assert result["n_errors"] == 1
+    assert result["results"][-1]["error"] is not None
+    print()
+
+
 def test_voice_command():
     """Probar reconocimiento de comando de voz."""
     print("=" * 60)
-    print("TEST 5: Análisis de Comando de Voz")
+    print("TEST 6: Análisis de Comando de Voz")
     print("=" * 60)
     
     commands = [
@@ -143,6 +192,7 @@ if __name__ == "__main__":
         test_list_datasets()
         test_prediction_telco_churn()
         test_prediction_wine_quality()
+        test_batch_prediction_telco_churn()
         test_voice_command()
         
         print("=" * 60)